@@ -0,0 +1,97 @@
+"""Store wire amounts as integer minor units of their currency
+
+Revision ID: a9c3e5f7b1d4
+Revises: f4b2c8d1e6a3
+Create Date: 2026-10-19 09:00:00.000000
+
+wires.amount and wires_archive.amount (NUMERIC(15,2)) become amount_minor
+(BIGINT) scaled by each currency's ISO 4217 exponent, e.g. 1050 for 10.50 USD,
+10 for 10 JPY and 10500 for 10.500 BHD; wire_summaries.total_amount becomes
+total_minor the same way. The exponents are frozen below rather than imported
+from app.utils.money, so this revision keeps its meaning if that map grows.
+
+The upgrade refuses to run (before changing anything) if a stored amount has
+more decimal places than its currency allows, e.g. 10.50 JPY; fix or convert
+those rows first. Each backfill rewrites the whole table: run it in a
+maintenance window on large tables.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a9c3e5f7b1d4"
+down_revision = "f4b2c8d1e6a3"
+branch_labels = None
+depends_on = None
+
+# Currencies whose minor unit is not a hundredth, as of this revision
+EXPONENTS = {
+    "BIF": 0, "CLP": 0, "DJF": 0, "GNF": 0, "ISK": 0, "JPY": 0, "KMF": 0, "KRW": 0, "PYG": 0,
+    "RWF": 0, "UGX": 0, "UYI": 0, "VND": 0, "VUV": 0, "XAF": 0, "XOF": 0, "XPF": 0,
+    "BHD": 3, "IQD": 3, "JOD": 3, "KWD": 3, "LYD": 3, "OMR": 3, "TND": 3,
+}  # fmt: skip
+SCALE = (
+    "CASE currency "
+    + " ".join(f"WHEN '{code}' THEN {10**exponent}" for code, exponent in EXPONENTS.items())
+    + " ELSE 100 END"
+)
+# (table, old column, new column, old numeric type)
+AMOUNT_COLUMNS = [
+    ("wires", "amount", "amount_minor", sa.Numeric(precision=15, scale=2)),
+    ("wires_archive", "amount", "amount_minor", sa.Numeric(precision=15, scale=2)),
+    ("wire_summaries", "total_amount", "total_minor", sa.Numeric(precision=20, scale=2)),
+]
+
+
+def _check(columns: list[tuple[str, str]], condition: str, message: str) -> None:
+    """Abort the migration if any row of ``columns`` matches ``condition``."""
+    bind = op.get_bind()
+    for table, column in columns:
+        count = bind.execute(
+            sa.text(f"SELECT count(*) FROM {table} WHERE " + condition.format(column=column))
+        ).scalar()
+        if count:
+            raise RuntimeError(f"{count} rows in {table}.{column} {message}")
+
+
+def upgrade() -> None:
+    # round(x, 6) rather than x: SQLite keeps NUMERIC as floating point
+    _check(
+        [(table, old) for table, old, _, _ in AMOUNT_COLUMNS],
+        f"round({{column}} * {SCALE}, 6) <> round({{column}} * {SCALE})",
+        "have more decimal places than their currency allows",
+    )
+
+    for table, old, new, _ in AMOUNT_COLUMNS:
+        op.add_column(table, sa.Column(new, sa.BigInteger(), nullable=True))
+        op.execute(f"UPDATE {table} SET {new} = CAST(round({old} * {SCALE}) AS BIGINT)")
+
+    op.drop_index("ix_wires_created_by_amount", table_name="wires")
+    for table, old, new, _ in AMOUNT_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(new, existing_type=sa.BigInteger(), nullable=False)
+            batch_op.drop_column(old)
+    op.create_index("ix_wires_created_by_amount_minor", "wires", ["created_by", "amount_minor"])
+
+
+def downgrade() -> None:
+    # Three-decimal currencies only fit NUMERIC(_, 2) in whole hundredths
+    _check(
+        [(table, new) for table, _, new, _ in AMOUNT_COLUMNS],
+        f"{SCALE} = 1000 AND {{column}} % 10 <> 0",
+        "cannot be stored with two decimal places",
+    )
+
+    for table, old, new, numeric in AMOUNT_COLUMNS:
+        op.add_column(table, sa.Column(old, numeric, nullable=True))
+        # * 1.0 keeps SQLite from integer division
+        op.execute(f"UPDATE {table} SET {old} = {new} * 1.0 / {SCALE}")
+
+    op.drop_index("ix_wires_created_by_amount_minor", table_name="wires")
+    for table, old, new, numeric in AMOUNT_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(old, existing_type=numeric, nullable=False)
+            batch_op.drop_column(new)
+    op.create_index("ix_wires_created_by_amount", "wires", ["created_by", "amount"])
@@ -0,0 +1,33 @@
+"""Add a partial index on wires.updated_at for PROCESSING wires
+
+Revision ID: b2d4f6a8c0e1
+Revises: a9c3e5f7b1d4
+Create Date: 2026-10-19 11:00:00.000000
+
+Backs the stuck-wire sweeper. Only PROCESSING rows are indexed, so the index
+stays small and untouched by inserts of new PENDING wires.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b2d4f6a8c0e1"
+down_revision = "a9c3e5f7b1d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_wires_processing_updated_at",
+        "wires",
+        ["updated_at"],
+        postgresql_where=sa.text("status = 'PROCESSING'"),
+        sqlite_where=sa.text("status = 'PROCESSING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_wires_processing_updated_at", table_name="wires")
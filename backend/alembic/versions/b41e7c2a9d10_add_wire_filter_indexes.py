@@ -0,0 +1,90 @@
+"""Add wire filter indexes and name search
+
+Revision ID: b41e7c2a9d10
+Revises: 9668182126fe
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b41e7c2a9d10"
+down_revision = "9668182126fe"
+branch_labels = None
+depends_on = None
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS wires_fts USING fts5("
+    "sender_name, recipient_name, content='wires', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS wires_fts_ai AFTER INSERT ON wires BEGIN "
+    "INSERT INTO wires_fts(rowid, sender_name, recipient_name) "
+    "VALUES (new.id, new.sender_name, new.recipient_name); END",
+    "CREATE TRIGGER IF NOT EXISTS wires_fts_ad AFTER DELETE ON wires BEGIN "
+    "INSERT INTO wires_fts(wires_fts, rowid, sender_name, recipient_name) "
+    "VALUES ('delete', old.id, old.sender_name, old.recipient_name); END",
+    "CREATE TRIGGER IF NOT EXISTS wires_fts_au AFTER UPDATE OF sender_name, recipient_name "
+    "ON wires BEGIN "
+    "INSERT INTO wires_fts(wires_fts, rowid, sender_name, recipient_name) "
+    "VALUES ('delete', old.id, old.sender_name, old.recipient_name); "
+    "INSERT INTO wires_fts(rowid, sender_name, recipient_name) "
+    "VALUES (new.id, new.sender_name, new.recipient_name); END",
+    "INSERT INTO wires_fts(wires_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    op.create_index("ix_wires_created_by_created_at", "wires", ["created_by", "created_at"])
+    op.create_index(
+        "ix_wires_created_by_status_created_at", "wires", ["created_by", "status", "created_at"]
+    )
+    op.create_index(
+        "ix_wires_created_by_currency_created_at", "wires", ["created_by", "currency", "created_at"]
+    )
+    op.create_index("ix_wires_created_by_amount", "wires", ["created_by", "amount"])
+
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_wires_reference_number_pattern",
+            "wires",
+            ["reference_number"],
+            postgresql_ops={"reference_number": "varchar_pattern_ops"},
+        )
+        op.create_index(
+            "ix_wires_sender_name_trgm",
+            "wires",
+            ["sender_name"],
+            postgresql_using="gin",
+            postgresql_ops={"sender_name": "gin_trgm_ops"},
+        )
+        op.create_index(
+            "ix_wires_recipient_name_trgm",
+            "wires",
+            ["recipient_name"],
+            postgresql_using="gin",
+            postgresql_ops={"recipient_name": "gin_trgm_ops"},
+        )
+    elif dialect == "sqlite":
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.drop_index("ix_wires_recipient_name_trgm", table_name="wires")
+        op.drop_index("ix_wires_sender_name_trgm", table_name="wires")
+        op.drop_index("ix_wires_reference_number_pattern", table_name="wires")
+    elif dialect == "sqlite":
+        for trigger in ("wires_fts_au", "wires_fts_ad", "wires_fts_ai"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS wires_fts")
+
+    op.drop_index("ix_wires_created_by_amount", table_name="wires")
+    op.drop_index("ix_wires_created_by_currency_created_at", table_name="wires")
+    op.drop_index("ix_wires_created_by_status_created_at", table_name="wires")
+    op.drop_index("ix_wires_created_by_created_at", table_name="wires")
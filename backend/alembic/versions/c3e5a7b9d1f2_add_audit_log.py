@@ -0,0 +1,59 @@
+"""Add the append-only audit_log table
+
+Revision ID: c3e5a7b9d1f2
+Revises: b2d4f6a8c0e1
+Create Date: 2026-10-19 12:00:00.000000
+
+On Postgres a trigger rejects UPDATE and DELETE, so rows can only be added.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3e5a7b9d1f2"
+down_revision = "b2d4f6a8c0e1"
+branch_labels = None
+depends_on = None
+
+APPEND_ONLY_FUNCTION = """
+CREATE FUNCTION audit_log_append_only() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'audit_log is append-only';
+END;
+$$ LANGUAGE plpgsql
+"""
+
+APPEND_ONLY_TRIGGER = """
+CREATE TRIGGER audit_log_append_only
+BEFORE UPDATE OR DELETE ON audit_log
+FOR EACH STATEMENT EXECUTE FUNCTION audit_log_append_only()
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_log",
+        sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("action", sa.String(length=50), nullable=False),
+        sa.Column("actor_id", sa.Integer(), nullable=True),
+        sa.Column("entity_type", sa.String(length=50), nullable=True),
+        sa.Column("entity_id", sa.Integer(), nullable=True),
+        sa.Column("details", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_audit_log_actor_id_id", "audit_log", ["actor_id", "id"])
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(APPEND_ONLY_FUNCTION)
+        op.execute(APPEND_ONLY_TRIGGER)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER audit_log_append_only ON audit_log")
+        op.execute("DROP FUNCTION audit_log_append_only()")
+    op.drop_index("ix_audit_log_actor_id_id", table_name="audit_log")
+    op.drop_table("audit_log")
@@ -0,0 +1,50 @@
+"""Add wire_summaries rollup table
+
+Revision ID: c7d2e9f4a1b3
+Revises: b41e7c2a9d10
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c7d2e9f4a1b3"
+down_revision = "b41e7c2a9d10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "wire_summaries",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "PENDING", "PROCESSING", "COMPLETED", "FAILED", name="wirestatus", create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("wire_count", sa.Integer(), nullable=False),
+        sa.Column("total_amount", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "status", "currency"),
+    )
+    # Backfill from the existing wires
+    op.execute(
+        "INSERT INTO wire_summaries (user_id, status, currency, wire_count, total_amount) "
+        "SELECT created_by, status, currency, count(*), sum(amount) "
+        "FROM wires GROUP BY created_by, status, currency"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("wire_summaries")
@@ -0,0 +1,172 @@
+"""Partition wires by created_at month and add wires_archive
+
+Revision ID: d5a8b3c6e2f7
+Revises: c7d2e9f4a1b3
+Create Date: 2026-10-18 11:00:00.000000
+
+On Postgres the existing heap is swapped for a table range-partitioned by
+created_at month (plus a DEFAULT partition) and its rows are copied across.
+Partitioned tables can only enforce uniqueness on keys that include the
+partition column, so the primary key becomes (id, created_at) and the
+reference_number unique index becomes (reference_number, created_at);
+create_wire still checks reference numbers before inserting them.
+
+The copy holds an exclusive lock on wires for its duration; run it in a
+maintenance window on large tables.
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d5a8b3c6e2f7"
+down_revision = "c7d2e9f4a1b3"
+branch_labels = None
+depends_on = None
+
+WIRE_COLUMNS = (
+    "id, sender_name, recipient_name, amount, currency, status, reference_number, "
+    "created_by, created_at, updated_at"
+)
+
+# Indexes recreated on the partitioned parent (cascade to every partition)
+PARTITIONED_INDEXES = [
+    "CREATE INDEX ix_wires_id ON wires (id)",
+    "CREATE UNIQUE INDEX ix_wires_reference_number ON wires (reference_number, created_at)",
+    "CREATE INDEX ix_wires_created_by_created_at ON wires (created_by, created_at)",
+    "CREATE INDEX ix_wires_created_by_status_created_at ON wires (created_by, status, created_at)",
+    "CREATE INDEX ix_wires_created_by_currency_created_at "
+    "ON wires (created_by, currency, created_at)",
+    "CREATE INDEX ix_wires_created_by_amount ON wires (created_by, amount)",
+    "CREATE INDEX ix_wires_reference_number_pattern "
+    "ON wires (reference_number varchar_pattern_ops)",
+    "CREATE INDEX ix_wires_sender_name_trgm ON wires USING gin (sender_name gin_trgm_ops)",
+    "CREATE INDEX ix_wires_recipient_name_trgm ON wires USING gin (recipient_name gin_trgm_ops)",
+    "CREATE INDEX ix_wires_terminal_created_at ON wires (created_at) "
+    "WHERE status IN ('COMPLETED', 'FAILED')",
+]
+
+# One partition per month from the oldest wire through three months ahead
+CREATE_MONTHLY_PARTITIONS = """
+DO $$
+DECLARE
+    m timestamp;
+BEGIN
+    FOR m IN
+        SELECT generate_series(
+            date_trunc('month', coalesce((SELECT min(created_at) FROM wires_unpartitioned), now())
+                AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months',
+            interval '1 month'
+        )
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF wires FOR VALUES FROM (%L) TO (%L)',
+            'wires_y' || to_char(m, 'YYYY') || 'm' || to_char(m, 'MM'),
+            m AT TIME ZONE 'UTC',
+            (m + interval '1 month') AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+END $$
+"""
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    op.create_table(
+        "wires_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("sender_name", sa.String(length=200), nullable=False),
+        sa.Column("recipient_name", sa.String(length=200), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "PENDING", "PROCESSING", "COMPLETED", "FAILED", name="wirestatus", create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("reference_number", sa.String(length=50), nullable=True),
+        sa.Column("created_by", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["created_by"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_wires_archive_created_by_id", "wires_archive", ["created_by", "id"])
+    op.create_index(
+        op.f("ix_wires_archive_reference_number"), "wires_archive", ["reference_number"]
+    )
+
+    if dialect != "postgresql":
+        op.create_index(
+            "ix_wires_terminal_created_at",
+            "wires",
+            ["created_at"],
+            sqlite_where=sa.text("status IN ('COMPLETED', 'FAILED')"),
+        )
+        return
+
+    op.execute("ALTER TABLE wires RENAME TO wires_unpartitioned")
+    op.execute(
+        "CREATE TABLE wires (LIKE wires_unpartitioned INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute(CREATE_MONTHLY_PARTITIONS)
+    op.execute("CREATE TABLE wires_default PARTITION OF wires DEFAULT")
+
+    op.execute(f"INSERT INTO wires ({WIRE_COLUMNS}) SELECT {WIRE_COLUMNS} FROM wires_unpartitioned")
+    op.execute("ALTER SEQUENCE wires_id_seq OWNED BY wires.id")
+    op.execute("DROP TABLE wires_unpartitioned")
+
+    # Constraints and indexes go on after the copy (and once the old names are free)
+    op.execute("ALTER TABLE wires ADD CONSTRAINT wires_pkey PRIMARY KEY (id, created_at)")
+    op.execute(
+        "ALTER TABLE wires ADD CONSTRAINT wires_created_by_fkey "
+        "FOREIGN KEY (created_by) REFERENCES users (id)"
+    )
+    for statement in PARTITIONED_INDEXES:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        # Rebuild a plain heap and bring archived wires back into it
+        op.execute("ALTER TABLE wires RENAME TO wires_partitioned")
+        op.execute("CREATE TABLE wires (LIKE wires_partitioned INCLUDING DEFAULTS)")
+        op.execute(
+            f"INSERT INTO wires ({WIRE_COLUMNS}) SELECT {WIRE_COLUMNS} FROM wires_partitioned"
+        )
+        op.execute(f"INSERT INTO wires ({WIRE_COLUMNS}) SELECT {WIRE_COLUMNS} FROM wires_archive")
+        op.execute("ALTER SEQUENCE wires_id_seq OWNED BY wires.id")
+        op.execute("DROP TABLE wires_partitioned CASCADE")
+
+        op.execute("ALTER TABLE wires ADD CONSTRAINT wires_pkey PRIMARY KEY (id)")
+        op.execute(
+            "ALTER TABLE wires ADD CONSTRAINT wires_created_by_fkey "
+            "FOREIGN KEY (created_by) REFERENCES users (id)"
+        )
+        # Everything except the terminal-status index, which this revision introduced
+        for statement in PARTITIONED_INDEXES[:-1]:
+            op.execute(statement.replace("(reference_number, created_at)", "(reference_number)"))
+    else:
+        op.drop_index("ix_wires_terminal_created_at", table_name="wires")
+
+    op.drop_index(op.f("ix_wires_archive_reference_number"), table_name="wires_archive")
+    op.drop_index("ix_wires_archive_created_by_id", table_name="wires_archive")
+    op.drop_table("wires_archive")
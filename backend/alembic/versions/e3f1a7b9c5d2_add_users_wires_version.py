@@ -0,0 +1,27 @@
+"""Add users.wires_version for list ETags
+
+Revision ID: e3f1a7b9c5d2
+Revises: d5a8b3c6e2f7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e3f1a7b9c5d2"
+down_revision = "d5a8b3c6e2f7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users", sa.Column("wires_version", sa.BigInteger(), server_default="0", nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "wires_version")
@@ -0,0 +1,30 @@
+"""Add version column to wires and wires_archive for optimistic concurrency
+
+Revision ID: f4b2c8d1e6a3
+Revises: e3f1a7b9c5d2
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f4b2c8d1e6a3"
+down_revision = "e3f1a7b9c5d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Constant server default: a metadata-only change on Postgres, no table rewrite
+    op.add_column("wires", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+    op.add_column(
+        "wires_archive", sa.Column("version", sa.Integer(), server_default="1", nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("wires_archive", "version")
+    op.drop_column("wires", "version")
@@ -1,5 +1,7 @@
 """Application configuration."""
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -18,10 +20,39 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Argon2 password hashing cost; memory in KiB. Defaults match argon2-cffi's,
+    # `python -m benchmarks.argon2_calibration` suggests values for this host.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+
     # Application
     APP_NAME: str = "Wire Management API"
     DEBUG: bool = True
     ENVIRONMENT: str = "development"
+    LOG_LEVEL: str = "INFO"
+
+    # Start-up warm-up (pool connections, statement caches, crypto backends)
+    WARMUP_ENABLED: bool = True
+    WARMUP_DB_CONNECTIONS: int = 5
+
+    # Response compression (brotli/gzip, negotiated via Accept-Encoding)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+
+    # Idempotency-Key support on POST /api/wires
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_LOCK_SECONDS: int = 30
+
+    # Wire update events (WebSocket and Server-Sent Events)
+    WIRE_EVENTS_BACKLOG: int = 10000
+    SSE_HEARTBEAT_SECONDS: int = 15
+    SSE_QUEUE_SIZE: int = 100
+    SSE_RETRY_MS: int = 3000
+
+    # Token revocation: per-worker Bloom filter sizing
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
 
     # CORS - can be overridden with comma-separated env var
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:3001,http://localhost:5173"
@@ -31,11 +62,66 @@ class Settings(BaseSettings):
         """Parse CORS_ORIGINS string into list."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    # Observability
+    METRICS_ENABLED: bool = True
+    CELERY_METRICS_PORT: int | None = None
+    QUERY_STATS_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    N_PLUS_ONE_THRESHOLD: int = 10
+    # Tracing: TRACING_SAMPLE_RATE of requests (and of jobs started without a trace) record
+    # spans, exported every TRACING_EXPORT_INTERVAL_SECONDS as OTLP JSON, either appended
+    # to TRACING_FILE_PATH or POSTed to an OTLP/HTTP collector at TRACING_OTLP_ENDPOINT
+    TRACING_ENABLED: bool = False
+    TRACING_SAMPLE_RATE: float = 0.01
+    TRACING_EXPORTER: Literal["file", "otlp"] = "file"
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_SERVICE_NAME: str = "wire-management"
+    TRACING_QUEUE_SIZE: int = 10000
+    TRACING_EXPORT_INTERVAL_SECONDS: float = 5.0
+
     # Feature Flags
     FEATURE_CSV_EXPORT: bool = False
     FEATURE_ADVANCED_FILTERS: bool = True
     FEATURE_AUDIT_LOG: bool = False
 
+    # Audit log buffering (with FEATURE_AUDIT_LOG): events are written in batches of up
+    # to AUDIT_LOG_BATCH_SIZE, at most AUDIT_LOG_FLUSH_SECONDS after they were recorded.
+    # When the queue is full, "block" makes requests wait for room; "drop_newest" and
+    # "drop_oldest" keep latency and lose events (counted in audit_events_total)
+    AUDIT_LOG_QUEUE_SIZE: int = 10000
+    AUDIT_LOG_BATCH_SIZE: int = 500
+    AUDIT_LOG_FLUSH_SECONDS: float = 1.0
+    AUDIT_LOG_OVERFLOW: Literal["block", "drop_newest", "drop_oldest"] = "block"
+    AUDIT_LOG_DRAIN_SECONDS: int = 10
+
+    # Background jobs: "celery" (broker + worker processes) or "embedded" (an
+    # asyncio runner inside each API process, see app.services.job_runner)
+    JOB_BACKEND: Literal["celery", "embedded"] = "celery"
+    JOB_RUNNER_CONCURRENCY: int = 8
+    JOB_RUNNER_QUEUE_SIZE: int = 1000
+    JOB_RUNNER_DRAIN_SECONDS: int = 30
+    # Periodic jobs in the embedded runner; enable it on one process only
+    JOB_SCHEDULER_ENABLED: bool = False
+    JOB_MAX_RETRIES: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: int = 1
+    JOB_RETRY_BACKOFF_MAX_SECONDS: int = 300
+    SUMMARY_RECONCILE_INTERVAL_SECONDS: int = 3600
+    ANALYTICS_SNAPSHOT_DIR: str = "/var/lib/wire-app/analytics"
+    ANALYTICS_SNAPSHOT_INTERVAL_SECONDS: int = 900
+    WIRE_ARCHIVE_AFTER_DAYS: int = 90
+    WIRE_ARCHIVE_BATCH_SIZE: int = 1000
+    WIRE_ARCHIVE_INTERVAL_SECONDS: int = 3600
+    WIRE_PARTITION_MONTHS_AHEAD: int = 3
+    # Stuck-wire sweeper: PROCESSING wires untouched for STUCK_WIRE_AFTER_SECONDS are
+    # re-queued, or failed once created more than STUCK_WIRE_FAIL_AFTER_SECONDS ago
+    STUCK_WIRE_AFTER_SECONDS: int = 900
+    STUCK_WIRE_FAIL_AFTER_SECONDS: int = 86400
+    STUCK_WIRE_BATCH_SIZE: int = 500
+    STUCK_WIRE_SWEEP_INTERVAL_SECONDS: int = 300
+    # Wires per UPDATE (and per commit) in PATCH /api/wires/status
+    BULK_STATUS_CHUNK_SIZE: int = 500
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,9 +1,15 @@
 """Database configuration and session management."""
 
+from collections.abc import AsyncGenerator
+
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 from app.config import settings
+from app.utils.metrics import instrument_engine
+from app.utils.query_stats import instrument_query_stats
+from app.utils.tracing import instrument_tracing
 
 # Create async engine
 engine = create_async_engine(
@@ -12,6 +18,13 @@ engine = create_async_engine(
     future=True,
 )
 
+if settings.METRICS_ENABLED:
+    instrument_engine(engine.sync_engine)
+if settings.QUERY_STATS_ENABLED:
+    instrument_query_stats(engine.sync_engine)
+if settings.TRACING_ENABLED:
+    instrument_tracing(engine.sync_engine)
+
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -25,14 +38,29 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
-async def get_db() -> AsyncSession:
-    """Dependency for getting async database sessions."""
+# HTTP methods that never write; their sessions are rolled back instead of committed
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database sessions.
+
+    Declare it as ``Depends(get_db, scope="function")``: the code after
+    ``yield`` then runs as soon as the handler has returned (and its response
+    been serialized) but before anything is sent. Write requests are committed
+    exactly once here, so a failed COMMIT becomes a 500 instead of following a
+    2xx the client already received, and background tasks (event broadcasts,
+    audit records) only ever run for committed writes. Read-only requests skip
+    the COMMIT and simply release the connection on close.
+
+    The session checks out a pooled connection lazily on its first query, so
+    requests that never touch the database never hold one.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if request.method not in READ_ONLY_METHODS and session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
@@ -1,23 +1,96 @@
 """Main FastAPI application."""
 
-from fastapi import FastAPI, HTTPException
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.config import settings
+from app.database import engine
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.error_handler import (
     general_exception_handler,
     http_exception_handler,
     validation_exception_handler,
 )
-from app.routers import auth_router, wires_router
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_stats import QueryStatsMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.routers import analytics_router, audit_router, auth_router, wires_router
 from app.routers.websocket import router as websocket_router
+from app.services.audit_service import audit_log
+from app.services.event_service import wire_events
+from app.services.job_runner import job_runner
+from app.services.jobs import SCHEDULE
+from app.services.revocation_service import revocations
+from app.services.warmup_service import warm_up
+from app.utils.idempotency import idempotency_store
 from app.utils.redis_client import cache
+from app.utils.tracing import tracer
+
+# App loggers get their own handler so they show up next to uvicorn's output
+logger = logging.getLogger("app")
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s:     %(name)s - %(message)s"))
+    logger.addHandler(handler)
+logger.setLevel(settings.LOG_LEVEL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect and warm up before serving; uvicorn reports ready only after this."""
+    started = time.perf_counter()
+    try:
+        await cache.connect()
+        logger.info("Redis cache connected")
+    except Exception as e:
+        logger.warning("Redis connection failed: %s", e)
+    await revocations.start()
+    await wire_events.start()
+    if settings.JOB_BACKEND == "embedded":
+        await job_runner.start(SCHEDULE if settings.JOB_SCHEDULER_ENABLED else None)
+    if settings.FEATURE_AUDIT_LOG:
+        await audit_log.start()
+
+    if settings.WARMUP_ENABLED:
+        await warm_up(engine, settings.WARMUP_DB_CONNECTIONS)
+    logger.info("Startup complete in %.0f ms", (time.perf_counter() - started) * 1000)
+
+    yield
+
+    # Drained first: jobs may still publish events and use the cache and database
+    await job_runner.stop(settings.JOB_RUNNER_DRAIN_SECONDS)
+    await audit_log.stop(settings.AUDIT_LOG_DRAIN_SECONDS)
+    await wire_events.stop()
+    await revocations.stop()
+    try:
+        await cache.disconnect()
+        logger.info("Redis cache disconnected")
+    except Exception:
+        pass
+    await engine.dispose()
+    tracer.stop()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     debug=settings.DEBUG,
     version="1.0.0",
+    lifespan=lifespan,
+)
+
+# Innermost, so replayed responses still get CORS headers and compression
+app.add_middleware(
+    IdempotencyMiddleware,
+    store=idempotency_store,
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+    lock_ttl=settings.IDEMPOTENCY_LOCK_SECONDS,
 )
 
 # Configure CORS
@@ -29,6 +102,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
+# Outermost, so latency covers CORS and exception handling too
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Add exception handlers
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -38,26 +124,8 @@ app.add_exception_handler(Exception, general_exception_handler)
 app.include_router(auth_router)
 app.include_router(wires_router)
 app.include_router(websocket_router)
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize connections on startup."""
-    try:
-        await cache.connect()
-        print("✅ Redis cache connected")
-    except Exception as e:
-        print(f"⚠️ Redis connection failed: {e}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    try:
-        await cache.disconnect()
-        print("Redis cache disconnected")
-    except Exception:
-        pass
+app.include_router(analytics_router)
+app.include_router(audit_router)
 
 
 @app.get("/")
@@ -74,3 +142,11 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "environment": settings.ENVIRONMENT}
+
+
+if settings.METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics endpoint."""
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,102 @@
+"""Response compression negotiated through Accept-Encoding."""
+
+import gzip
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+
+# Preferred first when the client gives both the same q-value
+ENCODINGS = ("br", "gzip")
+
+
+def choose_encoding(accept_encoding: str | None) -> str | None:
+    """Pick the best supported coding from an Accept-Encoding header, if any."""
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        name, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    wildcard = qualities.get("*", 0.0)
+    best = max(ENCODINGS, key=lambda name: qualities.get(name, wildcard))
+    return best if qualities.get(best, wildcard) > 0 else None
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware compressing responses with brotli or gzip.
+
+    Only complete, single-message bodies of at least ``minimum_size`` bytes are
+    compressed; streamed responses (event streams, exports) pass through as-is.
+    Strong ETags are weakened on compressed responses, since the bytes differ
+    from the identity representation they were computed for.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = {**message, "headers": list(message.get("headers", []))}
+                headers = Headers(raw=start_message["headers"])
+                passthrough = "content-encoding" in headers or headers.get(
+                    "content-type", ""
+                ).startswith("text/event-stream")
+                if passthrough:
+                    await send(start_message)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                # Streaming or small: send untouched, but caches must still key on coding
+                passthrough = True
+                headers.add_vary_header("Accept-Encoding")
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self.compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send(start_message)
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
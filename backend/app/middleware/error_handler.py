@@ -4,6 +4,7 @@ import logging
 from datetime import datetime
 
 from fastapi import HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
@@ -20,6 +21,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
             "timestamp": datetime.utcnow().isoformat(),
             "path": str(request.url),
         },
+        headers=exc.headers,
     )
 
 
@@ -31,7 +33,7 @@ async def validation_exception_handler(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation error",
-            "details": exc.errors(),
+            "details": jsonable_encoder(exc.errors()),
             "timestamp": datetime.utcnow().isoformat(),
             "path": str(request.url),
         },
@@ -0,0 +1,240 @@
+"""Idempotency-Key handling for retried POST requests."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import URL, Headers
+
+from app.services.revocation_service import revocations
+from app.utils.idempotency import (
+    COMPLETED,
+    IN_FLIGHT,
+    IdempotencyRecord,
+    IdempotencyStore,
+    request_fingerprint,
+)
+from app.utils.metrics import IDEMPOTENT_REQUESTS
+from app.utils.security import decode_token
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_ROUTES = frozenset({("POST", "/api/wires")})
+MAX_KEY_LENGTH = 255
+# Only representation headers are replayed; per-request ones are regenerated
+STORED_HEADERS = frozenset({"content-type", "etag", "location"})
+POLL_INTERVAL = 0.05
+
+
+async def _caller(authorization: str | None) -> str | None:
+    """Key scope from the bearer token's subject, without a database lookup."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    payload = decode_token(token)
+    if payload is None or payload.get("type") != "access":
+        return None
+    # A revoked token must not be able to replay stored responses
+    if await revocations.is_revoked(payload):
+        return None
+    subject = payload.get("sub")
+    return f"user:{subject}" if subject else None
+
+
+class IdempotencyMiddleware:
+    """Pure ASGI middleware making POSTs with an ``Idempotency-Key`` safe to retry.
+
+    The first request with a key reserves it and runs; its response is stored
+    for ``ttl`` seconds unless it is a 5xx or the app raised. Endpoints commit
+    before responding (see ``app.database.get_db``), so a stored response is
+    one whose writes are durable. Retries with the same key and request get the
+    stored response without reaching the endpoint (so without any database
+    work), concurrent duplicates wait for the original to finish (and run
+    themselves if it failed), and reusing a key for a different request is
+    rejected with 422.
+
+    Requests without a valid bearer token pass straight through; the endpoint
+    rejects them. If the store is unavailable the request runs unprotected.
+    """
+
+    def __init__(
+        self,
+        app,
+        store: IdempotencyStore,
+        ttl: int,
+        lock_ttl: int,
+        routes: frozenset[tuple[str, str]] = IDEMPOTENT_ROUTES,
+    ):
+        self.app = app
+        self.store = store
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.routes = routes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (scope["method"], scope["path"]) not in self.routes:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get("idempotency-key")
+        owner = await _caller(headers.get("authorization"))
+        if key is None or owner is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not key or len(key) > MAX_KEY_LENGTH:
+            await self._error(
+                scope,
+                receive,
+                send,
+                status.HTTP_400_BAD_REQUEST,
+                f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters",
+            )
+            return
+
+        body = await _read_body(receive)
+        fingerprint = request_fingerprint(scope["method"], scope["path"], headers, body)
+
+        while True:
+            try:
+                existing = await self.store.reserve(owner, key, fingerprint, self.lock_ttl)
+            except Exception:
+                IDEMPOTENT_REQUESTS.labels("error").inc()
+                logger.warning("Idempotency store unavailable; running request", exc_info=True)
+                await self.app(scope, _replay_body(body, receive), send)
+                return
+
+            if existing is None:
+                await self._run_and_store(
+                    scope, _replay_body(body, receive), send, owner, key, fingerprint
+                )
+                return
+
+            if existing.fingerprint == fingerprint and existing.state == IN_FLIGHT:
+                existing = await self._wait_for(owner, key)
+                if existing is None:
+                    # The original failed and released the key: try to run this one
+                    continue
+
+            await self._answer_duplicate(scope, receive, send, existing, fingerprint)
+            return
+
+    async def _answer_duplicate(self, scope, receive, send, record, fingerprint):
+        if record.fingerprint != fingerprint:
+            IDEMPOTENT_REQUESTS.labels("mismatch").inc()
+            await self._error(
+                scope,
+                receive,
+                send,
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                "Idempotency-Key was already used for a different request",
+            )
+            return
+
+        if record.state != COMPLETED:
+            IDEMPOTENT_REQUESTS.labels("conflict").inc()
+            await self._error(
+                scope,
+                receive,
+                send,
+                status.HTTP_409_CONFLICT,
+                "A request with this Idempotency-Key is still in progress",
+            )
+            return
+
+        IDEMPOTENT_REQUESTS.labels("replayed").inc()
+        raw_headers = [(name.encode(), value.encode()) for name, value in record.headers]
+        raw_headers.append((b"content-length", str(len(record.body)).encode()))
+        raw_headers.append((b"idempotent-replayed", b"true"))
+        await send({"type": "http.response.start", "status": record.status, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": record.body})
+
+    async def _wait_for(self, owner: str, key: str) -> IdempotencyRecord | None:
+        """Poll until the original request finishes or gives up (5xx).
+
+        Returns the stored record, None once the key was released, or the
+        in-flight record if the original is still running after ``lock_ttl``.
+        """
+        deadline = time.monotonic() + self.lock_ttl
+        while True:
+            await asyncio.sleep(POLL_INTERVAL)
+            record = await self.store.get(owner, key)
+            if record is None or record.state == COMPLETED or time.monotonic() >= deadline:
+                return record
+
+    async def _run_and_store(self, scope, receive, send, owner, key, fingerprint):
+        record = IdempotencyRecord(state=COMPLETED, fingerprint=fingerprint, status=500)
+        body = []
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                record.status = message["status"]
+                record.headers = [
+                    (name.decode(), value.decode())
+                    for name, value in message.get("headers", [])
+                    if name.decode().lower() in STORED_HEADERS
+                ]
+            elif message["type"] == "http.response.body":
+                body.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException:
+            # Even after a response started: its writes may not have committed
+            record.status = 500
+            raise
+        finally:
+            try:
+                if record.status < 500:
+                    record.body = b"".join(body)
+                    await self.store.complete(owner, key, record, self.ttl)
+                    IDEMPOTENT_REQUESTS.labels("stored").inc()
+                else:
+                    await self.store.release(owner, key)
+            except Exception:
+                IDEMPOTENT_REQUESTS.labels("error").inc()
+                logger.warning("Could not save idempotent response for %s", key, exc_info=True)
+
+    async def _error(self, scope, receive, send, status_code: int, detail: str):
+        # Same body shape as app.middleware.error_handler.http_exception_handler
+        response = JSONResponse(
+            status_code=status_code,
+            content={
+                "error": detail,
+                "status_code": status_code,
+                "timestamp": datetime.utcnow().isoformat(),
+                "path": str(URL(scope=scope)),
+            },
+        )
+        await response(scope, receive, send)
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive):
+    """A receive callable that yields the already-read body, then defers to ``receive``."""
+    sent = False
+
+    async def replay():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
@@ -0,0 +1,41 @@
+"""Request latency metrics middleware."""
+
+import time
+
+from app.utils.metrics import HTTP_REQUEST_DURATION
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route latency histograms.
+
+    Labels use the matched route template (``/api/wires/{wire_id}``), never the raw
+    path, so label cardinality stays bounded. Avoids BaseHTTPMiddleware, which would
+    add a task and a body copy to every request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"],
+                getattr(route, "path", "<unmatched>"),
+                str(status_code),
+            ).observe(time.perf_counter() - started)
@@ -0,0 +1,50 @@
+"""Per-request SQL accounting middleware."""
+
+import logging
+
+from app.config import settings
+from app.utils.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """Pure ASGI middleware tracking the SQL statements issued by each request.
+
+    Outside production, responses carry ``X-Query-Count`` and ``X-DB-Time`` (ms).
+    Headers go out with the response start, so they cover the handler and the
+    statements its commit flushes (see ``app.database.get_db``), but not those
+    issued while a streamed body is sent or by background tasks. Requests repeating one
+    statement ``N_PLUS_ONE_THRESHOLD`` times are logged once the whole request,
+    those included, has finished.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.expose_headers = settings.ENVIRONMENT != "production"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start" and self.expose_headers:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-query-count", str(stats.count).encode()))
+                    headers.append((b"x-db-time", f"{stats.duration * 1000:.2f}".encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        for statement, times in stats.repeated(settings.N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                "Possible N+1 on %s %s: statement ran %d times: %s",
+                scope["method"],
+                scope["path"],
+                times,
+                " ".join(statement.split())[:200],
+            )
@@ -0,0 +1,67 @@
+"""Request tracing middleware."""
+
+from app.utils.tracing import tracer
+
+
+class TracingMiddleware:
+    """Pure ASGI middleware opening the root span of each sampled request.
+
+    Continues the caller's trace when the request carries a ``traceparent``
+    header. Sampled responses name their trace in ``X-Trace-Id``. Sending the
+    response gets a child span of its own, so time between the handler's last
+    child span and ``http.response`` is validation and serialization.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+        root = tracer.begin(
+            scope["method"],
+            traceparent,
+            "server",
+            {"http.method": scope["method"], "http.target": scope["path"]},
+        )
+        if root is None:
+            await self.app(scope, receive, send)
+            return
+
+        sending = None
+
+        async def send_wrapper(message):
+            nonlocal sending
+            if message["type"] == "http.response.start":
+                root.attributes["http.status_code"] = message["status"]
+                root.error = message["status"] >= 500
+                headers = list(message.get("headers", []))
+                headers.append((b"x-trace-id", root.trace_id.encode()))
+                message = {**message, "headers": headers}
+                sending = root.child("http.response")
+            await send(message)
+            if sending is not None and not message.get("more_body", False):
+                tracer.finish(sending)
+                sending = None
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException:
+            root.error = True
+            raise
+        finally:
+            if sending is not None:
+                sending.error = True
+                tracer.finish(sending)
+            route = scope.get("route")
+            if route is not None:
+                root.name = f"{scope['method']} {route.path}"
+                root.attributes["http.route"] = route.path
+            tracer.end(root)
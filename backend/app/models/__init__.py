@@ -1,6 +1,25 @@
 """Models package."""
 
+from app.models.audit_log import AuditLog
 from app.models.user import User
-from app.models.wire import Wire, WireStatus
+from app.models.wire import (
+    STATUS_TRANSITIONS,
+    TERMINAL_STATUSES,
+    Wire,
+    WireStatus,
+    allowed_sources,
+)
+from app.models.wire_archive import WireArchive
+from app.models.wire_summary import WireSummary
 
-__all__ = ["User", "Wire", "WireStatus"]
+__all__ = [
+    "AuditLog",
+    "STATUS_TRANSITIONS",
+    "TERMINAL_STATUSES",
+    "User",
+    "Wire",
+    "WireArchive",
+    "WireStatus",
+    "WireSummary",
+    "allowed_sources",
+]
@@ -0,0 +1,31 @@
+"""Append-only audit log model."""
+
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, Integer, String
+
+from app.database import Base
+
+
+class AuditLog(Base):
+    """One recorded action: who did what to which entity, and when.
+
+    Rows are only ever inserted (on Postgres a trigger rejects UPDATE and
+    DELETE). actor_id deliberately has no foreign key, so the record of an
+    action outlives the user who took it.
+    """
+
+    __tablename__ = "audit_log"
+    # The API pages through one actor's events newest first, keyed on id
+    __table_args__ = (Index("ix_audit_log_actor_id_id", "actor_id", "id"),)
+
+    # SQLite only auto-increments INTEGER PRIMARY KEY columns
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    # When the action happened, not when the buffered event was written
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+    action = Column(String(50), nullable=False)
+    actor_id = Column(Integer)
+    entity_type = Column(String(50))
+    entity_id = Column(Integer)
+    details = Column(JSON)
+
+    def __repr__(self) -> str:
+        return f"<AuditLog(id={self.id}, action={self.action}, actor_id={self.actor_id})>"
@@ -2,10 +2,28 @@
 
 import enum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    column,
+    event,
+    table,
+    text,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateColumn
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.utils.money import from_minor
 
 
 class WireStatus(enum.Enum):
@@ -17,21 +35,100 @@ class WireStatus(enum.Enum):
     FAILED = "failed"
 
 
+# Statuses no worker moves a wire out of; only these are eligible for archival.
+# A FAILED wire only leaves its status when explicitly retried
+TERMINAL_STATUSES = (WireStatus.COMPLETED, WireStatus.FAILED)
+
+# Bulk status changes: the statuses each status may move to
+STATUS_TRANSITIONS = {
+    WireStatus.PENDING: (WireStatus.PROCESSING, WireStatus.FAILED),
+    WireStatus.PROCESSING: (WireStatus.COMPLETED, WireStatus.FAILED),
+    WireStatus.FAILED: (WireStatus.PENDING,),
+    WireStatus.COMPLETED: (),
+}
+
+
+def allowed_sources(target: WireStatus) -> tuple[WireStatus, ...]:
+    """Statuses a wire may be in to move to ``target``."""
+    return tuple(source for source, targets in STATUS_TRANSITIONS.items() if target in targets)
+
+
 class Wire(Base):
     """Wire transfer model."""
 
     __tablename__ = "wires"
+    __table_args__ = (
+        # Postgres partitions wires by created_at month, and a partitioned table can only
+        # enforce keys that include the partition column (migration d5a8b3c6e2f7). SQLite
+        # keeps id alone as the key, an alias of the rowid (see _create_sqlite_column)
+        PrimaryKeyConstraint("id", "created_at", name="wires_pkey").ddl_if(dialect="postgresql"),
+        Index("ix_wires_reference_number", "reference_number", "created_at", unique=True),
+        # Every list query is scoped to created_by, so each filter gets an index led by it
+        Index("ix_wires_created_by_created_at", "created_by", "created_at"),
+        Index("ix_wires_created_by_status_created_at", "created_by", "status", "created_at"),
+        Index("ix_wires_created_by_currency_created_at", "created_by", "currency", "created_at"),
+        Index("ix_wires_created_by_amount_minor", "created_by", "amount_minor"),
+        # Retention job: finds old terminal wires without touching hot PENDING/PROCESSING rows
+        Index(
+            "ix_wires_terminal_created_at",
+            "created_at",
+            postgresql_where=text("status IN ('COMPLETED', 'FAILED')"),
+            sqlite_where=text("status IN ('COMPLETED', 'FAILED')"),
+        ),
+        # Stuck-wire sweeper: only PROCESSING rows, a small fraction of the table
+        Index(
+            "ix_wires_processing_updated_at",
+            "updated_at",
+            postgresql_where=text("status = 'PROCESSING'"),
+            sqlite_where=text("status = 'PROCESSING'"),
+        ),
+        # Postgres: LIKE 'prefix%' needs pattern ops under a non-C collation
+        Index(
+            "ix_wires_reference_number_pattern",
+            "reference_number",
+            postgresql_ops={"reference_number": "varchar_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # Postgres: trigram GIN indexes back case-insensitive substring search
+        Index(
+            "ix_wires_sender_name_trgm",
+            "sender_name",
+            postgresql_using="gin",
+            postgresql_ops={"sender_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_wires_recipient_name_trgm",
+            "recipient_name",
+            postgresql_using="gin",
+            postgresql_ops={"recipient_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     sender_name = Column(String(200), nullable=False)
     recipient_name = Column(String(200), nullable=False)
-    amount = Column(Numeric(15, 2), nullable=False)
+    # Whole minor units of the currency (cents, yen, fils); see app.utils.money
+    amount_minor = Column(BigInteger, nullable=False)
     currency = Column(String(3), default="USD", nullable=False)
     status = Column(Enum(WireStatus), default=WireStatus.PENDING, nullable=False)
-    reference_number = Column(String(50), unique=True, index=True)
+    reference_number = Column(String(50))
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False
+    )
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Optimistic concurrency: bumped by every update, matched against If-Match
+    version = Column(Integer, default=1, server_default="1", nullable=False)
+
+    # Fetch server-generated created_at/updated_at via RETURNING on INSERT and UPDATE
+    # instead of issuing a follow-up refresh. ORM flushes bump (and check) version too;
+    # the router's UPDATE/DELETE statements do the same by hand
+    # id comes from one sequence across all partitions, so it alone identifies a wire
+    __mapper_args__ = {"eager_defaults": True, "version_id_col": version, "primary_key": [id]}
+
+    @property
+    def amount(self):
+        """Exact decimal amount, e.g. Decimal("10.50") for 1050 USD minor units."""
+        return from_minor(self.amount_minor, self.currency)
 
     def __repr__(self) -> str:
         return f"<Wire(id={self.id}, ref={self.reference_number}, status={self.status.value})>"
@@ -42,11 +139,60 @@ class Wire(Base):
             "id": self.id,
             "sender_name": self.sender_name,
             "recipient_name": self.recipient_name,
-            "amount": float(self.amount),
+            "amount": str(self.amount),
             "currency": self.currency,
             "status": self.status.value,
             "reference_number": self.reference_number,
             "created_by": self.created_by,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "version": self.version,
         }
+
+
+# SQLite fallback for name search: an external-content FTS5 table using the trigram
+# tokenizer (case-insensitive substring matches), kept in sync with wires by triggers.
+wires_fts = table("wires_fts", column("rowid"), column("wires_fts"))
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS wires_fts USING fts5("
+    "sender_name, recipient_name, content='wires', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS wires_fts_ai AFTER INSERT ON wires BEGIN "
+    "INSERT INTO wires_fts(rowid, sender_name, recipient_name) "
+    "VALUES (new.id, new.sender_name, new.recipient_name); END",
+    "CREATE TRIGGER IF NOT EXISTS wires_fts_ad AFTER DELETE ON wires BEGIN "
+    "INSERT INTO wires_fts(wires_fts, rowid, sender_name, recipient_name) "
+    "VALUES ('delete', old.id, old.sender_name, old.recipient_name); END",
+    "CREATE TRIGGER IF NOT EXISTS wires_fts_au AFTER UPDATE OF sender_name, recipient_name "
+    "ON wires BEGIN "
+    "INSERT INTO wires_fts(wires_fts, rowid, sender_name, recipient_name) "
+    "VALUES ('delete', old.id, old.sender_name, old.recipient_name); "
+    "INSERT INTO wires_fts(rowid, sender_name, recipient_name) "
+    "VALUES (new.id, new.sender_name, new.recipient_name); END",
+]
+
+event.listen(
+    Wire.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for statement in SQLITE_FTS_DDL:
+    event.listen(Wire.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Wire.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS wires_fts").execute_if(dialect="sqlite"),
+)
+
+
+@compiles(CreateColumn, "sqlite")
+def _create_sqlite_column(element, compiler, **kw):
+    """Declare wires.id as INTEGER PRIMARY KEY on SQLite, where it stays the sole key.
+
+    SQLite cannot autoincrement a column of a composite key, and wires_fts expects
+    id to be the rowid.
+    """
+    column = element.element
+    if column is not Wire.__table__.c.id:
+        return compiler.visit_create_column(element, **kw)
+    return f"{compiler.preparer.format_column(column)} INTEGER NOT NULL PRIMARY KEY"
@@ -0,0 +1,40 @@
+"""Archive of terminal-status wires moved out of the hot wires table."""
+
+from sqlalchemy import BigInteger, Column, DateTime, Enum, ForeignKey, Index, Integer, String
+from sqlalchemy.sql import func
+
+from app.database import Base
+from app.models.wire import WireStatus
+from app.utils.money import from_minor
+
+
+class WireArchive(Base):
+    """Archived wire transfer.
+
+    Same columns as ``Wire`` plus ``archived_at``; rows keep their original id so
+    lookups by id work across both tables. Archived wires are read-only.
+    """
+
+    __tablename__ = "wires_archive"
+    __table_args__ = (Index("ix_wires_archive_created_by_id", "created_by", "id"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    sender_name = Column(String(200), nullable=False)
+    recipient_name = Column(String(200), nullable=False)
+    amount_minor = Column(BigInteger, nullable=False)
+    currency = Column(String(3), nullable=False)
+    status = Column(Enum(WireStatus), nullable=False)
+    reference_number = Column(String(50), index=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True))
+    version = Column(Integer, default=1, server_default="1", nullable=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    @property
+    def amount(self):
+        """Exact decimal amount (see ``Wire.amount``)."""
+        return from_minor(self.amount_minor, self.currency)
+
+    def __repr__(self) -> str:
+        return f"<WireArchive(id={self.id}, ref={self.reference_number})>"
@@ -0,0 +1,35 @@
+"""Per-user wire rollup model."""
+
+from sqlalchemy import BigInteger, Column, Enum, ForeignKey, Integer, String
+
+from app.database import Base
+from app.models.wire import WireStatus
+from app.utils.money import from_minor
+
+
+class WireSummary(Base):
+    """Running count and total of a user's wires per status and currency.
+
+    Maintained incrementally by the wire write paths so the dashboard summary
+    never has to scan the wires table.
+    """
+
+    __tablename__ = "wire_summaries"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    status = Column(Enum(WireStatus), primary_key=True)
+    currency = Column(String(3), primary_key=True)
+    wire_count = Column(Integer, default=0, nullable=False)
+    # Sum of amount_minor, so maintaining and reconciling it is integer arithmetic
+    total_minor = Column(BigInteger, default=0, nullable=False)
+
+    @property
+    def total_amount(self):
+        """Exact decimal total in the bucket's currency."""
+        return from_minor(self.total_minor, self.currency)
+
+    def __repr__(self) -> str:
+        return (
+            f"<WireSummary(user_id={self.user_id}, status={self.status.value}, "
+            f"currency={self.currency}, count={self.wire_count})>"
+        )
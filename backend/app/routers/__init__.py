@@ -1,7 +1,9 @@
 """Routers package."""
 
+from app.routers.analytics import router as analytics_router
+from app.routers.audit import router as audit_router
 from app.routers.auth import router as auth_router
 from app.routers.websocket import router as websocket_router
 from app.routers.wires import router as wires_router
 
-__all__ = ["auth_router", "wires_router", "websocket_router"]
+__all__ = ["analytics_router", "audit_router", "auth_router", "wires_router", "websocket_router"]
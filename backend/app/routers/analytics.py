@@ -0,0 +1,46 @@
+"""Analytics endpoints served from columnar snapshots."""
+
+from datetime import datetime
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.models import User
+from app.schemas import VolumeReportResponse
+from app.services.auth_service import get_current_user
+
+router = APIRouter(prefix="/api/analytics", tags=["Analytics"])
+
+
+@router.get("/volume", response_model=VolumeReportResponse)
+async def volume_report(
+    bucket: str = Query("day", pattern="^(day|week)$", description="Time bucket size"),
+    start: datetime | None = Query(None, description="Created at or after"),
+    end: datetime | None = Query(None, description="Created before"),
+    current_user: User = Depends(get_current_user),
+):
+    """Wire counts and totals per time bucket, currency and status.
+
+    Computed from the latest analytics snapshot; the wires table is not queried.
+    """
+    # Deferred: keeps numpy out of start-up for workers that never serve analytics
+    from app.services.analytics_service import aggregate_volume, load_latest_snapshot
+
+    snapshot = load_latest_snapshot(Path(settings.ANALYTICS_SNAPSHOT_DIR))
+    if snapshot is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Analytics snapshot not available yet",
+        )
+
+    buckets = await run_in_threadpool(
+        aggregate_volume, snapshot, current_user.id, bucket, start, end
+    )
+
+    return VolumeReportResponse(
+        bucket=bucket,
+        snapshot_generated_at=snapshot.generated_at,
+        buckets=buckets,
+    )
@@ -0,0 +1,46 @@
+"""Audit log endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import get_db
+from app.models import User
+from app.schemas import AuditLogPage
+from app.services.audit_service import get_audit_events
+from app.services.auth_service import get_current_user
+
+router = APIRouter(prefix="/api/audit", tags=["Audit"])
+
+
+@router.get("", response_model=AuditLogPage)
+async def list_audit_events(
+    before: int | None = Query(None, ge=1, description="next_cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=500, description="Events per page"),
+    action: str | None = Query(None, max_length=50, description="e.g. wire.update"),
+    entity_type: str | None = Query(None, max_length=50, description="e.g. wire"),
+    entity_id: int | None = Query(None, description="Entity id"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """The current user's audit trail, newest first.
+
+    Events are written in batches, so the latest may take up to
+    AUDIT_LOG_FLUSH_SECONDS to appear.
+    """
+    if not settings.FEATURE_AUDIT_LOG:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Audit log is not enabled",
+        )
+
+    events, next_cursor = await get_audit_events(
+        db,
+        current_user.id,
+        before=before,
+        limit=limit,
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+    )
+    return AuditLogPage(events=events, next_cursor=next_cursor)
@@ -3,20 +3,31 @@
 import secrets
 import string
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from redis.exceptions import RedisError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import User
-from app.schemas import Token, UserCreate, UserLogin, UserResponse
-from app.services.auth_service import get_current_user
-from app.utils.security import (
-    create_access_token,
-    create_refresh_token,
-    hash_password,
-    verify_password,
+from app.schemas import (
+    LogoutRequest,
+    RefreshRequest,
+    Token,
+    UserCreate,
+    UserLogin,
+    UserResponse,
 )
+from app.services.audit_service import audit_log
+from app.services.auth_service import get_current_user, get_token_payload
+from app.services.revocation_service import revocations
+from app.services.token_service import (
+    issue_tokens,
+    revoke_refresh_token,
+    rotate_refresh_token,
+    session_store_unavailable,
+)
+from app.utils.security import hash_password, verify_and_rehash
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
@@ -28,7 +39,7 @@ def generate_reference_number(length: int = 12) -> str:
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db, scope="function")):
     """Register a new user."""
     # Check if user already exists
     result = await db.execute(select(User).where(User.email == user_data.email))
@@ -45,20 +56,40 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     new_user = User(email=user_data.email, hashed_password=hashed_password)
 
     db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    await db.flush()
 
     return new_user
 
 
 @router.post("/login", response_model=Token)
-async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
+async def login(
+    credentials: UserLogin,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
     """Login and get JWT tokens."""
     # Find user by email
     result = await db.execute(select(User).where(User.email == credentials.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    valid, new_hash = (
+        verify_and_rehash(credentials.password, user.hashed_password) if user else (False, None)
+    )
+    client = {"email": credentials.email, "ip": request.client.host if request.client else None}
+    if not valid or not user.is_active:
+        # Recorded now: the request fails, so it has no background tasks. Never waits
+        # for queue room, so a database outage cannot hang unauthenticated callers
+        reason = "inactive" if valid else "invalid_credentials"
+        audit_log.record_nowait(
+            "auth.login_failed",
+            user.id if user else None,
+            "user",
+            None,
+            {**client, "reason": reason},
+        )
+
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -71,11 +102,45 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
             detail="Inactive user",
         )
 
-    # Create tokens (sub must be a string per JWT spec)
-    access_token = create_access_token(data={"sub": str(user.id), "email": user.email})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
-
-    return Token(access_token=access_token, refresh_token=refresh_token)
+    # Upgrade hashes made with older cost parameters while the password is at hand
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.flush()
+
+    tokens = await issue_tokens(user.id, user.email)
+    # Only once the login (and any rehash) has committed
+    background_tasks.add_task(audit_log.record, "auth.login", user.id, "user", user.id, client)
+    return tokens
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(data: RefreshRequest):
+    """Exchange a refresh token for a new access and refresh token.
+
+    Refresh tokens rotate: each one works once. Presenting one again revokes
+    its whole login session.
+    """
+    return await rotate_refresh_token(data.refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(data: LogoutRequest | None = None, payload: dict = Depends(get_token_payload)):
+    """Revoke the access token used for this call, and its refresh token if given."""
+    try:
+        await revocations.revoke_token(payload["jti"], payload["exp"])
+    except RedisError:
+        raise session_store_unavailable() from None
+    if data and data.refresh_token:
+        await revoke_refresh_token(data.refresh_token)
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all(current_user: User = Depends(get_current_user)):
+    """Revoke every access and refresh token issued to the current user so far."""
+    try:
+        await revocations.revoke_user(current_user.id)
+    except RedisError:
+        raise session_store_unavailable() from None
 
 
 @router.get("/me", response_model=UserResponse)
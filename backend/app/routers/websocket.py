@@ -1,40 +1,80 @@
 """WebSocket router for real-time updates."""
 
 import asyncio
+from contextlib import suppress
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from app.config import settings
+from app.services.event_service import wire_events
+from app.utils.metrics import WEBSOCKET_CONNECTIONS
+
 router = APIRouter(prefix="/ws", tags=["WebSocket"])
 
+# How long closing a client dropped for falling behind may take
+CLOSE_TIMEOUT_SECONDS = 5
+
 
 class ConnectionManager:
-    """Manage WebSocket connections."""
+    """Manage WebSocket connections.
+
+    Like SSE subscribers, each connection has a bounded queue drained by its
+    own sender task, so a broadcast never waits on a client. A client that
+    falls ``queue_size`` messages behind is dropped and closed; it reconnects
+    and reloads.
+    """
 
-    def __init__(self):
-        self.active_connections: list[WebSocket] = []
+    def __init__(self, queue_size: int = settings.SSE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.active_connections: dict[WebSocket, asyncio.Queue[dict]] = {}
+        self._tasks: dict[WebSocket, asyncio.Task] = {}
+        self._closing: set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket):
         """Accept and store new connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue[dict] = asyncio.Queue(self.queue_size)
+        self.active_connections[websocket] = queue
+        self._tasks[websocket] = asyncio.create_task(self._send(websocket, queue))
+        WEBSOCKET_CONNECTIONS.inc()
 
     def disconnect(self, websocket: WebSocket):
         """Remove connection."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        if self.active_connections.pop(websocket, None) is not None:
+            sender = self._tasks.pop(websocket)
+            if sender is not asyncio.current_task():
+                sender.cancel()
+            WEBSOCKET_CONNECTIONS.dec()
 
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        # Create a copy to avoid modification during iteration
-        for connection in self.active_connections[:]:
+    async def _send(self, websocket: WebSocket, queue: asyncio.Queue[dict]):
+        while True:
+            message = await queue.get()
             try:
-                await connection.send_json(message)
+                await websocket.send_json(message)
             except Exception:
-                # Remove failed connection
-                self.disconnect(connection)
+                self.disconnect(websocket)
+                return
+
+    async def _close(self, websocket: WebSocket):
+        with suppress(Exception):
+            async with asyncio.timeout(CLOSE_TIMEOUT_SECONDS):
+                await websocket.close(code=1013)
+
+    async def broadcast(self, message: dict):
+        """Queue message for every connected client, without waiting on any of them."""
+        for websocket, queue in list(self.active_connections.items()):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.disconnect(websocket)
+                task = asyncio.create_task(self._close(websocket))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
 
 
 manager = ConnectionManager()
+# WebSocket clients get every event from the same source as /api/wires/events
+wire_events.add_listener(manager.broadcast)
 
 
 @router.websocket("")
@@ -64,7 +104,7 @@ async def websocket_endpoint(websocket: WebSocket):
 
 
 async def broadcast_wire_update(wire_id: int, status: str, user_id: int):
-    """Broadcast wire status update to all connected clients."""
+    """Broadcast wire status update to WebSocket and Server-Sent Events clients."""
     message = {
         "type": "wire_update",
         "wire_id": wire_id,
@@ -72,4 +112,4 @@ async def broadcast_wire_update(wire_id: int, status: str, user_id: int):
         "user_id": user_id,
         "timestamp": asyncio.get_event_loop().time(),
     }
-    await manager.broadcast(message)
+    await wire_events.publish(message)
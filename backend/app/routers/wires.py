@@ -1,51 +1,165 @@
 """Wire transfer CRUD endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
 from app.models import User, WireStatus
-from app.schemas import WireCreate, WireListResponse, WireResponse, WireUpdate
-from app.services.auth_service import get_current_user
-from app.services.wire_service import create_wire, get_wire_by_id, get_wires_paginated
+from app.routers.websocket import broadcast_wire_update
+from app.schemas import (
+    WireBulkStatusResponse,
+    WireBulkStatusUpdate,
+    WireCreate,
+    WireListResponse,
+    WireResponse,
+    WireSummaryResponse,
+    WireUpdate,
+)
+from app.services.audit_service import audit_log
+from app.services.auth_service import get_current_user, get_token_payload
+from app.services.event_service import sse_stream
+from app.services.summary_service import get_wire_summary
+from app.services.wire_service import (
+    create_wire,
+    delete_wire_guarded,
+    get_wire_by_id,
+    get_wire_version,
+    get_wires_paginated,
+    transition_wire_statuses,
+    update_wire_guarded,
+)
+from app.utils.etag import (
+    etag_matches,
+    if_match_versions,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+    wire_etag,
+)
+from app.utils.negotiation import NegotiatedRoute
 
-router = APIRouter(prefix="/api/wires", tags=["Wires"])
+# Every wire endpoint also speaks MessagePack (Accept / Content-Type: application/msgpack)
+router = APIRouter(prefix="/api/wires", tags=["Wires"], route_class=NegotiatedRoute)
 
 
 @router.post("", response_model=WireResponse, status_code=status.HTTP_201_CREATED)
 async def create_wire_endpoint(
     wire_data: WireCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Create a new wire transfer."""
     wire = await create_wire(
         db=db,
         sender_name=wire_data.sender_name,
         recipient_name=wire_data.recipient_name,
-        amount=float(wire_data.amount),
+        amount=wire_data.amount,
         currency=wire_data.currency,
         user=current_user,
     )
 
+    # Background tasks run only once get_db has committed and the response is sent,
+    # so writes that fail to commit are never audited
+    background_tasks.add_task(
+        audit_log.record,
+        "wire.create",
+        current_user.id,
+        "wire",
+        wire.id,
+        {"amount": str(wire_data.amount), "currency": wire_data.currency},
+    )
     return wire
 
 
-@router.get("", response_model=WireListResponse)
+NOT_MODIFIED = {304: {"description": "Not modified (If-None-Match matched the ETag)"}}
+
+
+@router.get("", response_model=WireListResponse, responses=NOT_MODIFIED)
 async def list_wires(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    status: str | None = Query(None, description="Filter by status"),
+    wire_status: str | None = Query(
+        None,
+        alias="status",
+        pattern="^(pending|processing|completed|failed)$",
+        description="Filter by status",
+    ),
+    min_amount: Decimal | None = Query(None, ge=0, description="Minimum amount (inclusive)"),
+    max_amount: Decimal | None = Query(None, ge=0, description="Maximum amount (inclusive)"),
+    currency: str | None = Query(None, pattern="^[A-Z]{3}$", description="Filter by currency"),
+    created_from: datetime | None = Query(None, description="Created at or after"),
+    created_to: datetime | None = Query(None, description="Created before"),
+    search: str | None = Query(
+        None, min_length=1, max_length=200, description="Sender/recipient name contains"
+    ),
+    reference: str | None = Query(
+        None, pattern="^[A-Za-z0-9-]+$", max_length=50, description="Reference number prefix"
+    ),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
-    """List wire transfers with pagination."""
+    """List wire transfers with pagination.
+
+    Responses carry an ETag derived from the user's wires_version (loaded with
+    the user, so a matching If-None-Match is answered without querying wires).
+    """
+    advanced = (min_amount, max_amount, currency, created_from, created_to, search, reference)
+    if not settings.FEATURE_ADVANCED_FILTERS and any(value is not None for value in advanced):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Advanced filters are disabled",
+        )
+
+    if min_amount is not None and max_amount is not None and min_amount > max_amount:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_amount must not exceed max_amount",
+        )
+
+    etag = make_etag(
+        "wires",
+        current_user.id,
+        current_user.wires_version,
+        page,
+        page_size,
+        wire_status,
+        *advanced,
+    )
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+
     wires, total = await get_wires_paginated(
         db=db,
         user=current_user,
         page=page,
         page_size=page_size,
-        status=status,
+        status=wire_status,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        currency=currency,
+        created_from=created_from,
+        created_to=created_to,
+        search=search,
+        reference_prefix=reference.upper() if reference else None,
     )
 
     return WireListResponse(
@@ -57,13 +171,101 @@ async def list_wires(
     )
 
 
-@router.get("/{wire_id}", response_model=WireResponse)
+@router.get("/summary", response_model=WireSummaryResponse)
+async def get_summary(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """Get wire counts and totals grouped by status and currency."""
+    items = await get_wire_summary(db, current_user.id)
+    return WireSummaryResponse(items=items)
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def wire_events_stream(
+    last_event_id: str | None = Header(default=None),
+    payload: dict = Depends(get_token_payload),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """Stream the current user's wire updates as Server-Sent Events.
+
+    Read-only alternative to ``/ws``. Reconnecting with ``Last-Event-ID``
+    replays missed events. The stream ends when the access token expires; the
+    client reconnects with a fresh token and resumes where it left off.
+    """
+    # The stream can stay open for minutes; do not hold a pooled connection
+    await db.close()
+    return StreamingResponse(
+        sse_stream(
+            current_user.id,
+            last_event_id,
+            until=payload["exp"],
+            heartbeat=settings.SSE_HEARTBEAT_SECONDS,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.patch("/status", response_model=WireBulkStatusResponse)
+async def bulk_update_status(
+    data: WireBulkStatusUpdate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """Move many wires to one status, e.g. retry every FAILED wire of a batch.
+
+    Wires whose current status does not allow the transition are reported as
+    rejected rather than failing the request. Work is committed in chunks of
+    BULK_STATUS_CHUNK_SIZE wires.
+    """
+    applied, rejected = await transition_wire_statuses(
+        db=db,
+        user=current_user,
+        target=WireStatus(data.target_status),
+        ids=data.ids,
+        filters=data.filter.model_dump() if data.filter else None,
+        chunk_size=settings.BULK_STATUS_CHUNK_SIZE,
+    )
+    for wire_id in applied:
+        background_tasks.add_task(
+            broadcast_wire_update, wire_id, data.target_status, current_user.id
+        )
+        background_tasks.add_task(
+            audit_log.record,
+            "wire.update",
+            current_user.id,
+            "wire",
+            wire_id,
+            {"status": data.target_status, "bulk": True},
+        )
+    return WireBulkStatusResponse(
+        target_status=data.target_status, applied=applied, rejected=rejected
+    )
+
+
+@router.get("/{wire_id}", response_model=WireResponse, responses=NOT_MODIFIED)
 async def get_wire(
     wire_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
-    """Get a single wire transfer by ID."""
+    """Get a single wire transfer by ID.
+
+    With If-None-Match, only the wire's version is read to decide on a 304.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        current = await get_wire_version(db, wire_id, current_user)
+        if current is not None:
+            etag = wire_etag(current[0])
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
     wire = await get_wire_by_id(db, wire_id, current_user)
 
     if not wire:
@@ -72,62 +274,109 @@ async def get_wire(
             detail=f"Wire with ID {wire_id} not found",
         )
 
+    set_cache_headers(response, wire_etag(wire.version))
     return wire
 
 
-@router.put("/{wire_id}", response_model=WireResponse)
+async def _write_failed(db: AsyncSession, wire_id: int, user: User) -> HTTPException:
+    """Explain why a guarded UPDATE/DELETE matched no row (only runs on failure)."""
+    current = await get_wire_version(db, wire_id, user)
+    if current is None:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Wire with ID {wire_id} not found",
+        )
+    version, archived = current
+    if archived:
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Wire with ID {wire_id} is archived and cannot be modified",
+        )
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Wire with ID {wire_id} was modified (current version {version})",
+        headers={"ETag": wire_etag(version)},
+    )
+
+
+PRECONDITION = {409: {"description": "If-Match did not match the wire's current version"}}
+
+
+@router.put("/{wire_id}", response_model=WireResponse, responses=PRECONDITION)
 async def update_wire(
     wire_id: int,
     wire_data: WireUpdate,
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
-    """Update a wire transfer."""
-    wire = await get_wire_by_id(db, wire_id, current_user)
-
-    if not wire:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Wire with ID {wire_id} not found",
-        )
-
-    # Update fields
-    update_data = wire_data.model_dump(exclude_unset=True)
+    """Update a wire transfer.
 
-    for key, value in update_data.items():
-        if key == "status" and value:
+    One UPDATE ... RETURNING; with If-Match it only applies to that version.
+    """
+    values = wire_data.model_dump(exclude_unset=True)
+    if "status" in values:
+        if values["status"] is None:
+            del values["status"]
+        else:
             try:
-                setattr(wire, key, WireStatus(value))
+                values["status"] = WireStatus(values["status"])
             except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid status: {value}",
+                    detail=f"Invalid status: {values['status']}",
                 )
-        else:
-            setattr(wire, key, value)
 
-    await db.commit()
-    await db.refresh(wire)
+    expected = if_match_versions(request.headers.get("If-Match"))
+    try:
+        wire = await update_wire_guarded(db, wire_id, current_user, values, expected)
+    except ValueError as exc:
+        # Amount not representable in the wire's (new or stored) currency
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    if wire is None:
+        raise await _write_failed(db, wire_id, current_user)
 
+    response.headers["ETag"] = wire_etag(wire.version)
+    changes = {key: getattr(value, "value", value) for key, value in values.items()}
+    if "amount" in changes:
+        changes["amount"] = str(changes["amount"])
+    background_tasks.add_task(
+        audit_log.record, "wire.update", current_user.id, "wire", wire.id, changes
+    )
+    if "status" in values:
+        # get_db commits before the response goes out and background tasks run after
+        # it, so subscribers only hear about committed changes
+        background_tasks.add_task(
+            broadcast_wire_update, wire.id, wire.status.value, current_user.id
+        )
     return wire
 
 
-@router.delete("/{wire_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{wire_id}", status_code=status.HTTP_204_NO_CONTENT, responses=PRECONDITION)
 async def delete_wire(
     wire_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
-    """Delete a wire transfer."""
-    wire = await get_wire_by_id(db, wire_id, current_user)
-
-    if not wire:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Wire with ID {wire_id} not found",
-        )
+    """Delete a wire transfer.
 
-    await db.delete(wire)
-    await db.commit()
+    One DELETE ... RETURNING; with If-Match it only applies to that version.
+    """
+    expected = if_match_versions(request.headers.get("If-Match"))
+    wire = await delete_wire_guarded(db, wire_id, current_user, expected)
+    if wire is None:
+        raise await _write_failed(db, wire_id, current_user)
 
+    background_tasks.add_task(
+        audit_log.record,
+        "wire.delete",
+        current_user.id,
+        "wire",
+        wire.id,
+        {"reference_number": wire.reference_number},
+    )
     return None
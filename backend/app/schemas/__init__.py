@@ -1,6 +1,10 @@
 """Schemas package."""
 
+from app.schemas.analytics import VolumeBucket, VolumeReportResponse
+from app.schemas.audit import AuditEventResponse, AuditLogPage
 from app.schemas.auth import (
+    LogoutRequest,
+    RefreshRequest,
     Token,
     TokenData,
     UserCreate,
@@ -8,9 +12,14 @@ from app.schemas.auth import (
     UserResponse,
 )
 from app.schemas.wire import (
+    WireBulkStatusResponse,
+    WireBulkStatusUpdate,
     WireCreate,
     WireListResponse,
     WireResponse,
+    WireStatusFilter,
+    WireSummaryItem,
+    WireSummaryResponse,
     WireUpdate,
 )
 
@@ -18,10 +27,21 @@ __all__ = [
     "UserCreate",
     "UserLogin",
     "UserResponse",
+    "RefreshRequest",
+    "LogoutRequest",
     "Token",
     "TokenData",
     "WireCreate",
     "WireUpdate",
     "WireResponse",
     "WireListResponse",
+    "WireSummaryItem",
+    "WireSummaryResponse",
+    "WireStatusFilter",
+    "WireBulkStatusUpdate",
+    "WireBulkStatusResponse",
+    "VolumeBucket",
+    "VolumeReportResponse",
+    "AuditEventResponse",
+    "AuditLogPage",
 ]
@@ -0,0 +1,24 @@
+"""Pydantic schemas for analytics reports."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class VolumeBucket(BaseModel):
+    """Schema for one time bucket of the volume report."""
+
+    bucket_start: datetime
+    currency: str
+    status: str
+    wire_count: int
+    total_amount: Decimal
+
+
+class VolumeReportResponse(BaseModel):
+    """Schema for a time-bucketed wire volume report."""
+
+    bucket: str
+    snapshot_generated_at: datetime
+    buckets: list[VolumeBucket]
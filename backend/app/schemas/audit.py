@@ -0,0 +1,28 @@
+"""Pydantic schemas for the audit log."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class AuditEventResponse(BaseModel):
+    """Schema for one audit log entry."""
+
+    id: int
+    occurred_at: datetime
+    action: str
+    actor_id: int | None
+    entity_type: str | None
+    entity_id: int | None
+    details: dict | None
+
+    class Config:
+        from_attributes = True
+
+
+class AuditLogPage(BaseModel):
+    """Schema for a page of audit events, newest first."""
+
+    events: list[AuditEventResponse]
+    # Pass as ``before`` to get the next (older) page; None on the last page
+    next_cursor: int | None
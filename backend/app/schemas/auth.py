@@ -43,6 +43,18 @@ class Token(BaseModel):
     token_type: str = "bearer"
 
 
+class RefreshRequest(BaseModel):
+    """Schema for exchanging a refresh token."""
+
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """Schema for logging out; the refresh token, if given, is revoked too."""
+
+    refresh_token: str | None = None
+
+
 class TokenData(BaseModel):
     """Schema for token payload data."""
 
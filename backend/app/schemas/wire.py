@@ -1,8 +1,14 @@
 """Pydantic schemas for wire transfers."""
 
 from datetime import datetime
+from decimal import Decimal
 
-from pydantic import BaseModel, Field, condecimal
+from pydantic import BaseModel, Field, condecimal, model_validator
+
+from app.utils.money import MAX_EXPONENT, to_minor
+
+# Up to 13 integer digits; places are checked against the currency by check_amount_places
+Amount = condecimal(max_digits=13 + MAX_EXPONENT, decimal_places=MAX_EXPONENT, gt=0)
 
 
 class WireBase(BaseModel):
@@ -10,9 +16,14 @@ class WireBase(BaseModel):
 
     sender_name: str = Field(..., min_length=1, max_length=200)
     recipient_name: str = Field(..., min_length=1, max_length=200)
-    amount: condecimal(max_digits=15, decimal_places=2, gt=0)  # type: ignore
+    amount: Amount  # type: ignore
     currency: str = Field(default="USD", pattern="^[A-Z]{3}$")
 
+    @model_validator(mode="after")
+    def check_amount_places(self):
+        to_minor(self.amount, self.currency)
+        return self
+
 
 class WireCreate(WireBase):
     """Schema for creating a wire transfer."""
@@ -25,10 +36,52 @@ class WireUpdate(BaseModel):
 
     sender_name: str | None = Field(None, min_length=1, max_length=200)
     recipient_name: str | None = Field(None, min_length=1, max_length=200)
-    amount: condecimal(max_digits=15, decimal_places=2, gt=0) | None = None  # type: ignore
+    amount: Amount | None = None  # type: ignore
     currency: str | None = Field(None, pattern="^[A-Z]{3}$")
     status: str | None = Field(None, pattern="^(pending|processing|completed|failed)$")
 
+    @model_validator(mode="after")
+    def check_amount_places(self):
+        # With only one of the two given, the stored value is checked on update
+        if self.amount is not None and self.currency is not None:
+            to_minor(self.amount, self.currency)
+        return self
+
+
+STATUS_PATTERN = "^(pending|processing|completed|failed)$"
+
+
+class WireStatusFilter(BaseModel):
+    """Selects wires for a bulk status change (all conditions ANDed)."""
+
+    status: str | None = Field(None, pattern=STATUS_PATTERN)
+    currency: str | None = Field(None, pattern="^[A-Z]{3}$")
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    reference_prefix: str | None = Field(None, pattern="^[A-Za-z0-9-]+$", max_length=50)
+
+
+class WireBulkStatusUpdate(BaseModel):
+    """Schema for moving many wires to one status: explicit ids or a filter."""
+
+    target_status: str = Field(..., pattern=STATUS_PATTERN)
+    ids: list[int] | None = Field(None, min_length=1, max_length=10000)
+    filter: WireStatusFilter | None = None
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        return self
+
+
+class WireBulkStatusResponse(BaseModel):
+    """Schema for the outcome of a bulk status change."""
+
+    target_status: str
+    applied: list[int]
+    rejected: list[int]
+
 
 class WireResponse(WireBase):
     """Schema for wire transfer response."""
@@ -39,11 +92,30 @@ class WireResponse(WireBase):
     created_by: int
     created_at: datetime
     updated_at: datetime | None
+    version: int
 
     class Config:
         from_attributes = True
 
 
+class WireSummaryItem(BaseModel):
+    """Schema for one status/currency bucket of the wire summary."""
+
+    status: str
+    currency: str
+    wire_count: int
+    total_amount: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+class WireSummaryResponse(BaseModel):
+    """Schema for the per-user wire summary."""
+
+    items: list[WireSummaryItem]
+
+
 class WireListResponse(BaseModel):
     """Schema for paginated wire list response."""
 
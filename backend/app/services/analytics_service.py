@@ -0,0 +1,296 @@
+"""Columnar wire snapshots and vectorized volume aggregation.
+
+Reports read a periodically exported snapshot of the wires table instead of the
+OLTP database. Each snapshot is a directory of ``.npy`` columns, sorted by
+``(created_by, created_at)`` and memory-mapped on load, plus a ``meta.json``
+holding the currency/status dictionaries and each currency's minor-unit
+exponent. ``latest.json`` points at the newest complete snapshot and is
+swapped atomically once the export has finished.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Wire, WireArchive, WireStatus
+from app.utils.money import DEFAULT_EXPONENT, currency_exponent, from_minor
+
+COLUMNS = {
+    "created_by": np.int64,
+    "created_at": np.int64,
+    "amount_minor": np.int64,
+    "currency": np.uint16,
+    "status": np.uint8,
+}
+STATUSES = [status.value for status in WireStatus]
+STATUS_CODES = {status: code for code, status in enumerate(WireStatus)}
+BUCKET_SECONDS = {"day": 86400, "week": 7 * 86400}
+# 1970-01-01 was a Thursday; offsetting by four days aligns weeks to Monday
+BUCKET_ORIGIN = {"day": 0, "week": 4 * 86400}
+EXPORT_CHUNK_SIZE = 50_000
+
+
+@dataclass
+class WireSnapshot:
+    """A loaded (memory-mapped) wire snapshot."""
+
+    path: Path
+    generated_at: datetime
+    currencies: list[str]
+    exponents: list[int]
+    created_by: np.ndarray
+    created_at: np.ndarray
+    amount_minor: np.ndarray
+    currency: np.ndarray
+    status: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.created_by)
+
+
+def _epoch_seconds(value: datetime) -> int:
+    """Convert a (possibly naive, assumed UTC) datetime to epoch seconds."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp())
+
+
+def _wire_history():
+    """Live and archived wires as one subquery; reports cover the full history."""
+    return union_all(
+        select(Wire.created_by, Wire.created_at, Wire.amount_minor, Wire.currency, Wire.status),
+        select(
+            WireArchive.created_by,
+            WireArchive.created_at,
+            WireArchive.amount_minor,
+            WireArchive.currency,
+            WireArchive.status,
+        ),
+    ).subquery()
+
+
+async def export_wire_snapshot(db: AsyncSession, root: Path) -> Path:
+    """Export all wires into a new columnar snapshot under ``root``.
+
+    Only the database reads run on the event loop. Encoding each partition and
+    writing the files run in a worker thread, so an export under the embedded
+    job backend does not stall the API requests sharing the loop.
+    """
+    generated_at = datetime.now(UTC)
+    currencies: dict[str, int] = {}
+    chunks: dict[str, list[np.ndarray]] = {name: [] for name in COLUMNS}
+
+    wires = _wire_history()
+    stream = await db.stream(
+        select(wires)
+        .order_by(wires.c.created_by, wires.c.created_at)
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+    async for partition in stream.partitions():
+        columns = await asyncio.to_thread(_encode_partition, partition, currencies)
+        for name, values in columns.items():
+            chunks[name].append(values)
+
+    return await asyncio.to_thread(_write_snapshot, root, generated_at, chunks, currencies)
+
+
+def _encode_partition(partition, currencies: dict[str, int]) -> dict[str, np.ndarray]:
+    """Turn a partition of wire rows into typed column arrays.
+
+    New currency codes are added to ``currencies``; partitions are encoded one at
+    a time, so the dictionary is never shared between threads.
+    """
+    created_by, created_at, amount_minor, currency, status = zip(*partition, strict=True)
+    columns = {
+        "created_by": created_by,
+        "created_at": [_epoch_seconds(value) for value in created_at],
+        "amount_minor": amount_minor,
+        "currency": [currencies.setdefault(code, len(currencies)) for code in currency],
+        "status": [STATUS_CODES[value] for value in status],
+    }
+    return {name: np.array(columns[name], dtype=dtype) for name, dtype in COLUMNS.items()}
+
+
+def _write_snapshot(
+    root: Path,
+    generated_at: datetime,
+    chunks: dict[str, list[np.ndarray]],
+    currencies: dict[str, int],
+) -> Path:
+    """Write the columns and meta.json, then point latest.json at the new snapshot."""
+    root.mkdir(parents=True, exist_ok=True)
+    target = root / generated_at.strftime("%Y%m%dT%H%M%S%fZ")
+    staging = root / f".{target.name}.tmp"
+    staging.mkdir()
+
+    for name, dtype in COLUMNS.items():
+        values = np.concatenate(chunks[name]) if chunks[name] else np.empty(0, dtype=dtype)
+        np.save(staging / f"{name}.npy", values)
+
+    meta = {
+        "generated_at": generated_at.isoformat(),
+        "rows": int(sum(len(chunk) for chunk in chunks["created_by"])),
+        "currencies": list(currencies),
+        "exponents": [currency_exponent(code) for code in currencies],
+        "statuses": STATUSES,
+    }
+    (staging / "meta.json").write_text(json.dumps(meta))
+    staging.rename(target)
+
+    pointer = root / ".latest.json.tmp"
+    pointer.write_text(json.dumps({"snapshot": target.name}))
+    os.replace(pointer, root / "latest.json")
+
+    _prune_snapshots(root, keep=target.name)
+    return target
+
+
+def _prune_snapshots(root: Path, keep: str, retain: int = 2):
+    """Remove older snapshots, keeping the newest ``retain`` (readers may still map them)."""
+    snapshots = sorted(path for path in root.iterdir() if path.is_dir() and path.name[0] != ".")
+    for path in snapshots[:-retain]:
+        if path.name != keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+# Snapshots are immutable, so mapped snapshots are reused until latest.json moves on
+_loaded: dict[Path, WireSnapshot] = {}
+
+
+def load_latest_snapshot(root: Path) -> WireSnapshot | None:
+    """Memory-map the newest complete snapshot, or return None if none exists."""
+    try:
+        pointer = json.loads((root / "latest.json").read_text())
+    except FileNotFoundError:
+        return None
+
+    path = root / pointer["snapshot"]
+    cached = _loaded.get(root)
+    if cached is not None and cached.path == path:
+        return cached
+
+    meta = json.loads((path / "meta.json").read_text())
+    columns = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in COLUMNS}
+    snapshot = WireSnapshot(
+        path=path,
+        generated_at=datetime.fromisoformat(meta["generated_at"]),
+        currencies=meta["currencies"],
+        # Snapshots from before per-currency exponents stored hundredths throughout
+        exponents=meta.get("exponents", [DEFAULT_EXPONENT] * len(meta["currencies"])),
+        **columns,
+    )
+    _loaded[root] = snapshot
+    return snapshot
+
+
+def aggregate_volume(
+    snapshot: WireSnapshot,
+    user_id: int,
+    bucket: str = "day",
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[dict]:
+    """Sum wire counts and amounts per time bucket, currency and status.
+
+    The user's rows are a contiguous slice of the snapshot (found by binary
+    search), so only that slice is read; grouping is a sort plus reduceat.
+    """
+    lo, hi = np.searchsorted(snapshot.created_by, [user_id, user_id + 1])
+    created_at = snapshot.created_at[lo:hi]
+
+    # Rows within a user are sorted by created_at, so the time window is a slice too
+    first = np.searchsorted(created_at, _epoch_seconds(start)) if start else 0
+    last = np.searchsorted(created_at, _epoch_seconds(end)) if end else len(created_at)
+    window = slice(lo + first, lo + last)
+    if window.start >= window.stop:
+        return []
+
+    width, origin = BUCKET_SECONDS[bucket], BUCKET_ORIGIN[bucket]
+    buckets = (snapshot.created_at[window] - origin) // width
+    currency = snapshot.currency[window].astype(np.int64)
+    status = snapshot.status[window].astype(np.int64)
+    amounts = snapshot.amount_minor[window]
+
+    n_status = len(STATUSES)
+    n_currency = max(len(snapshot.currencies), 1)
+    keys = (buckets * n_currency + currency) * n_status + status
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    totals = np.add.reduceat(amounts[order], starts)
+    counts = np.diff(np.r_[starts, len(sorted_keys)])
+    group_keys = sorted_keys[starts]
+
+    results = []
+    for key, count, total in zip(
+        group_keys.tolist(), counts.tolist(), totals.tolist(), strict=True
+    ):
+        rest, status_code = divmod(key, n_status)
+        bucket_index, currency_code = divmod(rest, n_currency)
+        results.append(
+            {
+                "bucket_start": datetime.fromtimestamp(bucket_index * width + origin, UTC),
+                "currency": snapshot.currencies[currency_code],
+                "status": STATUSES[status_code],
+                "wire_count": count,
+                "total_amount": Decimal(total).scaleb(-snapshot.exponents[currency_code]),
+            }
+        )
+    return results
+
+
+async def aggregate_volume_sql(
+    db: AsyncSession,
+    user_id: int,
+    bucket: str = "day",
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[dict]:
+    """Equivalent GROUP BY against the database, used to benchmark and cross-check."""
+    wires = _wire_history()
+    if db.get_bind().dialect.name == "postgresql":
+        bucket_expr = func.date_trunc(bucket, wires.c.created_at)
+    elif bucket == "week":
+        bucket_expr = func.date(wires.c.created_at, "weekday 0", "-6 days")
+    else:
+        bucket_expr = func.date(wires.c.created_at)
+
+    query = select(
+        bucket_expr.label("bucket"),
+        wires.c.currency,
+        wires.c.status,
+        func.count(),
+        func.sum(wires.c.amount_minor),
+    ).where(wires.c.created_by == user_id)
+    if start:
+        query = query.where(wires.c.created_at >= start)
+    if end:
+        query = query.where(wires.c.created_at < end)
+    query = query.group_by(bucket_expr, wires.c.currency, wires.c.status)
+
+    results = []
+    for bucket_value, currency, status, count, total in await db.execute(query):
+        if isinstance(bucket_value, str):
+            bucket_value = datetime.fromisoformat(bucket_value)
+        if bucket_value.tzinfo is None:
+            bucket_value = bucket_value.replace(tzinfo=UTC)
+        results.append(
+            {
+                "bucket_start": bucket_value,
+                "currency": currency,
+                "status": status.value,
+                "wire_count": count,
+                "total_amount": from_minor(total, currency),
+            }
+        )
+    return results
@@ -0,0 +1,135 @@
+"""Wire retention: archival of old terminal wires and partition upkeep."""
+
+import logging
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import TERMINAL_STATUSES, Wire, WireArchive
+from app.services.wire_service import bump_wires_version
+
+logger = logging.getLogger(__name__)
+
+ARCHIVED_COLUMNS = (
+    "id",
+    "sender_name",
+    "recipient_name",
+    "amount_minor",
+    "currency",
+    "status",
+    "reference_number",
+    "created_by",
+    "created_at",
+    "updated_at",
+    "version",
+)
+
+
+async def archive_terminal_wires(
+    db: AsyncSession,
+    older_than: timedelta,
+    batch_size: int = 1000,
+    max_batches: int | None = None,
+) -> int:
+    """Move completed/failed wires older than ``older_than`` into wires_archive.
+
+    Works in batches of ``batch_size`` rows, committing after each one so row
+    locks are held only briefly; concurrent runs skip each other's locked rows.
+    Returns the number of wires archived.
+    """
+    cutoff = datetime.now(UTC) - older_than
+    archived = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        result = await db.execute(
+            select(Wire.id, Wire.created_by)
+            .where(Wire.status.in_(TERMINAL_STATUSES), Wire.created_at < cutoff)
+            .order_by(Wire.created_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        rows = result.all()
+        if not rows:
+            break
+        ids = [wire_id for wire_id, _ in rows]
+
+        columns = [getattr(Wire, name) for name in ARCHIVED_COLUMNS]
+        await db.execute(
+            insert(WireArchive).from_select(
+                list(ARCHIVED_COLUMNS), select(*columns).where(Wire.id.in_(ids))
+            )
+        )
+        await db.execute(delete(Wire).where(Wire.id.in_(ids)))
+        # Archived wires drop out of their owners' lists
+        await bump_wires_version(db, sorted({user_id for _, user_id in rows}))
+        await db.commit()
+
+        archived += len(ids)
+        batches += 1
+
+    if archived:
+        logger.info("Archived %d terminal wires older than %s", archived, cutoff.isoformat())
+    return archived
+
+
+def partition_name(month: date) -> str:
+    """Name of the monthly wires partition covering ``month``."""
+    return f"wires_y{month.year:04d}m{month.month:02d}"
+
+
+def _add_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+async def _create_partition(db: AsyncSession, name: str, month: date, following: date):
+    start, end = f"'{month.isoformat()} 00:00:00+00'", f"'{following.isoformat()} 00:00:00+00'"
+    create = (
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF wires FOR VALUES FROM ({start}) TO ({end})"
+    )
+    in_range = f"created_at >= {start} AND created_at < {end}"
+
+    # Held to the commit, so no insert can land in wires_default after the check
+    await db.execute(text("LOCK TABLE wires IN ACCESS EXCLUSIVE MODE"))
+    stray = await db.scalar(text(f"SELECT EXISTS (SELECT 1 FROM wires_default WHERE {in_range})"))
+    if not stray:
+        await db.execute(text(create))
+        return
+
+    # Postgres refuses a partition whose rows sit in the default one: move them over
+    await db.execute(text("ALTER TABLE wires DETACH PARTITION wires_default"))
+    await db.execute(text(create))
+    moved = await db.execute(
+        text(
+            f"WITH moved AS (DELETE FROM wires_default WHERE {in_range} RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        )
+    )
+    await db.execute(text("ALTER TABLE wires ATTACH PARTITION wires_default DEFAULT"))
+    logger.info("Moved %d wires from wires_default into %s", moved.rowcount, name)
+
+
+async def ensure_wire_partitions(db: AsyncSession, months_ahead: int = 3) -> list[str]:
+    """Create monthly partitions up to ``months_ahead`` months from now (Postgres only).
+
+    Rows outside every range land in ``wires_default``, so a missed run never
+    rejects inserts; when a partition is created later, those rows are moved
+    into it. Each new partition is committed on its own, holding an exclusive
+    lock on wires only while it is made. Returns the partition names checked.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return []
+
+    month = datetime.now(UTC).date().replace(day=1)
+    names = []
+    for _ in range(months_ahead + 1):
+        following = _add_month(month)
+        name = partition_name(month)
+        if not await db.scalar(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}):
+            await _create_partition(db, name, month, following)
+            await db.commit()
+        names.append(name)
+        month = following
+
+    return names
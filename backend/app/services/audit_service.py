@@ -0,0 +1,220 @@
+"""Buffered audit log: events are queued in memory and written in batches."""
+
+import asyncio
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import AuditLog
+from app.utils.metrics import AUDIT_EVENTS
+
+logger = logging.getLogger(__name__)
+
+RETRY_DELAY_SECONDS = 1
+RETRY_DELAY_MAX_SECONDS = 30
+
+
+def _event(
+    action: str,
+    actor_id: int | None,
+    entity_type: str | None,
+    entity_id: int | None,
+    details: dict | None,
+) -> dict:
+    return {
+        "occurred_at": datetime.now(UTC),
+        "action": action,
+        "actor_id": actor_id,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "details": details,
+    }
+
+
+class AuditLogWriter:
+    """Records audit events off the request path.
+
+    ``record`` only appends to a bounded ``asyncio.Queue``; one background task
+    writes whatever has accumulated as a single multi-row INSERT once
+    ``batch_size`` events are waiting or ``flush_interval`` seconds after the
+    oldest one arrived, whichever comes first. A failed write is retried with
+    backoff and never discarded, so while the database is down the queue
+    fills up and ``overflow`` decides what gives: ``block`` makes callers wait
+    for room, ``drop_newest`` discards the incoming event and ``drop_oldest``
+    the longest-waiting one. ``record_nowait`` never waits, whatever the policy;
+    use it on paths anyone can reach, where waiting would let unauthenticated
+    requests pile up behind a database outage.
+
+    Events still queued when the process dies are lost; ``stop`` flushes
+    everything queued before shutdown. Until ``start`` is called (the
+    FEATURE_AUDIT_LOG flag is off) recording is a no-op.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow: str,
+    ):
+        self.session_factory = session_factory
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.queue: asyncio.Queue[dict] | None = None
+        self._writer: asyncio.Task | None = None
+
+    async def record(
+        self,
+        action: str,
+        actor_id: int | None,
+        entity_type: str | None = None,
+        entity_id: int | None = None,
+        details: dict | None = None,
+    ):
+        if self.queue is None:
+            return
+        event = _event(action, actor_id, entity_type, entity_id, details)
+        if self._offer(event, self.overflow):
+            return
+        AUDIT_EVENTS.labels("blocked").inc()
+        await self.queue.put(event)
+
+    def record_nowait(
+        self,
+        action: str,
+        actor_id: int | None,
+        entity_type: str | None = None,
+        entity_id: int | None = None,
+        details: dict | None = None,
+    ):
+        """``record`` without waiting: a full queue drops the event even under ``block``."""
+        if self.queue is None:
+            return
+        event = _event(action, actor_id, entity_type, entity_id, details)
+        self._offer(event, "drop_newest" if self.overflow == "block" else self.overflow)
+
+    def _offer(self, event: dict, overflow: str) -> bool:
+        """Queue ``event`` if there is room or ``overflow`` drops; False if it must wait."""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if overflow == "block":
+            return False
+        AUDIT_EVENTS.labels("dropped").inc()
+        if overflow == "drop_oldest":
+            self.queue.get_nowait()
+            self.queue.task_done()
+            self.queue.put_nowait(event)
+        return True
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.flush_interval
+            try:
+                async with asyncio.timeout_at(deadline):
+                    while len(batch) < self.batch_size:
+                        batch.append(await self.queue.get())
+            except TimeoutError:
+                pass
+            await self._write(batch)
+            for _ in batch:
+                self.queue.task_done()
+
+    async def _write(self, batch: list[dict]):
+        delay = RETRY_DELAY_SECONDS
+        while True:
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(AuditLog), batch)
+                    await session.commit()
+                AUDIT_EVENTS.labels("written").inc(len(batch))
+                return
+            except Exception:
+                AUDIT_EVENTS.labels("write_error").inc()
+                logger.warning(
+                    "Audit log write of %d events failed; retrying in %ds",
+                    len(batch),
+                    delay,
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RETRY_DELAY_MAX_SECONDS)
+
+    async def start(self):
+        if self._writer is None:
+            self.queue = asyncio.Queue(self.queue_size)
+            self._writer = asyncio.create_task(self._run())
+
+    async def flush(self):
+        """Wait until every event recorded so far has been written."""
+        if self.queue is not None:
+            await self.queue.join()
+
+    async def stop(self, timeout: float):
+        """Flush (for up to ``timeout`` seconds) and stop the writer."""
+        if self._writer is None:
+            return
+        try:
+            async with asyncio.timeout(timeout):
+                await self.flush()
+        except TimeoutError:
+            logger.error("Audit log shutdown lost %d unwritten events", self.queue.qsize())
+        self.queue = None
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+        self._writer = None
+
+
+# Global writer, started in the app lifespan when FEATURE_AUDIT_LOG is on
+audit_log = AuditLogWriter(
+    AsyncSessionLocal,
+    queue_size=settings.AUDIT_LOG_QUEUE_SIZE,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_interval=settings.AUDIT_LOG_FLUSH_SECONDS,
+    overflow=settings.AUDIT_LOG_OVERFLOW,
+)
+
+
+async def get_audit_events(
+    db: AsyncSession,
+    actor_id: int,
+    before: int | None = None,
+    limit: int = 50,
+    action: str | None = None,
+    entity_type: str | None = None,
+    entity_id: int | None = None,
+) -> tuple[list[AuditLog], int | None]:
+    """One page of ``actor_id``'s events, newest first, and the cursor for the next.
+
+    Keyset pagination on id (``id < before``) walks the (actor_id, id) index,
+    so every page costs the same however deep it is.
+    """
+    query = select(AuditLog).where(AuditLog.actor_id == actor_id)
+    if before is not None:
+        query = query.where(AuditLog.id < before)
+    if action:
+        query = query.where(AuditLog.action == action)
+    if entity_type:
+        query = query.where(AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        query = query.where(AuditLog.entity_id == entity_id)
+
+    result = await db.execute(query.order_by(AuditLog.id.desc()).limit(limit + 1))
+    events = list(result.scalars().all())
+    next_cursor = events[limit - 1].id if len(events) > limit else None
+    return events[:limit], next_cursor
@@ -8,27 +8,46 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models import User
 from app.schemas import TokenData
+from app.services.revocation_service import revocations
 from app.utils.security import decode_token
+from app.utils.tracing import traced
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    """Get the current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    token = credentials.credentials
-    payload = decode_token(token)
 
-    if payload is None:
-        raise credentials_exception
+@traced("auth.get_token_payload")
+async def get_token_payload(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> dict:
+    """Verified claims of the bearer access token, rejecting revoked tokens."""
+    payload = decode_token(credentials.credentials)
+
+    # Refresh tokens are only good for /api/auth/refresh
+    if payload is None or payload.get("type") != "access":
+        raise _credentials_exception()
+
+    # Decided in memory unless the token's jti or user is in the revocation filter
+    if await revocations.is_revoked(payload):
+        raise _credentials_exception()
+
+    return payload
+
+
+@traced("auth.get_current_user")
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> User:
+    """Get the current authenticated user from JWT token."""
+    credentials_exception = _credentials_exception()
 
     user_id_str: str | None = payload.get("sub")
     if user_id_str is None:
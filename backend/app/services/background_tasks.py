@@ -1,10 +1,30 @@
-"""Background tasks using Celery."""
+"""Background tasks using Celery.
 
+The task bodies live in app.services.jobs, shared with the embedded job runner.
+"""
+
+import asyncio
 import time
 
+from billiard.process import current_process
 from celery import Celery
+from celery.signals import (
+    after_task_publish,
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
+from prometheus_client import start_http_server
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
+from app.services.jobs import JOBS, SCHEDULE
+from app.utils.metrics import CELERY_TASK_DURATION
+from app.utils.tracing import Span, current_span, instrument_tracing, start_span, tracer
 
 # Create Celery app
 celery_app = Celery(
@@ -19,39 +39,142 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    beat_schedule={
+        name.replace("_", "-"): {"task": name, "schedule": interval}
+        for name, interval in SCHEDULE.items()
+    },
 )
 
 
-@celery_app.task(name="process_wire_async")
-def process_wire_async(wire_id: int) -> dict:
-    """Process wire transfer asynchronously."""
-    # Simulate wire processing (API calls, validation, etc.)
-    time.sleep(5)
+# task_id -> start time, for tasks currently running in this worker process
+_task_started: dict[str, float] = {}
+# task_id -> root span, for sampled tasks currently running in this worker process
+_task_spans: dict[str, Span] = {}
+
+
+@task_prerun.connect
+def _record_task_start(task_id=None, task=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+    # Continues the publisher's trace; tasks published outside one (beat) are sampled here
+    span = tracer.begin(
+        f"celery.task {task.name}",
+        task.request.get("traceparent"),
+        "consumer",
+        {"celery.task": task.name, "celery.task_id": task_id},
+    )
+    if span is not None:
+        _task_spans[task_id] = span
+
+
+@task_postrun.connect
+def _record_task_duration(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is not None:
+        CELERY_TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - started
+        )
+    span = _task_spans.pop(task_id, None)
+    if span is not None:
+        span.error = state != "SUCCESS"
+        tracer.end(span)
+
+
+@before_task_publish.connect
+def _trace_publish(sender=None, headers=None, **kwargs):
+    """Open a publish span and pass it to the worker in the ``traceparent`` header."""
+    span = start_span(
+        f"celery.publish {sender}",
+        "producer",
+        {"celery.task": sender, "celery.task_id": headers["id"]},
+    )
+    if span is not None:
+        headers["traceparent"] = span.traceparent
+
+
+@after_task_publish.connect
+def _end_publish_span(headers=None, **kwargs):
+    # A publish that raised never gets here; its span is discarded with the caller's context
+    span = current_span()
+    if span is not None and span.attributes.get("celery.task_id") == headers["id"]:
+        tracer.end(span)
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _flush_trace_spans(**kwargs):
+    tracer.stop()
+
+
+@worker_process_init.connect
+def _start_metrics_server(**kwargs):
+    """Expose worker metrics over HTTP, one port per pool process (base port + index)."""
+    if settings.CELERY_METRICS_PORT:
+        start_http_server(settings.CELERY_METRICS_PORT + getattr(current_process(), "index", 0))
+
 
-    # In real implementation, this would:
-    # 1. Validate wire details
-    # 2. Call external payment APIs
-    # 3. Update wire status in database
-    # 4. Send notifications
-    # 5. Publish WebSocket event
+async def _run_in_session(func):
+    """Run ``func(session)`` in its own committed session.
 
-    return {
-        "wire_id": wire_id,
-        "status": "completed",
-        "message": "Wire processed successfully",
-    }
+    Each Celery invocation runs a fresh event loop, so pooled connections can't be
+    reused across tasks; a NullPool engine opens and closes one per run.
+    """
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    if settings.TRACING_ENABLED:
+        instrument_tracing(engine.sync_engine)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            result = await func(session)
+            await session.commit()
+            return result
+    finally:
+        await engine.dispose()
 
 
-@celery_app.task(name="send_wire_notification")
+def _run_job(name: str, **kwargs) -> dict:
+    return asyncio.run(_run_in_session(lambda session: JOBS[name](session, **kwargs)))
+
+
+# Same retry policy as the embedded runner: exponential backoff with full jitter
+RETRY_OPTIONS = {
+    "autoretry_for": (Exception,),
+    "max_retries": settings.JOB_MAX_RETRIES,
+    "retry_backoff": settings.JOB_RETRY_BACKOFF_SECONDS,
+    "retry_backoff_max": settings.JOB_RETRY_BACKOFF_MAX_SECONDS,
+    "retry_jitter": True,
+}
+
+
+@celery_app.task(name="process_wire_async", **RETRY_OPTIONS)
+def process_wire_async(wire_id: int) -> dict:
+    """Process wire transfer asynchronously."""
+    return _run_job("process_wire_async", wire_id=wire_id)
+
+
+@celery_app.task(name="send_wire_notification", **RETRY_OPTIONS)
 def send_wire_notification(wire_id: int, user_email: str, status: str) -> dict:
     """Send notification email for wire status change."""
-    # Simulate email sending
-    time.sleep(2)
-
-    # In real implementation, this would send an actual email
-    return {
-        "wire_id": wire_id,
-        "email": user_email,
-        "status": status,
-        "sent": True,
-    }
+    return _run_job("send_wire_notification", wire_id=wire_id, user_email=user_email, status=status)
+
+
+@celery_app.task(name="reconcile_wire_summaries")
+def reconcile_wire_summaries_task() -> dict:
+    """Check the wire summary rollup against the wires table and repair drift."""
+    return _run_job("reconcile_wire_summaries")
+
+
+@celery_app.task(name="export_analytics_snapshot")
+def export_analytics_snapshot_task() -> dict:
+    """Export the wires table to a fresh columnar analytics snapshot."""
+    return _run_job("export_analytics_snapshot")
+
+
+@celery_app.task(name="archive_terminal_wires")
+def archive_terminal_wires_task() -> dict:
+    """Pre-create upcoming wire partitions and archive old completed/failed wires."""
+    return _run_job("archive_terminal_wires")
+
+
+@celery_app.task(name="sweep_stuck_wires")
+def sweep_stuck_wires_task() -> dict:
+    """Re-queue or fail wires stuck in PROCESSING."""
+    return _run_job("sweep_stuck_wires")
@@ -1,9 +1,13 @@
 """Caching service for business logic."""
 
 import json
+import logging
 
+from app.utils.metrics import CACHE_OPERATIONS
 from app.utils.redis_client import RedisCache
 
+logger = logging.getLogger(__name__)
+
 
 class CacheService:
     """High-level caching service."""
@@ -11,12 +15,25 @@ class CacheService:
     def __init__(self, cache: RedisCache):
         self.cache = cache
 
+    async def _get_json(self, family: str, key: str):
+        """Read and decode a cached JSON value, counting hits, misses and errors.
+
+        A failing cache is treated as a miss so callers fall back to the database.
+        """
+        try:
+            cached = await self.cache.get(key)
+        except Exception:
+            CACHE_OPERATIONS.labels(family, "error").inc()
+            logger.warning("Cache read failed for %s", key, exc_info=True)
+            return None
+
+        CACHE_OPERATIONS.labels(family, "hit" if cached else "miss").inc()
+        return json.loads(cached) if cached else None
+
     # Wire caching
     async def get_user_wires(self, user_id: int) -> list[dict] | None:
         """Get cached wire list for user."""
-        key = f"wires:user:{user_id}"
-        cached = await self.cache.get(key)
-        return json.loads(cached) if cached else None
+        return await self._get_json("wires:user", f"wires:user:{user_id}")
 
     async def set_user_wires(self, user_id: int, wires: list[dict], ttl: int = 300):
         """Cache wire list for user (5 min TTL)."""
@@ -30,9 +47,7 @@ class CacheService:
     # Single wire caching
     async def get_wire(self, wire_id: int) -> dict | None:
         """Get cached wire by ID."""
-        key = f"wire:{wire_id}"
-        cached = await self.cache.get(key)
-        return json.loads(cached) if cached else None
+        return await self._get_json("wire", f"wire:{wire_id}")
 
     async def set_wire(self, wire_id: int, wire_data: dict, ttl: int = 600):
         """Cache single wire (10 min TTL)."""
@@ -0,0 +1,233 @@
+"""Wire update events: one broadcast source for WebSocket and Server-Sent Events clients."""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from app.config import settings
+from app.utils.metrics import SSE_CONNECTIONS
+from app.utils.redis_client import RedisCache, cache
+
+logger = logging.getLogger(__name__)
+
+RESYNC_DELAY_SECONDS = 5
+READ_BLOCK_MS = 5000
+
+
+def parse_event_id(event_id: str | None) -> tuple[int, int] | None:
+    """Order key of a Redis stream id (``<ms>-<seq>``); None if malformed."""
+    try:
+        ms, _, seq = (event_id or "").partition("-")
+        return int(ms), int(seq or 0)
+    except ValueError:
+        return None
+
+
+def format_event(event_id: str, event: dict) -> str:
+    """One Server-Sent Events frame."""
+    return f"id: {event_id}\nevent: {event.get('type', 'message')}\ndata: {json.dumps(event)}\n\n"
+
+
+class Subscriber:
+    """One SSE client's bounded queue of (event id, formatted frame) pairs."""
+
+    def __init__(self, user_id: int, maxsize: int):
+        self.user_id = user_id
+        self.queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def offer(self, event_id: str, frame: str):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait((event_id, frame))
+        except asyncio.QueueFull:
+            # Too slow to keep up: end its stream; it resumes from Last-Event-ID
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class WireEventBroker:
+    """Fans wire events out to this worker's SSE and WebSocket clients.
+
+    Events go to a capped Redis stream, so every worker sees every event and
+    a reconnecting client can replay what it missed from its Last-Event-ID.
+    One reader task per worker tails the stream and hands each event to the
+    subscribers of the event's user, so an idle SSE client costs an
+    ``asyncio.Queue`` and no Redis connection of its own. Without Redis the
+    stream is a ``deque`` in this process.
+    """
+
+    def __init__(self, cache: RedisCache, backlog: int, key: str = "wires:events"):
+        self.cache = cache
+        self.backlog = backlog
+        self.key = key
+        self.subscribers: dict[int, set[Subscriber]] = {}
+        self.listeners: list[Callable[[dict], Awaitable[None]]] = []
+        self._memory: deque[tuple[str, dict]] = deque()
+        self._memory_seq = 0
+        self._memory_trimmed: tuple[int, int] = (0, 0)
+        self._reader: asyncio.Task | None = None
+
+    def add_listener(self, listener: Callable[[dict], Awaitable[None]]):
+        """Also deliver every event (all users) to ``listener``, e.g. the WebSocket manager.
+
+        Listeners are awaited inline, before the next event reaches any SSE
+        subscriber, so they must only queue the event and never wait on a client.
+        """
+        self.listeners.append(listener)
+
+    async def publish(self, event: dict):
+        if self.cache.redis:
+            await self.cache.redis.xadd(
+                self.key,
+                {"data": json.dumps(event)},
+                maxlen=self.backlog,
+                approximate=True,
+            )
+            return
+
+        self._memory_seq += 1
+        event_id = f"{self._memory_seq}-0"
+        self._memory.append((event_id, event))
+        if len(self._memory) > self.backlog:
+            self._memory_trimmed = parse_event_id(self._memory.popleft()[0])
+        await self._deliver(event_id, event)
+
+    async def _deliver(self, event_id: str, event: dict):
+        subscribers = self.subscribers.get(event.get("user_id"))
+        if subscribers:
+            # Serialised once, however many streams the user has open
+            frame = format_event(event_id, event)
+            for subscriber in subscribers:
+                subscriber.offer(event_id, frame)
+        for listener in self.listeners:
+            try:
+                await listener(event)
+            except Exception:
+                logger.warning("Wire event listener failed", exc_info=True)
+
+    async def replay(self, last_event_id: str) -> tuple[list[tuple[str, dict]], bool]:
+        """Events after ``last_event_id`` still retained, and whether none were trimmed."""
+        after = parse_event_id(last_event_id)
+        if self.cache.redis:
+            entries = await self.cache.redis.xrange(self.key, min=f"({last_event_id}")
+            events = [(event_id, json.loads(fields["data"])) for event_id, fields in entries]
+            try:
+                info = await self.cache.redis.xinfo_stream(self.key)
+            except Exception:
+                # No stream yet: nothing was ever published, so nothing was missed
+                return events, True
+            trimmed = parse_event_id(info.get("max-deleted-entry-id")) or (0, 0)
+        else:
+            events = [entry for entry in self._memory if parse_event_id(entry[0]) > after]
+            trimmed = self._memory_trimmed
+        return events, after >= trimmed
+
+    async def _last_id(self) -> str:
+        try:
+            info = await self.cache.redis.xinfo_stream(self.key)
+            return info["last-generated-id"]
+        except Exception:
+            return "0-0"
+
+    async def _read(self):
+        last_id = None
+        while True:
+            try:
+                if last_id is None:
+                    last_id = await self._last_id()
+                response = await self.cache.redis.xread({self.key: last_id}, block=READ_BLOCK_MS)
+                for _, entries in response:
+                    for event_id, fields in entries:
+                        last_id = event_id
+                        await self._deliver(event_id, json.loads(fields["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Wire event stream read failed; retrying", exc_info=True)
+                await asyncio.sleep(RESYNC_DELAY_SECONDS)
+
+    async def start(self):
+        """Start tailing the Redis stream; a no-op without Redis."""
+        if self.cache.redis and self._reader is None:
+            self._reader = asyncio.create_task(self._read())
+
+    async def stop(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+
+    def subscribe(self, user_id: int) -> Subscriber:
+        subscriber = Subscriber(user_id, settings.SSE_QUEUE_SIZE)
+        self.subscribers.setdefault(user_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        subscribers = self.subscribers.get(subscriber.user_id)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self.subscribers[subscriber.user_id]
+
+
+# Global broker, sharing the application's Redis connection
+wire_events = WireEventBroker(cache, backlog=settings.WIRE_EVENTS_BACKLOG)
+
+
+async def sse_stream(
+    user_id: int,
+    last_event_id: str | None,
+    until: float,
+    heartbeat: float,
+    broker: WireEventBroker = wire_events,
+) -> AsyncIterator[str]:
+    """Server-Sent Events for one user's wires, ending at ``until`` (a Unix time).
+
+    Subscribes before replaying so nothing published in between is lost, and
+    skips live events the replay already sent. If part of the history after
+    ``last_event_id`` was trimmed away, a ``reset`` event tells the client to
+    reload its state instead. A comment line every ``heartbeat`` seconds keeps
+    proxies from closing an idle stream.
+    """
+    subscriber = broker.subscribe(user_id)
+    SSE_CONNECTIONS.inc()
+    try:
+        yield f"retry: {settings.SSE_RETRY_MS}\n\n"
+        sent = None
+        if last_event_id and parse_event_id(last_event_id) is not None:
+            events, complete = await broker.replay(last_event_id)
+            if not complete:
+                yield "event: reset\ndata: {}\n\n"
+            for event_id, event in events:
+                if event.get("user_id") == user_id:
+                    yield format_event(event_id, event)
+                sent = parse_event_id(event_id)
+
+        while (remaining := until - time.time()) > 0:
+            try:
+                # asyncio.timeout, unlike wait_for, does not spawn a task per event
+                async with asyncio.timeout(min(heartbeat, remaining)):
+                    item = await subscriber.queue.get()
+            except TimeoutError:
+                if until > time.time():
+                    yield ": heartbeat\n\n"
+                continue
+            if item is None:
+                return
+            event_id, frame = item
+            if sent is not None and parse_event_id(event_id) <= sent:
+                continue
+            yield frame
+    finally:
+        broker.unsubscribe(subscriber)
+        SSE_CONNECTIONS.dec()
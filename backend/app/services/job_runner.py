@@ -0,0 +1,205 @@
+"""Embedded asyncio job runner, an in-process alternative to the Celery worker."""
+
+import asyncio
+import itertools
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.services.jobs import JOBS
+from app.utils.metrics import JOB_DURATION, JOB_QUEUE_WAIT
+from app.utils.tracing import current_span, tracer
+
+logger = logging.getLogger(__name__)
+
+
+class JobPriority(IntEnum):
+    """Lower runs first. The values are also valid Celery priorities on the Redis broker."""
+
+    HIGH = 0
+    NORMAL = 3
+    LOW = 6
+
+
+@dataclass
+class Job:
+    name: str
+    kwargs: dict
+    priority: JobPriority
+    attempt: int = 0
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    # Span that submitted the job, when that trace is sampled
+    traceparent: str | None = None
+
+
+class JobRunner:
+    """Runs JOBS on this process's event loop.
+
+    ``concurrency`` workers take jobs from one priority queue holding at most
+    ``queue_size`` waiting jobs; equal priorities run first-in first-out. A job
+    that raises is retried up to ``max_retries`` times after an exponential
+    backoff with full jitter (Celery's ``retry_backoff``), without holding a
+    worker while it waits. Each run gets its own session, committed on success.
+
+    Nothing is persisted: jobs still queued when the process dies are lost,
+    which is the trade for skipping the broker round trip. ``stop`` stops
+    accepting work and drains what is queued, running and awaiting a retry.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        concurrency: int,
+        queue_size: int,
+        max_retries: int,
+        backoff: float,
+        backoff_max: float,
+        jobs: dict[str, Callable[..., Awaitable[dict]]] = JOBS,
+    ):
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.jobs = jobs
+        self.queue: asyncio.PriorityQueue | None = None
+        self._sequence = itertools.count()
+        self._workers: list[asyncio.Task] = []
+        self._delayed: set[asyncio.Task] = set()
+        self._outstanding = 0
+        self._idle = asyncio.Event()
+        self._accepting = False
+
+    async def start(self, schedule: dict[str, int] | None = None):
+        """Start the workers, plus one timer per entry of ``schedule`` (name -> seconds)."""
+        if self._workers:
+            return
+        self.queue = asyncio.PriorityQueue(self.queue_size)
+        self._idle.set()
+        self._accepting = True
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        for name, interval in (schedule or {}).items():
+            self._workers.append(asyncio.create_task(self._every(name, interval)))
+
+    def submit(self, name: str, priority: JobPriority = JobPriority.NORMAL, **kwargs):
+        """Queue ``JOBS[name](session, **kwargs)``.
+
+        Raises ``asyncio.QueueFull`` when ``queue_size`` jobs are already
+        waiting, and RuntimeError when the runner is not running.
+        """
+        if not self._accepting:
+            raise RuntimeError("Job runner is not running")
+        if name not in self.jobs:
+            raise KeyError(f"Unknown job: {name}")
+        parent = current_span()
+        job = Job(name, kwargs, priority, traceparent=parent.traceparent if parent else None)
+        self.queue.put_nowait((priority, next(self._sequence), job))
+        self._outstanding += 1
+        self._idle.clear()
+
+    async def _every(self, name: str, interval: int):
+        while True:
+            await asyncio.sleep(interval)
+            if not self._accepting:
+                return
+            try:
+                self.submit(name, JobPriority.LOW)
+            except asyncio.QueueFull:
+                logger.warning("Job queue full; skipped scheduled %s", name)
+
+    async def _work(self):
+        while True:
+            _, _, job = await self.queue.get()
+            JOB_QUEUE_WAIT.labels(job.priority.name.lower()).observe(
+                time.perf_counter() - job.enqueued_at
+            )
+            started = time.perf_counter()
+            try:
+                with tracer.trace(
+                    f"job {job.name}", job.traceparent, "consumer", {"job.attempt": job.attempt}
+                ):
+                    async with self.session_factory() as session:
+                        await self.jobs[job.name](session, **job.kwargs)
+                        await session.commit()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if job.attempt < self.max_retries:
+                    JOB_DURATION.labels(job.name, "retry").observe(time.perf_counter() - started)
+                    self._retry(job)
+                    continue
+                JOB_DURATION.labels(job.name, "failure").observe(time.perf_counter() - started)
+                logger.exception("Job %s failed after %d attempts", job.name, job.attempt + 1)
+            else:
+                JOB_DURATION.labels(job.name, "success").observe(time.perf_counter() - started)
+            self._done()
+
+    def _retry(self, job: Job):
+        delay = random.uniform(0, min(self.backoff_max, self.backoff * 2**job.attempt))
+        job.attempt += 1
+        logger.warning("Job %s failed; retry %d in %.2fs", job.name, job.attempt, delay)
+        task = asyncio.create_task(self._requeue(job, delay))
+        self._delayed.add(task)
+        task.add_done_callback(self._delayed.discard)
+
+    async def _requeue(self, job: Job, delay: float):
+        await asyncio.sleep(delay)
+        job.enqueued_at = time.perf_counter()
+        # Retries were admitted once already, so they wait for room rather than fail
+        await self.queue.put((job.priority, next(self._sequence), job))
+
+    def _done(self):
+        self._outstanding -= 1
+        if not self._outstanding:
+            self._idle.set()
+
+    async def stop(self, timeout: float):
+        """Stop accepting jobs and wait up to ``timeout`` seconds for the rest to finish."""
+        if not self._workers:
+            return
+        self._accepting = False
+        try:
+            async with asyncio.timeout(timeout):
+                await self._idle.wait()
+        except TimeoutError:
+            logger.warning("Job runner drain timed out with %d jobs unfinished", self._outstanding)
+
+        for task in [*self._workers, *self._delayed]:
+            task.cancel()
+        for task in [*self._workers, *self._delayed]:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._workers = []
+        self._outstanding = 0
+
+
+# Global runner, started in the app lifespan when JOB_BACKEND is "embedded"
+job_runner = JobRunner(
+    AsyncSessionLocal,
+    concurrency=settings.JOB_RUNNER_CONCURRENCY,
+    queue_size=settings.JOB_RUNNER_QUEUE_SIZE,
+    max_retries=settings.JOB_MAX_RETRIES,
+    backoff=settings.JOB_RETRY_BACKOFF_SECONDS,
+    backoff_max=settings.JOB_RETRY_BACKOFF_MAX_SECONDS,
+)
+
+
+def enqueue_job(name: str, priority: JobPriority = JobPriority.NORMAL, **kwargs):
+    """Run job ``name`` in the background on the configured JOB_BACKEND."""
+    if settings.JOB_BACKEND == "embedded":
+        job_runner.submit(name, priority, **kwargs)
+        return
+
+    # Imported here so API processes on the embedded backend never load Celery
+    from app.services.background_tasks import celery_app
+
+    celery_app.send_task(name, kwargs=kwargs, priority=int(priority))
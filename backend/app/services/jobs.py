@@ -0,0 +1,122 @@
+"""Background job functions, shared by the Celery worker and the embedded job runner.
+
+Every job is a coroutine taking an ``AsyncSession`` first; whoever runs it owns
+the session and commits it once the job returns. ``JOBS`` is keyed by the
+Celery task names, so a job enqueued on either backend means the same thing.
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.services.archive_service import archive_terminal_wires, ensure_wire_partitions
+from app.services.summary_service import reconcile_wire_summaries
+from app.services.sweeper_service import sweep_stuck_wires
+
+logger = logging.getLogger(__name__)
+
+# Simulated latency of the payment provider and mail relay
+PROCESSING_SECONDS = 5
+NOTIFICATION_SECONDS = 2
+
+
+async def process_wire(db: AsyncSession, wire_id: int) -> dict:
+    """Process wire transfer asynchronously."""
+    # Simulate wire processing (API calls, validation, etc.) without blocking the loop
+    await asyncio.sleep(PROCESSING_SECONDS)
+
+    # In real implementation, this would:
+    # 1. Validate wire details
+    # 2. Call external payment APIs
+    # 3. Update wire status in database
+    # 4. Send notifications
+    # 5. Publish WebSocket event
+
+    return {
+        "wire_id": wire_id,
+        "status": "completed",
+        "message": "Wire processed successfully",
+    }
+
+
+async def send_wire_notification(
+    db: AsyncSession, wire_id: int, user_email: str, status: str
+) -> dict:
+    """Send notification email for wire status change."""
+    # Simulate email sending
+    await asyncio.sleep(NOTIFICATION_SECONDS)
+
+    # In real implementation, this would send an actual email
+    return {
+        "wire_id": wire_id,
+        "email": user_email,
+        "status": status,
+        "sent": True,
+    }
+
+
+async def reconcile_summaries(db: AsyncSession) -> dict:
+    """Check the wire summary rollup against the wires table and repair drift."""
+    return {"corrected_rows": await reconcile_wire_summaries(db)}
+
+
+async def export_analytics_snapshot(db: AsyncSession) -> dict:
+    """Export the wires table to a fresh columnar analytics snapshot."""
+    # Deferred so API processes only load numpy when they actually need it
+    from app.services.analytics_service import export_wire_snapshot
+
+    path = await export_wire_snapshot(db, Path(settings.ANALYTICS_SNAPSHOT_DIR))
+    return {"snapshot": str(path)}
+
+
+async def archive_wires(db: AsyncSession) -> dict:
+    """Pre-create upcoming wire partitions and archive old completed/failed wires."""
+    try:
+        partitions = await ensure_wire_partitions(db, settings.WIRE_PARTITION_MONTHS_AHEAD)
+    except Exception:
+        # New rows still fit in wires_default; archiving must not wait on this
+        logger.exception("Creating wire partitions failed")
+        await db.rollback()
+        partitions = []
+    archived = await archive_terminal_wires(
+        db,
+        older_than=timedelta(days=settings.WIRE_ARCHIVE_AFTER_DAYS),
+        batch_size=settings.WIRE_ARCHIVE_BATCH_SIZE,
+    )
+    return {"archived": archived, "partitions": partitions}
+
+
+async def sweep_stuck(db: AsyncSession) -> dict:
+    """Re-queue or fail wires stuck in PROCESSING."""
+    # Deferred: the dispatcher imports this module
+    from app.services.job_runner import enqueue_job
+
+    return await sweep_stuck_wires(
+        db,
+        stuck_after=timedelta(seconds=settings.STUCK_WIRE_AFTER_SECONDS),
+        fail_after=timedelta(seconds=settings.STUCK_WIRE_FAIL_AFTER_SECONDS),
+        enqueue=lambda wire_id: enqueue_job("process_wire_async", wire_id=wire_id),
+        batch_size=settings.STUCK_WIRE_BATCH_SIZE,
+    )
+
+
+JOBS = {
+    "process_wire_async": process_wire,
+    "send_wire_notification": send_wire_notification,
+    "reconcile_wire_summaries": reconcile_summaries,
+    "export_analytics_snapshot": export_analytics_snapshot,
+    "archive_terminal_wires": archive_wires,
+    "sweep_stuck_wires": sweep_stuck,
+}
+
+# Periodic jobs and their intervals in seconds (Celery beat, or the embedded scheduler)
+SCHEDULE = {
+    "reconcile_wire_summaries": settings.SUMMARY_RECONCILE_INTERVAL_SECONDS,
+    "export_analytics_snapshot": settings.ANALYTICS_SNAPSHOT_INTERVAL_SECONDS,
+    "archive_terminal_wires": settings.WIRE_ARCHIVE_INTERVAL_SECONDS,
+    "sweep_stuck_wires": settings.STUCK_WIRE_SWEEP_INTERVAL_SECONDS,
+}
@@ -0,0 +1,171 @@
+"""Token revocation by jti and by user, fronted by a per-worker Bloom filter."""
+
+import asyncio
+import logging
+import math
+import time
+
+from app.config import settings
+from app.utils.bloom import BloomFilter
+from app.utils.metrics import REVOCATION_CHECKS
+from app.utils.redis_client import RedisCache, cache
+
+logger = logging.getLogger(__name__)
+
+RESYNC_DELAY_SECONDS = 5
+
+
+class TokenRevocations:
+    """Revoked token ids and per-user cutoffs, stored in Redis.
+
+    Entries are ``{prefix}:jti:<jti>`` (kept until the token would have
+    expired anyway) and ``{prefix}:user:<id>`` holding a timestamp: every
+    token of that user issued at or before it is revoked.
+
+    Checking Redis on every request would add a round trip to each
+    authenticated call, so each worker mirrors the entry names in a Bloom
+    filter. It is loaded from Redis at startup and kept current over pub/sub;
+    a token whose jti and user are both absent from it is accepted without
+    any I/O, and only filter hits (real revocations or rare false positives)
+    are confirmed against Redis. The filter is rebuilt from the live keys
+    whenever it fills up or the subscription reconnects, which also drops
+    entries that have since expired.
+
+    Falls back to this process's memory while Redis is not connected.
+    """
+
+    def __init__(
+        self,
+        cache: RedisCache,
+        capacity: int,
+        error_rate: float,
+        prefix: str = "revoked",
+        channel: str = "auth:revocations",
+    ):
+        self.cache = cache
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.prefix = prefix
+        self.channel = channel
+        self.bloom = BloomFilter(capacity, error_rate)
+        self._memory: dict[str, tuple[float, str]] = {}
+        self._listener: asyncio.Task | None = None
+
+    def _key(self, item: str) -> str:
+        return f"{self.prefix}:{item}"
+
+    async def _store(self, item: str, value: str, ttl: int):
+        self.bloom.add(item)
+        if self.cache.redis:
+            await self.cache.redis.set(self._key(item), value, ex=ttl)
+            await self.cache.redis.publish(self.channel, item)
+        else:
+            self._memory[item] = (time.monotonic() + ttl, value)
+
+    async def revoke_token(self, jti: str, expires_at: float):
+        """Revoke one token until its ``exp`` (a Unix timestamp)."""
+        ttl = math.ceil(expires_at - time.time())
+        if ttl > 0:
+            await self._store(f"jti:{jti}", "1", ttl)
+
+    async def revoke_user(self, user_id: int):
+        """Revoke every token issued to ``user_id`` up to now."""
+        ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+        await self._store(f"user:{user_id}", repr(time.time()), ttl)
+
+    async def _lookup(self, items: list[str]) -> list[str | None]:
+        if self.cache.redis:
+            return await self.cache.redis.mget([self._key(item) for item in items])
+        now = time.monotonic()
+        values = []
+        for item in items:
+            entry = self._memory.get(item)
+            values.append(entry[1] if entry and entry[0] > now else None)
+        return values
+
+    async def is_revoked(self, payload: dict) -> bool:
+        """Whether a decoded token has been revoked, by its ``jti`` or its user."""
+        jti, user_id = payload.get("jti"), payload.get("sub")
+        suspects = [item for item in (f"jti:{jti}", f"user:{user_id}") if item in self.bloom]
+        if not suspects:
+            REVOCATION_CHECKS.labels("clear").inc()
+            return False
+
+        try:
+            values = await self._lookup(suspects)
+        except Exception:
+            # Fail closed: a filter hit might be a real revocation
+            REVOCATION_CHECKS.labels("error").inc()
+            logger.warning("Revocation store unavailable; rejecting token", exc_info=True)
+            return True
+
+        issued_at = payload.get("iat")
+        for item, value in zip(suspects, values):
+            if value is None:
+                continue
+            if item.startswith("jti:") or issued_at is None or issued_at <= float(value):
+                REVOCATION_CHECKS.labels("revoked").inc()
+                return True
+        REVOCATION_CHECKS.labels("false_positive").inc()
+        return False
+
+    async def _reload(self):
+        """Replace the filter with one built from the live Redis keys.
+
+        Grows past the configured capacity when there are more live entries,
+        so a busy revocation list does not trigger a reload on every message.
+        """
+        start = len(self.prefix) + 1
+        items = [
+            key[start:]
+            async for key in self.cache.redis.scan_iter(match=self._key("*"), count=1000)
+        ]
+        bloom = BloomFilter(max(self.capacity, 2 * len(items)), self.error_rate)
+        for item in items:
+            bloom.add(item)
+        self.bloom = bloom
+        logger.info("Revocation filter loaded with %d entries", bloom.count)
+
+    async def _listen(self):
+        while True:
+            pubsub = None
+            try:
+                # Subscribe before loading so nothing published in between is missed
+                pubsub = await self.cache.subscribe(self.channel)
+                await self._reload()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    self.bloom.add(message["data"])
+                    if self.bloom.count > self.bloom.capacity:
+                        await self._reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Revocation sync lost; retrying", exc_info=True)
+                await asyncio.sleep(RESYNC_DELAY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    await pubsub.aclose()
+
+    async def start(self):
+        """Start syncing the filter; a no-op without Redis."""
+        if self.cache.redis and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+# Global revocation list, sharing the application's Redis connection
+revocations = TokenRevocations(
+    cache,
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+)
@@ -0,0 +1,175 @@
+"""Wire summary rollup maintenance."""
+
+import logging
+from collections import defaultdict
+
+from sqlalchemy import func, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Wire, WireArchive, WireStatus, WireSummary
+
+logger = logging.getLogger(__name__)
+
+# (user_id, status, currency) -> (count delta, amount delta in minor units)
+SummaryKey = tuple[int, WireStatus, str]
+SummaryDeltas = dict[SummaryKey, tuple[int, int]]
+
+
+async def _add_to_summaries(db: AsyncSession, rows: SummaryDeltas) -> None:
+    """Add deltas to the rollup counters in one INSERT ... ON CONFLICT statement.
+
+    Only ever adding (never overwriting) keeps concurrent writers' deltas
+    intact, whatever order they commit in.
+    """
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert(WireSummary).values(
+        [
+            {
+                "user_id": user_id,
+                "status": status,
+                "currency": currency,
+                "wire_count": count,
+                "total_minor": amount,
+            }
+            for (user_id, status, currency), (count, amount) in rows.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[WireSummary.user_id, WireSummary.status, WireSummary.currency],
+        set_={
+            "wire_count": WireSummary.wire_count + stmt.excluded.wire_count,
+            "total_minor": WireSummary.total_minor + stmt.excluded.total_minor,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def apply_summary_deltas(db: AsyncSession, deltas: list[tuple[SummaryKey, int, int]]):
+    """Merge per-key deltas (amounts in minor units) and apply them in a single round trip."""
+    merged: dict[SummaryKey, list] = defaultdict(lambda: [0, 0])
+    for key, count, amount in deltas:
+        merged[key][0] += count
+        merged[key][1] += amount
+
+    rows = {key: (count, amount) for key, (count, amount) in merged.items() if count or amount}
+    await _add_to_summaries(db, rows)
+
+
+def _summary_key(wire: Wire) -> SummaryKey:
+    return (wire.created_by, wire.status, wire.currency)
+
+
+async def record_wire_created(db: AsyncSession, wire: Wire):
+    """Add a new wire to its owner's rollup."""
+    await apply_summary_deltas(db, [(_summary_key(wire), 1, wire.amount_minor)])
+
+
+async def record_wire_deleted(db: AsyncSession, wire: Wire):
+    """Remove a deleted wire from its owner's rollup."""
+    await apply_summary_deltas(db, [(_summary_key(wire), -1, -wire.amount_minor)])
+
+
+async def record_wire_updated(
+    db: AsyncSession,
+    wire: Wire,
+    old_status: WireStatus,
+    old_currency: str,
+    old_amount_minor: int,
+):
+    """Move an updated wire's contribution from its old bucket to its new one."""
+    old_key = (wire.created_by, old_status, old_currency)
+    if old_key == _summary_key(wire) and old_amount_minor == wire.amount_minor:
+        return
+
+    await apply_summary_deltas(
+        db,
+        [
+            (old_key, -1, -old_amount_minor),
+            (_summary_key(wire), 1, wire.amount_minor),
+        ],
+    )
+
+
+async def get_wire_summary(db: AsyncSession, user_id: int) -> list[WireSummary]:
+    """Get a user's rollup rows (bounded by statuses x currencies, not by wire count)."""
+    result = await db.execute(
+        select(WireSummary)
+        .where(WireSummary.user_id == user_id, WireSummary.wire_count > 0)
+        .order_by(WireSummary.status, WireSummary.currency)
+    )
+    return list(result.scalars().all())
+
+
+async def _read_truth_and_rollup(executor) -> tuple[SummaryDeltas, SummaryDeltas]:
+    wires = union_all(
+        select(Wire.created_by, Wire.status, Wire.currency, Wire.amount_minor),
+        select(
+            WireArchive.created_by,
+            WireArchive.status,
+            WireArchive.currency,
+            WireArchive.amount_minor,
+        ),
+    ).subquery()
+    truth_result = await executor.execute(
+        select(
+            wires.c.created_by,
+            wires.c.status,
+            wires.c.currency,
+            func.count(),
+            func.coalesce(func.sum(wires.c.amount_minor), 0),
+        ).group_by(wires.c.created_by, wires.c.status, wires.c.currency)
+    )
+    truth = {
+        (user_id, status, currency): (count, int(total))
+        for user_id, status, currency, count, total in truth_result
+    }
+
+    stored_result = await executor.execute(
+        select(
+            WireSummary.user_id,
+            WireSummary.status,
+            WireSummary.currency,
+            WireSummary.wire_count,
+            WireSummary.total_minor,
+        )
+    )
+    stored = {
+        (user_id, status, currency): (count, total)
+        for user_id, status, currency, count, total in stored_result
+    }
+    return truth, stored
+
+
+async def reconcile_wire_summaries(db: AsyncSession) -> int:
+    """Compare the rollup against a GROUP BY over wires and repair any drift.
+
+    Archived wires still belong to their owner's totals, so both the hot and the
+    archive table count as ground truth. On Postgres both are read in one
+    REPEATABLE READ snapshot, and the difference is then added as a delta:
+    writes committed since the snapshot carry their own deltas, so they are
+    neither counted twice nor erased. Returns the number of rows corrected.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        async with db.bind.connect() as conn:
+            conn = await conn.execution_options(isolation_level="REPEATABLE READ")
+            async with conn.begin():
+                truth, stored = await _read_truth_and_rollup(conn)
+    else:
+        truth, stored = await _read_truth_and_rollup(db)
+
+    empty = (0, 0)
+    drift = {}
+    for key in truth.keys() | stored.keys():
+        (count, total), (stored_count, stored_total) = truth.get(key, empty), stored.get(key, empty)
+        if (count, total) != (stored_count, stored_total):
+            drift[key] = (count - stored_count, total - stored_total)
+    if drift:
+        logger.warning("Wire summary drift corrected for %d rows: %s", len(drift), list(drift))
+        await _add_to_summaries(db, drift)
+
+    return len(drift)
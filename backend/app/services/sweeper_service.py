@@ -0,0 +1,101 @@
+"""Stuck-wire sweeper: PROCESSING wires whose worker never finished them."""
+
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Wire, WireStatus
+from app.services.summary_service import apply_summary_deltas
+from app.services.wire_service import bump_wires_version
+from app.utils.metrics import STUCK_WIRES
+
+logger = logging.getLogger(__name__)
+
+
+async def sweep_stuck_wires(
+    db: AsyncSession,
+    stuck_after: timedelta,
+    fail_after: timedelta,
+    enqueue: Callable[[int], None],
+    batch_size: int = 500,
+    max_batches: int | None = None,
+) -> dict:
+    """Re-queue or fail wires that have sat in PROCESSING for ``stuck_after``.
+
+    A stuck wire is handed to ``enqueue(wire_id)`` again, and its updated_at
+    reset so the next sweep gives the new attempt the same grace period; once
+    the wire is older than ``fail_after`` it is marked FAILED instead, which
+    bounds the retries. Candidates come from the partial index on updated_at
+    covering only PROCESSING rows, so a sweep reads just those, never the
+    whole table. Works in batches, committing after each one; concurrent
+    sweeps skip each other's locked rows. Jobs are enqueued after their
+    batch commits. Returns the number of wires re-queued and failed.
+    """
+    now = datetime.now(UTC)
+    cutoff = now - stuck_after
+    give_up = now - fail_after
+    counts = {"requeued": 0, "failed": 0}
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        result = await db.execute(
+            select(Wire.id, Wire.created_by, Wire.currency, Wire.amount_minor, Wire.created_at)
+            .where(Wire.status == WireStatus.PROCESSING, Wire.updated_at < cutoff)
+            .order_by(Wire.updated_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        rows = result.all()
+        if not rows:
+            break
+
+        expired = [row for row in rows if _aware(row.created_at) < give_up]
+        retry = [row.id for row in rows if _aware(row.created_at) >= give_up]
+        if expired:
+            await db.execute(
+                update(Wire)
+                .where(Wire.id.in_([row.id for row in expired]))
+                .values(status=WireStatus.FAILED, version=Wire.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            deltas = []
+            for row in expired:
+                amount = row.amount_minor
+                deltas.append(((row.created_by, WireStatus.PROCESSING, row.currency), -1, -amount))
+                deltas.append(((row.created_by, WireStatus.FAILED, row.currency), 1, amount))
+            await apply_summary_deltas(db, deltas)
+        if retry:
+            await db.execute(
+                update(Wire)
+                .where(Wire.id.in_(retry))
+                .values(updated_at=func.now(), version=Wire.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+        await bump_wires_version(db, sorted({row.created_by for row in rows}))
+        await db.commit()
+
+        for wire_id in retry:
+            enqueue(wire_id)
+        STUCK_WIRES.labels("failed").inc(len(expired))
+        STUCK_WIRES.labels("requeued").inc(len(retry))
+        counts["failed"] += len(expired)
+        counts["requeued"] += len(retry)
+        batches += 1
+
+    if counts["failed"] or counts["requeued"]:
+        logger.warning(
+            "Found %d wires stuck in PROCESSING since before %s: %d re-queued, %d failed",
+            counts["failed"] + counts["requeued"],
+            cutoff.isoformat(),
+            counts["requeued"],
+            counts["failed"],
+        )
+    return counts
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for timezone-aware columns
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
@@ -0,0 +1,227 @@
+"""Refresh-token rotation with reuse detection."""
+
+import enum
+import logging
+import secrets
+import time
+
+from fastapi import HTTPException, status
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.schemas import Token
+from app.services.revocation_service import revocations
+from app.utils.metrics import TOKEN_REFRESHES
+from app.utils.redis_client import RedisCache, cache
+from app.utils.security import create_access_token, create_refresh_token, decode_token
+
+logger = logging.getLogger(__name__)
+
+
+class Rotation(enum.Enum):
+    """Outcome of presenting a refresh token."""
+
+    ROTATED = "rotated"
+    REUSED = "reused"
+    UNKNOWN = "unknown"
+
+
+# KEYS[1] family key; ARGV: presented jti, new jti, ttl seconds.
+# 1 = rotated, -1 = stale jti (family deleted), 0 = no such family
+ROTATE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 0
+end
+if current ~= ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return -1
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+class RefreshTokenFamilies:
+    """Tracks the one valid refresh token (by jti) of every login session.
+
+    Each login starts a family; each refresh swaps its jti for a new one in a
+    single atomic step. Presenting a jti that was already swapped out means the
+    token was copied, so the whole family is revoked and both holders must log
+    in again. Falls back to this process's memory while Redis is not connected.
+
+    A family that cannot be written to Redis is kept in memory too, so logins
+    still work during an outage; its refreshes then only succeed on this
+    process. Rotating and revoking raise ``RedisError`` instead: a session's
+    state must not be guessed.
+
+    The in-memory families are capped at ``max_memory_entries``: when full,
+    expired ones are swept and then the oldest are dropped, whose sessions must
+    log in again.
+    """
+
+    def __init__(
+        self, cache: RedisCache, prefix: str = "refresh:family", max_memory_entries: int = 10000
+    ):
+        self.cache = cache
+        self.prefix = prefix
+        self.max_memory_entries = max_memory_entries
+        self._memory: dict[str, tuple[float, str]] = {}
+
+    def _key(self, family_id: str) -> str:
+        return f"{self.prefix}:{family_id}"
+
+    def _memory_get(self, name: str) -> str | None:
+        entry = self._memory.get(name)
+        if entry is None or entry[0] <= time.monotonic():
+            self._memory.pop(name, None)
+            return None
+        return entry[1]
+
+    def _memory_set(self, name: str, jti: str, ttl: int):
+        # Re-inserted so dict order stays oldest-written first
+        self._memory.pop(name, None)
+        if len(self._memory) >= self.max_memory_entries:
+            now = time.monotonic()
+            for expired in [item for item, entry in self._memory.items() if entry[0] <= now]:
+                del self._memory[expired]
+            while len(self._memory) >= self.max_memory_entries:
+                del self._memory[next(iter(self._memory))]
+        self._memory[name] = (time.monotonic() + ttl, jti)
+
+    async def start(self, family_id: str, jti: str, ttl: int):
+        name = self._key(family_id)
+        if self.cache.redis:
+            try:
+                await self.cache.redis.set(name, jti, ex=ttl)
+                return
+            except RedisError:
+                logger.warning(
+                    "Refresh token store unavailable; keeping family %s in memory",
+                    family_id,
+                    exc_info=True,
+                )
+        self._memory_set(name, jti, ttl)
+
+    async def rotate(self, family_id: str, jti: str, new_jti: str, ttl: int) -> Rotation:
+        name = self._key(family_id)
+        if self.cache.redis:
+            result = await self.cache.redis.eval(ROTATE_SCRIPT, 1, name, jti, new_jti, ttl)
+            outcome = {1: Rotation.ROTATED, -1: Rotation.REUSED}.get(int(result), Rotation.UNKNOWN)
+            if outcome is not Rotation.UNKNOWN or name not in self._memory:
+                return outcome
+
+        # No await between read and write, so this is atomic within the event loop
+        current = self._memory_get(name)
+        if current is None:
+            return Rotation.UNKNOWN
+        if current != jti:
+            del self._memory[name]
+            return Rotation.REUSED
+        self._memory_set(name, new_jti, ttl)
+        return Rotation.ROTATED
+
+    async def revoke(self, family_id: str):
+        name = self._key(family_id)
+        self._memory.pop(name, None)
+        if self.cache.redis:
+            await self.cache.redis.delete(name)
+
+
+# Global family store, sharing the application's Redis connection
+refresh_families = RefreshTokenFamilies(cache)
+
+
+def _new_id() -> str:
+    return secrets.token_urlsafe(16)
+
+
+def _refresh_ttl() -> int:
+    return settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+
+def session_store_unavailable() -> HTTPException:
+    """503 for session changes that cannot be recorded while Redis is unreachable."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Session store unavailable; try again shortly",
+        headers={"Retry-After": "5"},
+    )
+
+
+def _token_pair(user_id: str, email: str | None, family_id: str, jti: str) -> Token:
+    return Token(
+        access_token=create_access_token(data={"sub": user_id, "email": email}),
+        refresh_token=create_refresh_token(
+            data={"sub": user_id, "email": email, "fam": family_id, "jti": jti}
+        ),
+    )
+
+
+async def issue_tokens(user_id: int, email: str) -> Token:
+    """Access and refresh token for a fresh login, starting a new token family."""
+    family_id, jti = _new_id(), _new_id()
+    await refresh_families.start(family_id, jti, _refresh_ttl())
+    return _token_pair(str(user_id), email, family_id, jti)
+
+
+async def revoke_refresh_token(refresh_token: str):
+    """End the login session a refresh token belongs to; unknown tokens are ignored.
+
+    Raises 503 when the session store is unreachable, so the client retries
+    rather than believing the session is over.
+    """
+    payload = decode_token(refresh_token)
+    if payload and payload.get("type") == "refresh" and payload.get("fam"):
+        try:
+            await refresh_families.revoke(payload["fam"])
+        except RedisError:
+            logger.warning("Refresh token store unavailable; logout failed", exc_info=True)
+            raise session_store_unavailable() from None
+
+
+async def rotate_refresh_token(refresh_token: str) -> Token:
+    """Exchange a refresh token for a new pair; no password hash, no database.
+
+    Raises 401 for invalid, expired, revoked or reused tokens, and 503 while
+    the session store is unreachable. Logging out everywhere revokes by user,
+    which covers refresh tokens too.
+    """
+    invalid = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    payload = decode_token(refresh_token)
+    if payload is None or payload.get("type") != "refresh":
+        TOKEN_REFRESHES.labels("invalid").inc()
+        raise invalid
+    user_id, family_id, jti = payload.get("sub"), payload.get("fam"), payload.get("jti")
+    if not (user_id and family_id and jti):
+        # Issued before rotation existed: not tracked, so never accepted
+        TOKEN_REFRESHES.labels("invalid").inc()
+        raise invalid
+    if await revocations.is_revoked(payload):
+        TOKEN_REFRESHES.labels("revoked").inc()
+        raise invalid
+
+    new_jti = _new_id()
+    try:
+        outcome = await refresh_families.rotate(family_id, jti, new_jti, _refresh_ttl())
+    except RedisError:
+        # Fail closed: without the family there is no telling a replay from a refresh
+        TOKEN_REFRESHES.labels("unavailable").inc()
+        logger.warning("Refresh token store unavailable; refusing refresh", exc_info=True)
+        raise session_store_unavailable() from None
+    TOKEN_REFRESHES.labels(outcome.value).inc()
+    if outcome is Rotation.REUSED:
+        logger.warning("Refresh token reuse for user %s; revoked family %s", user_id, family_id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected; please log in again",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if outcome is Rotation.UNKNOWN:
+        raise invalid
+
+    return _token_pair(user_id, payload.get("email"), family_id, new_jti)
@@ -0,0 +1,89 @@
+"""Start-up warm-up so the first requests after a deploy run at steady-state speed."""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.models import User
+from app.services.summary_service import get_wire_summary
+from app.services.wire_service import get_wire_by_id, get_wires_paginated
+from app.utils.security import create_access_token, decode_token, pwd_context
+
+logger = logging.getLogger(__name__)
+
+
+async def _prime_connection(conn: AsyncConnection):
+    """Run the hot-path queries once on ``conn``.
+
+    This fills SQLAlchemy's compiled-statement cache (shared by the engine) and
+    the driver's prepared-statement cache (per connection, on asyncpg). Ids that
+    cannot exist are used, so nothing is read or locked.
+    """
+    nobody = User(id=0, email="")
+    async with AsyncSession(bind=conn) as session:
+        await session.execute(select(User).where(User.id == 0))
+        await session.execute(select(User).where(User.email == ""))
+        await get_wires_paginated(session, nobody, page=1, page_size=20)
+        await get_wire_by_id(session, 0, nobody)
+        await get_wire_summary(session, 0)
+        await session.rollback()
+
+
+async def warm_connection_pool(engine: AsyncEngine, connections: int) -> int:
+    """Open up to ``connections`` pooled connections concurrently and prime each.
+
+    Never opens more than the pool keeps, since overflow connections would just
+    be discarded again. Returns the number of connections warmed.
+    """
+    pool_size = getattr(engine.pool, "size", None)
+    if callable(pool_size):
+        connections = min(connections, pool_size())
+    else:
+        # Static/singleton pools (in-memory SQLite) hold a single connection
+        connections = min(connections, 1)
+
+    opened = [engine.connect() for _ in range(connections)]
+    try:
+        await asyncio.gather(*(conn.start() for conn in opened))
+        await asyncio.gather(*(_prime_connection(conn) for conn in opened))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in opened))
+    return connections
+
+
+def prime_security():
+    """Load the Argon2 and JWT backends, which happens lazily on first use.
+
+    Verifies against a deliberately cheap Argon2 hash: the aim is to load the
+    backend, not to pay for a full-strength hash at start-up.
+    """
+    cheap = pwd_context.handler("argon2").using(memory_cost=8, rounds=1, parallelism=1)
+    pwd_context.verify("warmup", cheap.hash("warmup"))
+    decode_token(create_access_token(data={"sub": "0"}))
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> dict[str, float]:
+    """Warm the connection pool and crypto backends; returns timings in ms.
+
+    Failures are logged rather than raised: a cold start is better than no start.
+    """
+    timings = {}
+
+    started = time.perf_counter()
+    try:
+        warmed = await warm_connection_pool(engine, connections)
+        timings["database_ms"] = (time.perf_counter() - started) * 1000
+        logger.info("Warmed %d database connections in %.0f ms", warmed, timings["database_ms"])
+    except Exception as e:
+        logger.warning("Database warm-up failed: %s", e)
+
+    started = time.perf_counter()
+    try:
+        await asyncio.to_thread(prime_security)
+        timings["security_ms"] = (time.perf_counter() - started) * 1000
+    except Exception as e:
+        logger.warning("Security warm-up failed: %s", e)
+    return timings
@@ -2,11 +2,22 @@
 
 import secrets
 import string
+from collections.abc import AsyncIterator
+from datetime import datetime
+from decimal import Decimal
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import User, Wire, WireStatus
+from app.models import User, Wire, WireArchive, WireStatus, allowed_sources
+from app.models.wire import wires_fts
+from app.services.summary_service import (
+    apply_summary_deltas,
+    record_wire_created,
+    record_wire_deleted,
+    record_wire_updated,
+)
+from app.utils.money import amount_bound_clause, from_minor, minor_bound, to_minor
 
 
 def generate_reference_number(length: int = 12) -> str:
@@ -19,7 +30,7 @@ async def create_wire(
     db: AsyncSession,
     sender_name: str,
     recipient_name: str,
-    amount: float,
+    amount: Decimal,
     currency: str,
     user: User,
 ) -> Wire:
@@ -27,7 +38,9 @@ async def create_wire(
     # Generate unique reference number
     reference_number = generate_reference_number()
 
-    # Ensure reference number is unique
+    # Ensure reference number is unique. The database only enforces
+    # (reference_number, created_at), since wires are partitioned by created_at,
+    # so global uniqueness rests on this check and the generator's randomness alone
     while True:
         result = await db.execute(select(Wire).where(Wire.reference_number == reference_number))
         existing = result.scalar_one_or_none()
@@ -39,24 +52,327 @@ async def create_wire(
     wire = Wire(
         sender_name=sender_name,
         recipient_name=recipient_name,
-        amount=amount,
+        amount_minor=to_minor(amount, currency),
         currency=currency,
         reference_number=reference_number,
         created_by=user.id,
         status=WireStatus.PENDING,
+        # Explicit None so the INSERT doesn't post-fetch the onupdate column
+        updated_at=None,
     )
 
+    # Flush only; get_db commits once the request completes
     db.add(wire)
-    await db.commit()
-    await db.refresh(wire)
+    await db.flush()
+    await record_wire_created(db, wire)
+    await bump_wires_version(db, [user.id])
 
     return wire
 
 
-async def get_wire_by_id(db: AsyncSession, wire_id: int, user: User) -> Wire | None:
-    """Get a wire by ID for the current user."""
+async def bump_wires_version(db: AsyncSession, user_ids: list[int]):
+    """Invalidate the list ETags of ``user_ids`` after their wires changed.
+
+    Loaded User objects (such as the request's current user) are updated in place;
+    ``updated_at`` is kept, since the user's own record did not change.
+
+    The UPDATE locks the users rows until commit, so one user's concurrent wire
+    writes queue behind each other from this point on. Callers run it as their
+    last statement before committing to keep that window short.
+    """
+    await db.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(wires_version=User.wires_version + 1, updated_at=User.updated_at)
+        .execution_options(synchronize_session="evaluate")
+    )
+
+
+async def get_wire_version(db: AsyncSession, wire_id: int, user: User) -> tuple[int, bool] | None:
+    """A wire's (version, archived), without loading the row.
+
+    Used for conditional GETs and to explain why a guarded write matched nothing.
+    """
+    for model, archived in ((Wire, False), (WireArchive, True)):
+        result = await db.execute(
+            select(model.version).where(model.id == wire_id, model.created_by == user.id)
+        )
+        version = result.scalar_one_or_none()
+        if version is not None:
+            return version, archived
+    return None
+
+
+# Columns whose change moves a wire between wire_summaries buckets
+SUMMARY_COLUMNS = frozenset({"status", "currency", "amount_minor"})
+# Attempts for an unguarded update that keeps losing races to concurrent writers
+UPDATE_ATTEMPTS = 3
+
+
+async def update_wire_guarded(
+    db: AsyncSession,
+    wire_id: int,
+    user: User,
+    values: dict,
+    expected_versions: list[int] | None = None,
+) -> Wire | None:
+    """Apply ``values`` with one ``UPDATE ... WHERE id, created_by[, version] RETURNING``.
+
+    ``expected_versions`` (from If-Match) guards against lost updates; None
+    means unconditional. Returns None if no row matched: missing, archived or
+    a version conflict, which the caller tells apart with get_wire_version.
+
+    When a summary column changes, the rollup needs the pre-update values. On
+    Postgres they come back from the same statement through a self-join; SQLite
+    cannot RETURN joined columns, so it reads them first. Either way the update
+    only applies to the version those values were read at.
+
+    A decimal ``amount`` is stored as minor units of the wire's currency. If
+    only one of amount and currency is given, the stored other one is read
+    first (on every dialect) to scale it; ValueError if the amount has more
+    decimal places than the currency allows.
+    """
+    values = dict(values)
+    amount = values.pop("amount", None)
+    rescale = (amount is not None) != ("currency" in values)
+    if amount is not None and not rescale:
+        values["amount_minor"] = to_minor(amount, values["currency"])
+
+    needs_prior = rescale or bool(SUMMARY_COLUMNS & values.keys())
+    postgres = db.get_bind().dialect.name == "postgresql"
+    read_first = needs_prior and (rescale or not postgres)
+    attempts = UPDATE_ATTEMPTS if needs_prior and expected_versions is None else 1
+
+    for _ in range(attempts):
+        prior_columns = ()
+        prior = None
+        conditions = [Wire.id == wire_id, Wire.created_by == user.id]
+        if expected_versions is not None:
+            conditions.append(Wire.version.in_(expected_versions))
+
+        if read_first:
+            result = await db.execute(
+                select(Wire.status, Wire.currency, Wire.amount_minor, Wire.version).where(
+                    Wire.id == wire_id, Wire.created_by == user.id
+                )
+            )
+            prior = result.one_or_none()
+            if prior is None:
+                return None
+            conditions.append(Wire.version == prior.version)
+            if amount is not None and rescale:
+                values["amount_minor"] = to_minor(amount, prior.currency)
+            elif rescale:
+                current = from_minor(prior.amount_minor, prior.currency)
+                values["amount_minor"] = to_minor(current, values["currency"])
+        elif needs_prior:
+            # The joined row is the pre-update snapshot; matching its version makes
+            # a concurrent writer turn this statement into a no-op (retried below)
+            prior_row = Wire.__table__.alias("prior")
+            conditions += [prior_row.c.id == Wire.id, prior_row.c.version == Wire.version]
+            prior_columns = (prior_row.c.status, prior_row.c.currency, prior_row.c.amount_minor)
+
+        stmt = update(Wire).where(*conditions).values(**values, version=Wire.version + 1)
+        result = await db.execute(
+            stmt.returning(Wire, *prior_columns).execution_options(
+                synchronize_session=False, populate_existing=True
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            continue
+
+        wire = row[0]
+        if needs_prior:
+            old_status, old_currency, old_amount = tuple(prior)[:3] if read_first else row[1:]
+            await record_wire_updated(db, wire, old_status, old_currency, old_amount)
+        await bump_wires_version(db, [user.id])
+        return wire
+
+    return None
+
+
+async def delete_wire_guarded(
+    db: AsyncSession, wire_id: int, user: User, expected_versions: list[int] | None = None
+) -> Wire | None:
+    """Delete with one ``DELETE ... WHERE id, created_by[, version] RETURNING``.
+
+    Returns the deleted row, or None if nothing matched (see update_wire_guarded).
+    """
+    stmt = delete(Wire).where(Wire.id == wire_id, Wire.created_by == user.id)
+    if expected_versions is not None:
+        stmt = stmt.where(Wire.version.in_(expected_versions))
+
+    result = await db.execute(stmt.returning(Wire).execution_options(synchronize_session=False))
+    wire = result.scalar_one_or_none()
+    if wire is None:
+        return None
+
+    await record_wire_deleted(db, wire)
+    await bump_wires_version(db, [user.id])
+    return wire
+
+
+async def _candidate_chunks(
+    db: AsyncSession,
+    user: User,
+    ids: list[int] | None,
+    filters: dict | None,
+    chunk_size: int,
+) -> AsyncIterator[list[int]]:
+    """Yield the wire ids a bulk change considers, ``chunk_size`` at a time.
+
+    Explicit ids are used as given (deduplicated, sorted); a filter is walked
+    with keyset pagination on id, so each chunk is one index range scan.
+    """
+    if ids is not None:
+        unique = sorted(set(ids))
+        for start in range(0, len(unique), chunk_size):
+            yield unique[start : start + chunk_size]
+        return
+
+    conditions = [Wire.created_by == user.id]
+    if filters.get("status"):
+        conditions.append(Wire.status == WireStatus(filters["status"]))
+    if filters.get("currency"):
+        conditions.append(Wire.currency == filters["currency"])
+    if filters.get("created_from") is not None:
+        conditions.append(Wire.created_at >= filters["created_from"])
+    if filters.get("created_to") is not None:
+        conditions.append(Wire.created_at < filters["created_to"])
+    if filters.get("reference_prefix"):
+        conditions.append(_reference_prefix_clause(db, filters["reference_prefix"].upper()))
+
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(Wire.id)
+            .where(*conditions, Wire.id > last_id)
+            .order_by(Wire.id)
+            .limit(chunk_size)
+        )
+        chunk = list(result.scalars().all())
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1]
+
+
+async def _transition_chunk(
+    db: AsyncSession, user: User, ids: list[int], target: WireStatus
+) -> list[int]:
+    """Move the wires in ``ids`` whose status allows it to ``target``; returns those moved.
+
+    The state machine is enforced by the UPDATE itself (``status IN (sources)``),
+    so a wire changed concurrently is simply not matched. The rollup needs each
+    wire's old status: on Postgres it comes back through a self-join, while
+    SQLite (no joined columns in RETURNING) reads the rows first. SQLite admits
+    one writer at a time, so the rows read are exactly the rows updated.
+    """
+    sources = allowed_sources(target)
+    if not sources:
+        return []
+
+    stmt = (
+        update(Wire)
+        .where(Wire.created_by == user.id, Wire.id.in_(ids), Wire.status.in_(sources))
+        .values(status=target, version=Wire.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        prior = Wire.__table__.alias("prior")
+        stmt = stmt.where(prior.c.id == Wire.id, prior.c.version == Wire.version)
+        result = await db.execute(
+            stmt.returning(Wire.id, prior.c.status, Wire.currency, Wire.amount_minor)
+        )
+        moved = result.all()
+    else:
+        result = await db.execute(
+            select(Wire.id, Wire.status, Wire.currency, Wire.amount_minor).where(
+                Wire.created_by == user.id, Wire.id.in_(ids), Wire.status.in_(sources)
+            )
+        )
+        moved = result.all()
+        if moved:
+            await db.execute(stmt.where(Wire.id.in_([row.id for row in moved])))
+
+    if not moved:
+        return []
+
+    deltas = []
+    for _, old_status, currency, amount in moved:
+        deltas.append(((user.id, old_status, currency), -1, -amount))
+        deltas.append(((user.id, target, currency), 1, amount))
+    await apply_summary_deltas(db, deltas)
+    await bump_wires_version(db, [user.id])
+    return [row[0] for row in moved]
+
+
+async def transition_wire_statuses(
+    db: AsyncSession,
+    user: User,
+    target: WireStatus,
+    ids: list[int] | None = None,
+    filters: dict | None = None,
+    chunk_size: int = 500,
+) -> tuple[list[int], list[int]]:
+    """Move the selected wires to ``target`` where STATUS_TRANSITIONS allows it.
+
+    Commits after every chunk so row locks are held only briefly; a failure
+    part-way keeps the chunks already applied. Returns (applied, rejected) ids,
+    where rejected covers wires in a disallowed status and, for explicit ids,
+    ids that do not exist or belong to someone else.
+    """
+    applied: list[int] = []
+    rejected: list[int] = []
+    async for chunk in _candidate_chunks(db, user, ids, filters, chunk_size):
+        moved = set(await _transition_chunk(db, user, chunk, target))
+        applied.extend(wire_id for wire_id in chunk if wire_id in moved)
+        rejected.extend(wire_id for wire_id in chunk if wire_id not in moved)
+        await db.commit()
+    return applied, rejected
+
+
+async def get_wire_by_id(
+    db: AsyncSession, wire_id: int, user: User, include_archived: bool = True
+) -> Wire | WireArchive | None:
+    """Get a wire by ID for the current user.
+
+    Falls back to the archive table (one extra query, only on a miss) so wires
+    moved there by the retention job stay readable by id.
+    """
     result = await db.execute(select(Wire).where(Wire.id == wire_id, Wire.created_by == user.id))
-    return result.scalar_one_or_none()
+    wire = result.scalar_one_or_none()
+    if wire is None and include_archived:
+        result = await db.execute(
+            select(WireArchive).where(WireArchive.id == wire_id, WireArchive.created_by == user.id)
+        )
+        wire = result.scalar_one_or_none()
+    return wire
+
+
+def _name_search_clause(db: AsyncSession, search: str):
+    """Case-insensitive substring match on sender or recipient name."""
+    # SQLite: trigram FTS5 shadow table (needs at least three characters per trigram)
+    if db.get_bind().dialect.name == "sqlite" and len(search) >= 3:
+        match = '"' + search.replace('"', '""') + '"'
+        return Wire.id.in_(select(wires_fts.c.rowid).where(wires_fts.c.wires_fts.match(match)))
+
+    # Postgres: ILIKE is served by the pg_trgm GIN indexes on both name columns
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    return or_(
+        Wire.sender_name.ilike(pattern, escape="\\"),
+        Wire.recipient_name.ilike(pattern, escape="\\"),
+    )
+
+
+def _reference_prefix_clause(db: AsyncSession, prefix: str):
+    """Reference-number prefix match that can use a B-tree index."""
+    # SQLite only applies the LIKE optimisation to GLOB on BINARY-collated columns
+    if db.get_bind().dialect.name == "sqlite":
+        return Wire.reference_number.op("GLOB")(f"{prefix}*")
+    return Wire.reference_number.startswith(prefix)
 
 
 async def get_wires_paginated(
@@ -65,17 +381,44 @@ async def get_wires_paginated(
     page: int = 1,
     page_size: int = 20,
     status: str | None = None,
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+    currency: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    search: str | None = None,
+    reference_prefix: str | None = None,
 ) -> tuple[list[Wire], int]:
-    """Get paginated wires for the current user."""
+    """Get paginated wires for the current user.
+
+    Every filter is ANDed with the created_by scope, so each combination is served
+    by one of the created_by-led composite indexes on the wires table.
+    """
     query = select(Wire).where(Wire.created_by == user.id)
 
-    # Filter by status if provided
+    # Filter by status if provided (already validated by the router)
     if status:
-        try:
-            wire_status = WireStatus(status)
-            query = query.where(Wire.status == wire_status)
-        except ValueError:
-            pass  # Invalid status, ignore filter
+        query = query.where(Wire.status == WireStatus(status))
+
+    # Amounts are stored in minor units, so a decimal bound is scaled per currency
+    for bound, lower in ((min_amount, True), (max_amount, False)):
+        if bound is None:
+            continue
+        if currency:
+            limit = minor_bound(bound, currency, lower)
+            query = query.where(Wire.amount_minor >= limit if lower else Wire.amount_minor <= limit)
+        else:
+            query = query.where(amount_bound_clause(Wire.amount_minor, Wire.currency, bound, lower))
+    if currency:
+        query = query.where(Wire.currency == currency)
+    if created_from is not None:
+        query = query.where(Wire.created_at >= created_from)
+    if created_to is not None:
+        query = query.where(Wire.created_at < created_to)
+    if search:
+        query = query.where(_name_search_clause(db, search))
+    if reference_prefix:
+        query = query.where(_reference_prefix_clause(db, reference_prefix))
 
     # Get total count
     count_query = select(func.count()).select_from(query.subquery())
@@ -0,0 +1,72 @@
+"""Entity tags and conditional GET helpers."""
+
+import hashlib
+
+from fastapi import Response
+
+from app.utils.negotiation import JSON, response_media_type
+
+# Per-user data: never stored by shared caches, always revalidated by the client
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag over ``parts``, which must identify the representation exactly.
+
+    The negotiated media type is mixed in, so JSON and MessagePack renderings of
+    the same resource never share a validator.
+    """
+    parts = (*parts, response_media_type.get())
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def wire_etag(version: int) -> str:
+    """ETag of a single wire: its version, which every write bumps.
+
+    Unlike make_etag this stays readable, so If-Match maps back to a version.
+    Non-JSON representations get a suffix (``"3+msgpack"``).
+    """
+    media_type = response_media_type.get()
+    suffix = "" if media_type == JSON else "+" + media_type.rsplit("/", 1)[-1]
+    return f'"{version}{suffix}"'
+
+
+def if_match_versions(if_match: str | None) -> list[int] | None:
+    """Wire versions an If-Match header accepts; None when absent or ``*``.
+
+    Weak tags are accepted too: CompressionMiddleware weakens ETags on
+    compressed responses without changing the version they carry.
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    versions = []
+    for tag in if_match.split(","):
+        value = tag.strip().removeprefix("W/").strip('"').split("+", 1)[0]
+        if value.isdigit():
+            versions.append(int(value))
+    return versions
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag`` (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def set_cache_headers(response: Response, etag: str):
+    """Attach the validator and caching policy to a 200 (or 304) response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.headers["Vary"] = "Authorization"
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the same validator headers as the 200 would."""
+    response = Response(status_code=304)
+    set_cache_headers(response, etag)
+    return response
@@ -0,0 +1,143 @@
+"""Idempotency-Key records: Redis-backed, with an in-process fallback."""
+
+import base64
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+
+from app.utils.redis_client import RedisCache, cache
+
+IN_FLIGHT = "in_flight"
+COMPLETED = "completed"
+
+
+@dataclass
+class IdempotencyRecord:
+    """What is stored under one key: a reservation, then the finished response."""
+
+    state: str
+    fingerprint: str
+    status: int = 0
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    body: bytes = b""
+
+    def dumps(self) -> str:
+        return json.dumps(
+            {
+                "state": self.state,
+                "fingerprint": self.fingerprint,
+                "status": self.status,
+                "headers": self.headers,
+                "body": base64.b64encode(self.body).decode(),
+            }
+        )
+
+    @classmethod
+    def loads(cls, raw: str) -> "IdempotencyRecord":
+        data = json.loads(raw)
+        return cls(
+            state=data["state"],
+            fingerprint=data["fingerprint"],
+            status=data["status"],
+            headers=[tuple(header) for header in data["headers"]],
+            body=base64.b64decode(data["body"]),
+        )
+
+
+def request_fingerprint(method: str, path: str, headers: dict[str, str], body: bytes) -> str:
+    """Hash of everything that must match for a retry to be "the same request"."""
+    digest = hashlib.sha256()
+    for part in (method, path, headers.get("content-type", ""), headers.get("accept", "")):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+    """Stores records in Redis, or in this process while Redis is not connected.
+
+    Reservation is a single ``SET NX``, so exactly one of several concurrent
+    requests with the same key runs; the others see the in-flight record.
+
+    The in-process fallback holds at most ``max_memory_entries`` records:
+    when it is full, expired ones are swept and then the oldest are dropped.
+    """
+
+    def __init__(
+        self, cache: RedisCache, prefix: str = "idempotency", max_memory_entries: int = 10000
+    ):
+        self.cache = cache
+        self.prefix = prefix
+        self.max_memory_entries = max_memory_entries
+        self._memory: dict[str, tuple[float, str]] = {}
+
+    def _key(self, scope: str, key: str) -> str:
+        return f"{self.prefix}:{scope}:{key}"
+
+    def _memory_get(self, name: str) -> str | None:
+        entry = self._memory.get(name)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._memory[name]
+            return None
+        return value
+
+    def _memory_set(self, name: str, value: str, ttl: int):
+        # Re-inserted so dict order stays oldest-written first
+        self._memory.pop(name, None)
+        if len(self._memory) >= self.max_memory_entries:
+            now = time.monotonic()
+            for expired in [item for item, entry in self._memory.items() if entry[0] <= now]:
+                del self._memory[expired]
+            while len(self._memory) >= self.max_memory_entries:
+                del self._memory[next(iter(self._memory))]
+        self._memory[name] = (time.monotonic() + ttl, value)
+
+    async def reserve(
+        self, scope: str, key: str, fingerprint: str, ttl: int
+    ) -> IdempotencyRecord | None:
+        """Claim ``key``; returns None if claimed, else the record already there."""
+        name = self._key(scope, key)
+        value = IdempotencyRecord(state=IN_FLIGHT, fingerprint=fingerprint).dumps()
+        if self.cache.redis:
+            if await self.cache.redis.set(name, value, ex=ttl, nx=True):
+                return None
+            existing = await self.cache.redis.get(name)
+        else:
+            existing = self._memory_get(name)
+            if existing is None:
+                self._memory_set(name, value, ttl)
+                return None
+        # The holder's record can expire between the two calls; report it in flight
+        if existing is None:
+            return IdempotencyRecord(state=IN_FLIGHT, fingerprint=fingerprint)
+        return IdempotencyRecord.loads(existing)
+
+    async def get(self, scope: str, key: str) -> IdempotencyRecord | None:
+        name = self._key(scope, key)
+        raw = await self.cache.redis.get(name) if self.cache.redis else self._memory_get(name)
+        return IdempotencyRecord.loads(raw) if raw else None
+
+    async def complete(self, scope: str, key: str, record: IdempotencyRecord, ttl: int):
+        """Replace the reservation with the finished response."""
+        name = self._key(scope, key)
+        if self.cache.redis:
+            await self.cache.redis.set(name, record.dumps(), ex=ttl)
+        else:
+            self._memory_set(name, record.dumps(), ttl)
+
+    async def release(self, scope: str, key: str):
+        """Drop a reservation so the request can be retried (e.g. after a 5xx)."""
+        name = self._key(scope, key)
+        if self.cache.redis:
+            await self.cache.redis.delete(name)
+        else:
+            self._memory.pop(name, None)
+
+
+# Global store, sharing the application's Redis connection
+idempotency_store = IdempotencyStore(cache)
@@ -0,0 +1,116 @@
+"""Prometheus metrics for the HTTP, database, cache, WebSocket and background job hot paths."""
+
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Buckets tuned for an API whose requests are mostly single-digit milliseconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time by statement type",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_OPERATIONS = Counter(
+    "cache_operations_total",
+    "Cache lookups by key family and result (hit, miss, error)",
+    ["family", "result"],
+)
+WEBSOCKET_CONNECTIONS = Gauge(
+    "websocket_connections_active",
+    "Currently open WebSocket connections",
+)
+SSE_CONNECTIONS = Gauge(
+    "sse_connections_active",
+    "Currently open Server-Sent Events streams",
+)
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task run time by task name and final state",
+    ["task", "state"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Embedded job runner run time by task name and outcome (success, retry, failure)",
+    ["task", "state"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOB_QUEUE_WAIT = Histogram(
+    "job_queue_wait_seconds",
+    "Time embedded jobs spend queued before a worker picks them up, by priority",
+    ["priority"],
+    buckets=LATENCY_BUCKETS,
+)
+STUCK_WIRES = Counter(
+    "stuck_wires_total",
+    "Wires found stuck in PROCESSING by the sweeper, by action taken (requeued, failed)",
+    ["action"],
+)
+AUDIT_EVENTS = Counter(
+    "audit_events_total",
+    "Audit events by outcome (written, blocked = waited for queue room, dropped, write_error)",
+    ["result"],
+)
+TRACE_SPANS = Counter(
+    "trace_spans_total",
+    "Sampled trace spans by outcome (exported, dropped = buffer full, export_error)",
+    ["result"],
+)
+IDEMPOTENT_REQUESTS = Counter(
+    "idempotent_requests_total",
+    "Requests carrying an Idempotency-Key by outcome (stored, replayed, conflict, ...)",
+    ["result"],
+)
+TOKEN_REFRESHES = Counter(
+    "auth_token_refreshes_total",
+    "Refresh token exchanges by outcome (rotated, reused, unknown, revoked, invalid, unavailable)",
+    ["result"],
+)
+REVOCATION_CHECKS = Counter(
+    "auth_revocation_checks_total",
+    "Token revocation checks (clear = Bloom filter miss, no Redis call; "
+    "revoked, false_positive, error)",
+    ["result"],
+)
+
+_OPERATIONS = frozenset({"select", "insert", "update", "delete"})
+
+
+def _operation(statement: str) -> str:
+    """First SQL keyword, bucketed to keep label cardinality fixed."""
+    keyword = statement.lstrip()[:6].lower()
+    return keyword if keyword in _OPERATIONS else "other"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start"].pop()
+    DB_QUERY_DURATION.labels(_operation(statement)).observe(time.perf_counter() - started)
+
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    stack = context.connection.info.get("query_start") if context.connection else None
+    if stack:
+        stack.pop()
+
+
+def instrument_engine(engine: Engine):
+    """Record the duration of every successful statement executed through ``engine``."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
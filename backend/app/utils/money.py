@@ -0,0 +1,101 @@
+"""Money amounts as integer minor units, scaled by each currency's ISO 4217 exponent."""
+
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+
+from sqlalchemy import and_, case, or_
+
+# Currencies whose minor unit is not a hundredth (ISO 4217); all others use 2
+CURRENCY_EXPONENTS = {
+    "BIF": 0,
+    "CLP": 0,
+    "DJF": 0,
+    "GNF": 0,
+    "ISK": 0,
+    "JPY": 0,
+    "KMF": 0,
+    "KRW": 0,
+    "PYG": 0,
+    "RWF": 0,
+    "UGX": 0,
+    "UYI": 0,
+    "VND": 0,
+    "VUV": 0,
+    "XAF": 0,
+    "XOF": 0,
+    "XPF": 0,
+    "BHD": 3,
+    "IQD": 3,
+    "JOD": 3,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "TND": 3,
+}
+DEFAULT_EXPONENT = 2
+MAX_EXPONENT = max(DEFAULT_EXPONENT, *CURRENCY_EXPONENTS.values())
+
+
+def currency_exponent(currency: str) -> int:
+    """Decimal places of ``currency``'s minor unit (2 unless listed above)."""
+    return CURRENCY_EXPONENTS.get(currency, DEFAULT_EXPONENT)
+
+
+def to_minor(amount: Decimal, currency: str) -> int:
+    """Exact minor units of ``amount``; ValueError if it has more places than the currency."""
+    scaled = Decimal(amount).scaleb(currency_exponent(currency))
+    if scaled != scaled.to_integral_value():
+        raise ValueError(
+            f"{currency} amounts allow at most {currency_exponent(currency)} decimal places"
+        )
+    return int(scaled)
+
+
+def from_minor(minor: int, currency: str) -> Decimal:
+    """Decimal amount of ``minor`` units, with exactly the currency's number of places."""
+    return Decimal(minor).scaleb(-currency_exponent(currency))
+
+
+def _exponent_groups() -> dict[int, list[str]]:
+    groups: dict[int, list[str]] = {}
+    for currency, exponent in sorted(CURRENCY_EXPONENTS.items()):
+        groups.setdefault(exponent, []).append(currency)
+    return groups
+
+
+def currency_exponent_sql(currency_column):
+    """SQL expression for the exponent of ``currency_column``, matching currency_exponent."""
+    return case(CURRENCY_EXPONENTS, value=currency_column, else_=DEFAULT_EXPONENT)
+
+
+def _scaled_bound(bound: Decimal, exponent: int, lower: bool) -> int:
+    # Rounded inwards, which is exact because stored amounts are whole minor units
+    rounding = ROUND_CEILING if lower else ROUND_FLOOR
+    return int(Decimal(bound).scaleb(exponent).to_integral_value(rounding))
+
+
+def minor_bound(bound: Decimal, currency: str, lower: bool) -> int:
+    """Minor-unit bound equivalent to ``amount >= bound`` (or ``<=``) in ``currency``."""
+    return _scaled_bound(bound, currency_exponent(currency), lower)
+
+
+def amount_bound_clause(minor_column, currency_column, bound: Decimal, lower: bool):
+    """``amount >= bound`` (or ``<=``) on minor units across currencies of any exponent.
+
+    One branch per exponent, each comparing the column to a constant, so every
+    branch stays an index range scan.
+    """
+
+    def compare(exponent: int):
+        limit = _scaled_bound(bound, exponent, lower)
+        return minor_column >= limit if lower else minor_column <= limit
+
+    groups = _exponent_groups()
+    listed = [currency for currencies in groups.values() for currency in currencies]
+    branches = [
+        and_(currency_column.notin_(listed), compare(DEFAULT_EXPONENT)),
+        *(
+            and_(currency_column.in_(currencies), compare(exponent))
+            for exponent, currencies in groups.items()
+        ),
+    ]
+    return or_(*branches)
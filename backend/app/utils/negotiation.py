@@ -0,0 +1,147 @@
+"""MessagePack content negotiation for API routes."""
+
+import json
+from collections.abc import Callable
+from contextvars import ContextVar
+
+import msgpack
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+MSGPACK_TYPES = {MSGPACK, "application/x-msgpack", "application/vnd.msgpack"}
+
+# Media type of the response being built; part of every ETag (see app.utils.etag)
+response_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON)
+
+
+def _quality(accept: str, media_type: str) -> float:
+    """q-value ``accept`` gives ``media_type``, counting only exact matches."""
+    best = 0.0
+    for item in accept.split(","):
+        name, *params = (part.strip() for part in item.split(";"))
+        if name.lower() != media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        best = max(best, quality)
+    return best
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """Whether the Accept header asks for MessagePack over JSON.
+
+    MessagePack must be named explicitly; wildcards keep the JSON default, and
+    a tie goes to MessagePack since the client bothered to list it.
+    """
+    if not accept:
+        return False
+    accept = accept.lower()
+    msgpack_q = max(_quality(accept, media_type) for media_type in MSGPACK_TYPES)
+    json_q = max(_quality(accept, media_type) for media_type in (JSON, "application/*", "*/*"))
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    return bool(content_type) and content_type.split(";")[0].strip().lower() in MSGPACK_TYPES
+
+
+def is_json(content_type: str | None) -> bool:
+    return bool(content_type) and content_type.split(";")[0].strip().lower() == JSON
+
+
+class MsgPackResponse(Response):
+    """Response rendered with MessagePack instead of JSON."""
+
+    media_type = MSGPACK
+
+    def render(self, content) -> bytes:
+        return msgpack.packb(content)
+
+
+class MsgPackRequest(Request):
+    """Request whose MessagePack body is decoded in place of JSON.
+
+    FastAPI only calls ``json()`` for JSON content types, so the route below
+    presents the request as JSON once the body is known to be MessagePack.
+    """
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body())
+        return self._json
+
+
+def to_msgpack(response: Response) -> Response:
+    """``response`` re-encoded as MessagePack, if it is a complete JSON response.
+
+    Anything else (streams, empty bodies, other media types) is returned as is.
+    """
+    body = getattr(response, "body", None)
+    if not body or not is_json(response.headers.get("content-type")):
+        return response
+    packed = MsgPackResponse(
+        json.loads(body), status_code=response.status_code, background=response.background
+    )
+    packed.raw_headers = [
+        (name, value)
+        for name, value in response.raw_headers
+        if name not in (b"content-length", b"content-type")
+    ] + packed.raw_headers
+    return packed
+
+
+class NegotiatedRoute(APIRoute):
+    """Route that speaks JSON or MessagePack, chosen per request.
+
+    The handler is FastAPI's own, so responses keep its direct-to-bytes JSON
+    path; a client that prefers MessagePack gets that JSON decoded and packed
+    again. Pydantic has no MessagePack serializer, so MessagePack would go
+    through Python objects either way, and the route itself is never altered.
+    Request bodies sent as ``application/msgpack`` are validated exactly like
+    JSON ones.
+    """
+
+    def get_route_handler(self) -> Callable:
+        json_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                scope = dict(request.scope)
+                scope["headers"] = [
+                    (name, JSON.encode() if name == b"content-type" else value)
+                    for name, value in request.scope["headers"]
+                ]
+                request = MsgPackRequest(scope, request.receive)
+
+            if not prefers_msgpack(request.headers.get("accept")):
+                response = await json_handler(request)
+                vary_accept(response)
+                return response
+
+            # Set while the endpoint runs, so ETags it computes name the format
+            token = response_media_type.set(MSGPACK)
+            try:
+                response = to_msgpack(await json_handler(request))
+            finally:
+                response_media_type.reset(token)
+            vary_accept(response)
+            return response
+
+        return handler
+
+
+def vary_accept(response: Response):
+    """Mark ``response`` as depending on the Accept header."""
+    vary = response.headers.get("Vary")
+    if not vary:
+        response.headers["Vary"] = "Accept"
+    elif "accept" not in (value.strip().lower() for value in vary.split(",")):
+        response.headers["Vary"] = f"{vary}, Accept"
@@ -3,6 +3,9 @@
 from redis.asyncio import Redis
 
 from app.config import settings
+from app.utils.tracing import traced
+
+REDIS_SPAN = {"db.system": "redis"}
 
 
 class RedisCache:
@@ -24,25 +27,30 @@ class RedisCache:
         """Disconnect from Redis."""
         if self.redis:
             await self.redis.close()
+            self.redis = None
 
+    @traced("redis GET", "client", REDIS_SPAN)
     async def get(self, key: str) -> str | None:
         """Get value by key."""
         if not self.redis:
             return None
         return await self.redis.get(key)
 
+    @traced("redis SETEX", "client", REDIS_SPAN)
     async def set(self, key: str, value: str, ttl: int = 300):
         """Set key with TTL in seconds (default 5 minutes)."""
         if not self.redis:
             return
         await self.redis.setex(key, ttl, value)
 
+    @traced("redis DEL", "client", REDIS_SPAN)
     async def delete(self, key: str):
         """Delete key."""
         if not self.redis:
             return
         await self.redis.delete(key)
 
+    @traced("redis SCAN DEL", "client", REDIS_SPAN)
     async def delete_pattern(self, pattern: str):
         """Delete all keys matching pattern."""
         if not self.redis:
@@ -53,12 +61,14 @@ class RedisCache:
         if keys:
             await self.redis.delete(*keys)
 
+    @traced("redis PUBLISH", "client", REDIS_SPAN)
     async def publish(self, channel: str, message: str):
         """Publish message to channel."""
         if not self.redis:
             return
         await self.redis.publish(channel, message)
 
+    @traced("redis SUBSCRIBE", "client", REDIS_SPAN)
     async def subscribe(self, channel: str):
         """Subscribe to channel."""
         if not self.redis:
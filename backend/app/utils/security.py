@@ -1,5 +1,7 @@
 """Security utilities for password hashing and JWT tokens."""
 
+import secrets
+import time
 from datetime import datetime, timedelta
 
 from jose import JWTError, jwt
@@ -7,8 +9,15 @@ from passlib.context import CryptContext
 
 from app.config import settings
 
-# Password hashing context (using argon2 - more modern than bcrypt)
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Password hashing context (using argon2 - more modern than bcrypt). Cost parameters
+# come from settings; `python -m benchmarks.argon2_calibration` picks them per host.
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__rounds=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 
 
 def hash_password(password: str) -> str:
@@ -21,23 +30,43 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_rehash(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a password; also return a new hash if the stored one's parameters are stale.
+
+    The second item is None unless the password matched and ``needs_update``
+    reports the hash was made with other cost parameters than the current ones.
+    """
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False, None
+    if pwd_context.needs_update(hashed_password):
+        return True, pwd_context.hash(plain_password)
+    return True, None
+
+
+def _claims(data: dict, expire: datetime, token_type: str) -> dict:
+    """Add expiry and type, plus the issue time and a unique id used for revocation."""
+    to_encode = data.copy()
+    # Fractional iat, so a token issued right after a per-user revocation survives it
+    to_encode.update({"exp": expire, "iat": time.time(), "type": token_type})
+    to_encode.setdefault("jti", secrets.token_urlsafe(16))
+    return to_encode
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
-    to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode = _claims(data, expire, "access")
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
 
 def create_refresh_token(data: dict) -> str:
     """Create a JWT refresh token."""
-    to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode = _claims(data, expire, "refresh")
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
@@ -0,0 +1,407 @@
+"""Sampled tracing: spans propagated through contextvars and exported as OTLP JSON.
+
+A trace starts at an HTTP request or a background job. Whether it is recorded
+is decided once, there: an incoming W3C ``traceparent`` header keeps the
+caller's decision, otherwise ``sample_rate`` of traces are kept. Only sampled
+traces put a span in the context, so in the others every instrumented call
+costs one ContextVar lookup.
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+import urllib.request
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.utils.metrics import TRACE_SPANS
+
+logger = logging.getLogger(__name__)
+
+# OTLP SpanKind values
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3, "producer": 4, "consumer": 5}
+# Longest db.statement attribute kept on a span
+MAX_STATEMENT_LENGTH = 1000
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    parent_id: str | None = None
+    kind: str = "internal"
+    attributes: dict = field(default_factory=dict)
+    span_id: str = field(default_factory=_new_span_id)
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int = 0
+    error: bool = False
+    token: Token | None = field(default=None, repr=False)
+
+    @property
+    def traceparent(self) -> str:
+        """W3C trace context header naming this span as the parent."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def child(self, name: str, kind: str = "internal", attributes: dict | None = None) -> "Span":
+        return Span(name, self.trace_id, self.span_id, kind, dict(attributes or {}))
+
+
+_current: ContextVar[Span | None] = ContextVar("trace_span", default=None)
+
+
+def current_span() -> Span | None:
+    """The active span, or None when the current trace is not sampled."""
+    return _current.get()
+
+
+def parse_traceparent(header: str) -> tuple[str, str, bool] | None:
+    """``(trace_id, parent_span_id, sampled)`` from a traceparent header, if valid."""
+    parts = header.strip().split("-")
+    if len(parts) < 4 or len(parts[0]) != 2 or parts[0] == "ff":
+        return None
+    _, trace_id, span_id, flags = parts[:4]
+    if len(trace_id) != 32 or len(span_id) != 16 or len(flags) != 2:
+        return None
+    try:
+        if not int(trace_id, 16) or not int(span_id, 16):
+            return None
+        sampled = bool(int(flags, 16) & 1)
+    except ValueError:
+        return None
+    return trace_id.lower(), span_id.lower(), sampled
+
+
+def _attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def otlp_payload(spans: list[Span], service_name: str) -> dict:
+    """An OTLP/HTTP JSON ExportTraceServiceRequest carrying ``spans``."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_attribute("service.name", service_name)]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [
+                            {
+                                "traceId": span.trace_id,
+                                "spanId": span.span_id,
+                                "parentSpanId": span.parent_id or "",
+                                "name": span.name,
+                                "kind": SPAN_KINDS[span.kind],
+                                "startTimeUnixNano": str(span.start_ns),
+                                "endTimeUnixNano": str(span.end_ns),
+                                "attributes": [
+                                    _attribute(key, value) for key, value in span.attributes.items()
+                                ],
+                                "status": {"code": 2 if span.error else 1},
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class FileExporter:
+    """Appends one OTLP JSON request per export to a local file (JSON Lines).
+
+    The OpenTelemetry Collector's ``otlpjsonfile`` receiver reads this format.
+    """
+
+    def __init__(self, path: str, service_name: str):
+        self.path = path
+        self.service_name = service_name
+
+    def export(self, spans: list[Span]):
+        line = json.dumps(otlp_payload(spans, self.service_name), separators=(",", ":"))
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+class OTLPExporter:
+    """POSTs OTLP JSON to a collector's OTLP/HTTP traces endpoint."""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def export(self, spans: list[Span]):
+        body = json.dumps(otlp_payload(spans, self.service_name)).encode()
+        request = urllib.request.Request(
+            self.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class Tracer:
+    """Makes the sampling decision and exports finished spans.
+
+    Finished spans go to a bounded buffer (the oldest are dropped when it is
+    full); a daemon thread exports it every ``export_interval`` seconds, so
+    neither the event loop nor a Celery task ever waits on the exporter. The
+    thread is started by the first finished span in each process, which also
+    covers forked Celery workers. With no exporter, nothing is ever sampled.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float,
+        exporter: FileExporter | OTLPExporter | None,
+        queue_size: int = 10000,
+        export_interval: float = 5.0,
+    ):
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        self.export_interval = export_interval
+        self.spans: deque[Span] = deque(maxlen=queue_size)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def begin(
+        self,
+        name: str,
+        traceparent: str | None = None,
+        kind: str = "server",
+        attributes: dict | None = None,
+    ) -> Span | None:
+        """Start a trace's local root span and make it current, if the trace is sampled.
+
+        Pass the caller's ``traceparent`` to continue its trace. Every span
+        returned must be handed to ``end`` in the same context.
+        """
+        if self.exporter is None:
+            return None
+        parent = parse_traceparent(traceparent) if traceparent else None
+        if parent is None:
+            if random.random() >= self.sample_rate:
+                return None
+            span = Span(name, _new_trace_id(), None, kind, attributes or {})
+        elif parent[2]:
+            span = Span(name, parent[0], parent[1], kind, attributes or {})
+        else:
+            return None
+        span.token = _current.set(span)
+        return span
+
+    @contextmanager
+    def trace(
+        self,
+        name: str,
+        traceparent: str | None = None,
+        kind: str = "server",
+        attributes: dict | None = None,
+    ) -> Iterator[Span | None]:
+        """``begin`` and ``end`` around the block, marking the span failed if it raises."""
+        root = self.begin(name, traceparent, kind, attributes)
+        if root is None:
+            yield None
+            return
+        try:
+            yield root
+        except BaseException:
+            root.error = True
+            raise
+        finally:
+            self.end(root)
+
+    def end(self, span: Span):
+        _current.reset(span.token)
+        span.token = None
+        self.finish(span)
+
+    def finish(self, span: Span):
+        span.end_ns = time.time_ns()
+        if self._pid != os.getpid():
+            self.start()
+        if len(self.spans) == self.spans.maxlen:
+            TRACE_SPANS.labels("dropped").inc()
+        self.spans.append(span)
+
+    def start(self):
+        """Start this process's export thread (``finish`` does so on first use)."""
+        with self._lock:
+            if self._pid == os.getpid() or self.exporter is None:
+                return
+            self._pid = os.getpid()
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.export_interval):
+            self.flush()
+
+    def flush(self):
+        """Export every buffered span now."""
+        batch = []
+        while self.spans:
+            batch.append(self.spans.popleft())
+        if not batch:
+            return
+        try:
+            self.exporter.export(batch)
+        except Exception:
+            TRACE_SPANS.labels("export_error").inc(len(batch))
+            logger.warning("Exporting %d trace spans failed", len(batch), exc_info=True)
+        else:
+            TRACE_SPANS.labels("exported").inc(len(batch))
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the export thread and export what is left."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join(timeout)
+            self._thread = None
+            self._pid = None
+        if self.exporter is not None:
+            self.flush()
+
+
+def start_span(name: str, kind: str = "internal", attributes: dict | None = None) -> Span | None:
+    """Start a child of the current span and make it current; finish it with ``tracer.end``.
+
+    Returns None, recording nothing, outside a sampled trace.
+    """
+    parent = _current.get()
+    if parent is None:
+        return None
+    child = parent.child(name, kind, attributes)
+    child.token = _current.set(child)
+    return child
+
+
+@contextmanager
+def span(
+    name: str, kind: str = "internal", attributes: dict | None = None
+) -> Iterator[Span | None]:
+    """Time the block as a child of the current span (see ``start_span``)."""
+    child = start_span(name, kind, attributes)
+    if child is None:
+        yield None
+        return
+    try:
+        yield child
+    except BaseException:
+        child.error = True
+        raise
+    finally:
+        tracer.end(child)
+
+
+def traced(name: str, kind: str = "internal", attributes: dict | None = None) -> Callable:
+    """Decorate a coroutine function to run in its own span when sampled."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return await func(*args, **kwargs)
+            # Inlined rather than ``with span(...)``, which costs a generator per call
+            child = start_span(name, kind, attributes)
+            try:
+                return await func(*args, **kwargs)
+            except BaseException:
+                child.error = True
+                raise
+            finally:
+                tracer.end(child)
+
+        return wrapper
+
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    parent = _current.get()
+    child = None
+    if parent is not None:
+        words = statement.split()
+        child = parent.child(
+            f"db {words[0].upper() if words else 'statement'}",
+            "client",
+            {
+                "db.system": conn.dialect.name,
+                "db.statement": " ".join(words)[:MAX_STATEMENT_LENGTH],
+            },
+        )
+    conn.info.setdefault("trace_spans", []).append(child)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    child = conn.info["trace_spans"].pop()
+    if child is not None:
+        tracer.finish(child)
+
+
+def _handle_error(context):
+    stack = context.connection.info.get("trace_spans") if context.connection else None
+    if stack:
+        child = stack.pop()
+        if child is not None:
+            child.error = True
+            tracer.finish(child)
+
+
+def instrument_tracing(engine: Engine):
+    """Record statements executed through ``engine`` as spans of the current trace."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _exporter() -> FileExporter | OTLPExporter | None:
+    if not settings.TRACING_ENABLED:
+        return None
+    if settings.TRACING_EXPORTER == "otlp":
+        return OTLPExporter(settings.TRACING_OTLP_ENDPOINT, settings.TRACING_SERVICE_NAME)
+    return FileExporter(settings.TRACING_FILE_PATH, settings.TRACING_SERVICE_NAME)
+
+
+# Global tracer; samples nothing unless TRACING_ENABLED
+tracer = Tracer(
+    settings.TRACING_SAMPLE_RATE,
+    _exporter(),
+    queue_size=settings.TRACING_QUEUE_SIZE,
+    export_interval=settings.TRACING_EXPORT_INTERVAL_SECONDS,
+)
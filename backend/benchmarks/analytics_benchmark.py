@@ -0,0 +1,136 @@
+"""Benchmark snapshot aggregation against the equivalent SQL GROUP BY.
+
+Usage (from backend/):
+    python -m benchmarks.analytics_benchmark --rows 1000000
+    python -m benchmarks.analytics_benchmark --database-url postgresql+asyncpg://...
+
+Without --database-url a temporary SQLite database is created and seeded. With
+a URL, the existing wires of --user-id are used as-is.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.database import Base
+from app.models import User, Wire, WireStatus
+from app.services.analytics_service import (
+    aggregate_volume,
+    aggregate_volume_sql,
+    export_wire_snapshot,
+    load_latest_snapshot,
+)
+
+
+async def seed(session: AsyncSession, rows: int, users: int, days: int):
+    """Insert ``rows`` synthetic wires spread over ``users`` users and ``days`` days."""
+    await session.execute(
+        insert(User),
+        [
+            {"id": i, "email": f"bench{i}@example.com", "hashed_password": "x", "is_active": True}
+            for i in range(1, users + 1)
+        ],
+    )
+    rng = random.Random(42)
+    start = datetime.now(UTC) - timedelta(days=days)
+    statuses = list(WireStatus)
+    batch = []
+    for i in range(rows):
+        batch.append(
+            {
+                "sender_name": "Sender",
+                "recipient_name": "Recipient",
+                "amount_minor": rng.randint(100, 10_000_000),
+                "currency": rng.choice(("USD", "EUR", "GBP", "JPY")),
+                "status": rng.choice(statuses),
+                "reference_number": f"WIRE-B{i:011d}",
+                "created_by": 1 if i % 2 else rng.randint(1, users),
+                "created_at": start + timedelta(seconds=rng.randint(0, days * 86400)),
+            }
+        )
+        if len(batch) == 50_000:
+            await session.execute(insert(Wire), batch)
+            batch.clear()
+    if batch:
+        await session.execute(insert(Wire), batch)
+    await session.commit()
+
+
+def timed(func, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def timed_async(func, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def summarise(samples: list[float]) -> dict:
+    return {"median_ms": round(statistics.median(samples), 2), "min_ms": round(min(samples), 2)}
+
+
+async def main(args: argparse.Namespace):
+    workdir = Path(tempfile.mkdtemp(prefix="wire-analytics-bench-"))
+    url = args.database_url or f"sqlite+aiosqlite:///{workdir / 'bench.db'}"
+    engine = create_async_engine(url)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        if not args.database_url:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            await seed(session, args.rows, args.users, args.days)
+
+        started = time.perf_counter()
+        await export_wire_snapshot(session, workdir / "snapshots")
+        export_ms = (time.perf_counter() - started) * 1000
+        snapshot = load_latest_snapshot(workdir / "snapshots")
+
+        report = {"rows": len(snapshot), "export_ms": round(export_ms, 2), "buckets": {}}
+        for bucket in ("day", "week"):
+            numpy_samples = timed(
+                lambda bucket=bucket: aggregate_volume(snapshot, args.user_id, bucket),
+                args.repeat,
+            )
+            sql_samples = await timed_async(
+                lambda bucket=bucket: aggregate_volume_sql(session, args.user_id, bucket),
+                args.repeat,
+            )
+            report["buckets"][bucket] = {
+                "numpy": summarise(numpy_samples),
+                "sql": summarise(sql_samples),
+                "speedup": round(
+                    statistics.median(sql_samples) / statistics.median(numpy_samples), 1
+                ),
+            }
+
+    await engine.dispose()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Benchmark an existing database instead")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
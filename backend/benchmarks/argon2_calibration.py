@@ -0,0 +1,94 @@
+"""Pick Argon2 cost parameters that hit a target verify time on this host.
+
+Usage (from backend/, on the instance type that will serve logins):
+    python -m benchmarks.argon2_calibration
+    python -m benchmarks.argon2_calibration --target-ms 150 --max-memory-mib 128
+
+Follows the RFC 9106 procedure: fix the parallelism (default: the CPU count,
+at most 4), use as much memory as --max-memory-mib allows, then raise the time
+cost while a verify still fits in --target-ms. When a single pass at full
+memory is already too slow, memory is halved until it fits (down to 8 MiB).
+
+Prints the chosen values as Settings lines for the environment or .env file,
+followed by the measurements as JSON on stderr. Stored hashes made with other
+parameters are upgraded on each user's next successful login.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from passlib.hash import argon2
+
+PASSWORD = "calibration-password-1"
+MIN_MEMORY_KIB = 8 * 1024
+
+
+def verify_ms(time_cost: int, memory_kib: int, parallelism: int, samples: int) -> float:
+    """Median wall time of verifying a password against a hash made with these costs."""
+    hasher = argon2.using(rounds=time_cost, memory_cost=memory_kib, parallelism=parallelism)
+    hashed = hasher.hash(PASSWORD)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        argon2.verify(PASSWORD, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(
+    target_ms: float, max_memory_kib: int, parallelism: int, samples: int, max_time_cost: int
+) -> tuple[dict, float, list[dict]]:
+    trials = []
+
+    def trial(time_cost: int, memory_kib: int) -> float:
+        elapsed = verify_ms(time_cost, memory_kib, parallelism, samples)
+        trials.append({"time_cost": time_cost, "memory_kib": memory_kib, "verify_ms": elapsed})
+        return elapsed
+
+    memory_kib = max_memory_kib
+    while trial(1, memory_kib) > target_ms and memory_kib // 2 >= MIN_MEMORY_KIB:
+        memory_kib //= 2
+
+    # The most expensive time cost that still fits the budget, up to the cap
+    time_cost = 1
+    verify = trials[-1]["verify_ms"]
+    while time_cost < max_time_cost:
+        elapsed = trial(time_cost + 1, memory_kib)
+        if elapsed > target_ms:
+            break
+        time_cost, verify = time_cost + 1, elapsed
+
+    chosen = {
+        "ARGON2_TIME_COST": time_cost,
+        "ARGON2_MEMORY_COST": memory_kib,
+        "ARGON2_PARALLELISM": parallelism,
+    }
+    return chosen, verify, trials
+
+
+def main(args: argparse.Namespace):
+    chosen, verify, trials = calibrate(
+        args.target_ms,
+        args.max_memory_mib * 1024,
+        args.parallelism,
+        args.samples,
+        args.max_time_cost,
+    )
+    for name, value in chosen.items():
+        print(f"{name}={value}")
+    report = {"target_ms": args.target_ms, "verify_ms": verify, "trials": trials}
+    print(json.dumps(report, indent=2), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--max-memory-mib", type=int, default=64)
+    parser.add_argument("--parallelism", type=int, default=min(os.cpu_count() or 1, 4))
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--max-time-cost", type=int, default=10)
+    main(parser.parse_args())
@@ -0,0 +1,103 @@
+"""CPU cost of renewing access tokens: password login versus refresh token.
+
+Usage (from backend/):
+    python -m benchmarks.auth_benchmark
+    python -m benchmarks.auth_benchmark --renewals 200 --active-hours 8
+
+Drives the app in-process (httpx.ASGITransport, temporary SQLite database) and
+times --renewals sequential renewals each way, measuring this process's CPU
+time: POST /api/auth/login (an Argon2 verify plus a user lookup) and
+POST /api/auth/refresh (JWT checks plus one store lookup; the in-memory store
+here, one Redis round trip in production). The client's own share is included
+in both and is small next to the hash.
+
+Reports, as JSON, CPU ms and wall ms per renewal for each path. It also gives
+the CPU seconds one user costs per active day: that user renews once every
+ACCESS_TOKEN_EXPIRE_MINUTES for --active-hours.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.http_benchmark import _create_sqlite_schema
+
+EMAIL = "auth-bench@example.com"
+PASSWORD = "auth-bench-password-1"
+
+
+async def measure(call, count: int) -> dict:
+    cpu_started = time.process_time()
+    wall = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await call()
+        wall.append((time.perf_counter() - started) * 1000)
+    cpu_ms = (time.process_time() - cpu_started) * 1000 / count
+    return {"cpu_ms": round(cpu_ms, 3), "wall_p50_ms": round(statistics.median(wall), 3)}
+
+
+async def main(args: argparse.Namespace):
+    os.environ.setdefault("DEBUG", "false")
+    workdir = Path(tempfile.mkdtemp(prefix="wire-auth-bench-"))
+    url = f"sqlite+aiosqlite:///{workdir / 'bench.db'}"
+    # Must be set before app.config is first imported
+    os.environ["DATABASE_URL"] = url
+    await _create_sqlite_schema(url)
+
+    from app.config import settings
+    from app.main import app
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        response = await client.post(
+            "/api/auth/register", json={"email": EMAIL, "password": PASSWORD}
+        )
+        response.raise_for_status()
+
+        async def login():
+            response = await client.post(
+                "/api/auth/login", json={"email": EMAIL, "password": PASSWORD}
+            )
+            response.raise_for_status()
+            return response.json()["refresh_token"]
+
+        refresh_token = await login()
+
+        async def refresh():
+            nonlocal refresh_token
+            response = await client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+            response.raise_for_status()
+            refresh_token = response.json()["refresh_token"]
+
+        # One of each first, so lazy imports and caches are not timed
+        await refresh()
+        results = {"login": await measure(login, args.renewals)}
+        results["refresh"] = await measure(refresh, args.renewals)
+
+    renewals_per_day = args.active_hours * 60 / settings.ACCESS_TOKEN_EXPIRE_MINUTES
+    for result in results.values():
+        result["cpu_seconds_per_user_day"] = round(result["cpu_ms"] * renewals_per_day / 1000, 3)
+    report = {
+        "renewals": args.renewals,
+        "active_hours": args.active_hours,
+        "renewals_per_user_day": renewals_per_day,
+        **results,
+        "cpu_reduction": round(results["login"]["cpu_ms"] / results["refresh"]["cpu_ms"], 1),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renewals", type=int, default=100)
+    parser.add_argument("--active-hours", type=float, default=8.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,377 @@
+"""HTTP load benchmark for the wire API.
+
+Usage (from backend/):
+    python -m benchmarks.http_benchmark run --output before.json
+    python -m benchmarks.http_benchmark run --concurrency 64 --requests 2000
+    python -m benchmarks.http_benchmark run --uvicorn --workers 4
+    python -m benchmarks.http_benchmark run --base-url http://127.0.0.1:8000
+    python -m benchmarks.http_benchmark compare before.json after.json
+
+By default the FastAPI app is driven in-process through httpx.ASGITransport
+against a temporary SQLite database, so results isolate application overhead.
+--uvicorn serves the same database from a local uvicorn subprocess instead, and
+--base-url targets a server that is already running. With --database-url the
+schema must already exist (``alembic upgrade head``).
+
+Scenarios run one after another: register, login, create, list (first page),
+list_deep (last page of a user holding --deep-wires wires), get, update and
+delete. Each reports throughput and p50/p95/p99 latency; ``compare`` flags
+scenarios whose p95 latency or throughput regressed by more than --threshold.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+PASSWORD = "benchmark-password-1"
+PAGE_SIZE = 20
+
+
+def percentile_summary(samples: list[float], elapsed: float, errors: int) -> dict:
+    """Throughput and latency percentiles (ms) for one scenario."""
+    ordered = sorted(samples)
+    if len(ordered) > 1:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = ordered[0] if ordered else 0.0
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(ordered), 2) if ordered else 0.0,
+        "p50_ms": round(p50, 2),
+        "p95_ms": round(p95, 2),
+        "p99_ms": round(p99, 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+    }
+
+
+async def run_scenario(
+    request: Callable[[int], Awaitable[httpx.Response]],
+    total: int,
+    concurrency: int,
+    expected: int,
+) -> tuple[dict, list[httpx.Response]]:
+    """Issue ``total`` requests from ``concurrency`` workers and time each one.
+
+    ``request(i)`` builds and sends the i-th request; responses whose status is
+    not ``expected`` count as errors but are still timed.
+    """
+    samples: list[float] = []
+    responses: list[httpx.Response | None] = [None] * total
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        while next_index < total:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await request(index)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            samples.append((time.perf_counter() - started) * 1000)
+            responses[index] = response
+            if response.status_code != expected:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    elapsed = time.perf_counter() - started
+    return percentile_summary(samples, elapsed, errors), [r for r in responses if r is not None]
+
+
+def _wire_payload(index: int) -> dict:
+    return {
+        "sender_name": f"Sender {index}",
+        "recipient_name": f"Recipient {index}",
+        "amount": f"{100 + index % 9900}.{index % 100:02d}",
+        "currency": ("USD", "EUR", "GBP")[index % 3],
+    }
+
+
+async def run_suite(client: httpx.AsyncClient, args: argparse.Namespace) -> dict:
+    """Run every scenario in order against ``client``; later ones reuse earlier data."""
+    run_id = uuid.uuid4().hex[:8]
+    concurrency = args.concurrency
+    results = {}
+
+    def email(i: int) -> str:
+        return f"bench-{run_id}-{i}@example.com"
+
+    results["register"], _ = await run_scenario(
+        lambda i: client.post("/api/auth/register", json={"email": email(i), "password": PASSWORD}),
+        args.auth_requests,
+        concurrency,
+        201,
+    )
+
+    results["login"], logins = await run_scenario(
+        lambda i: client.post("/api/auth/login", json={"email": email(i), "password": PASSWORD}),
+        args.auth_requests,
+        concurrency,
+        200,
+    )
+    headers = [
+        {"Authorization": f"Bearer {response.json()['access_token']}"}
+        for response in logins
+        if response.status_code == 200
+    ]
+    if not headers:
+        raise SystemExit("No user could log in; check the server and database")
+
+    def auth(i: int) -> dict:
+        return headers[i % len(headers)]
+
+    results["create"], created = await run_scenario(
+        lambda i: client.post("/api/wires", json=_wire_payload(i), headers=auth(i)),
+        args.requests,
+        concurrency,
+        201,
+    )
+    wires = [
+        (response.json()["id"], response.request.headers["Authorization"])
+        for response in created
+        if response.status_code == 201
+    ]
+
+    # One heavy user so that the deep page is genuinely deep
+    whale = headers[0]
+    await run_scenario(
+        lambda i: client.post("/api/wires", json=_wire_payload(i), headers=whale),
+        args.deep_wires,
+        concurrency,
+        201,
+    )
+    first_page = await client.get(f"/api/wires?page_size={PAGE_SIZE}", headers=whale)
+    last_page = max(-(-first_page.json()["total"] // PAGE_SIZE), 1)
+
+    await run_scenario(
+        lambda i: client.get("/api/wires", headers=auth(i)), args.warmup, concurrency, 200
+    )
+    results["list"], _ = await run_scenario(
+        lambda i: client.get(f"/api/wires?page=1&page_size={PAGE_SIZE}", headers=auth(i)),
+        args.requests,
+        concurrency,
+        200,
+    )
+    results["list_deep"], _ = await run_scenario(
+        lambda i: client.get(f"/api/wires?page={last_page}&page_size={PAGE_SIZE}", headers=whale),
+        args.requests,
+        concurrency,
+        200,
+    )
+
+    def wire(i: int) -> tuple[int, dict]:
+        wire_id, authorization = wires[i % len(wires)]
+        return wire_id, {"Authorization": authorization}
+
+    async def get_wire(i: int) -> httpx.Response:
+        wire_id, wire_headers = wire(i)
+        return await client.get(f"/api/wires/{wire_id}", headers=wire_headers)
+
+    async def update_wire(i: int) -> httpx.Response:
+        wire_id, wire_headers = wire(i)
+        return await client.put(
+            f"/api/wires/{wire_id}", json={"recipient_name": f"Updated {i}"}, headers=wire_headers
+        )
+
+    async def delete_wire(i: int) -> httpx.Response:
+        wire_id, wire_headers = wire(i)
+        return await client.delete(f"/api/wires/{wire_id}", headers=wire_headers)
+
+    results["get"], _ = await run_scenario(get_wire, args.requests, concurrency, 200)
+    results["update"], _ = await run_scenario(update_wire, args.requests, concurrency, 200)
+    # Each wire can only be deleted once
+    results["delete"], _ = await run_scenario(delete_wire, len(wires), concurrency, 204)
+
+    return results
+
+
+async def _create_sqlite_schema(url: str):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    import app.models  # noqa: F401  (registers the tables on Base.metadata)
+    from app.database import Base
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+def _start_uvicorn(port: int, workers: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        env=os.environ.copy(),
+    )
+
+
+async def _wait_until_healthy(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise SystemExit(f"Server at {base_url} did not become healthy within {timeout}s")
+
+
+async def run(args: argparse.Namespace) -> dict:
+    # SQL echo would dominate the timings
+    os.environ.setdefault("DEBUG", "false")
+    url = args.database_url
+    if url is None and args.base_url is None:
+        workdir = Path(tempfile.mkdtemp(prefix="wire-http-bench-"))
+        url = f"sqlite+aiosqlite:///{workdir / 'bench.db'}"
+        # Must be set before app.config is first imported, in this process and in uvicorn's
+        os.environ["DATABASE_URL"] = url
+        await _create_sqlite_schema(url)
+    elif url is not None:
+        os.environ["DATABASE_URL"] = url
+
+    server = None
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    if args.base_url or args.uvicorn:
+        mode = "remote" if args.base_url else "uvicorn"
+        base_url = args.base_url or f"http://127.0.0.1:{args.port}"
+        if args.uvicorn:
+            server = _start_uvicorn(args.port, args.workers)
+        client = httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits)
+    else:
+        from app.main import app
+
+        mode = "asgi"
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=timeout
+        )
+
+    try:
+        if mode != "asgi":
+            await _wait_until_healthy(str(client.base_url))
+        scenarios = await run_suite(client, args)
+    finally:
+        await client.aclose()
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    return {
+        "meta": {
+            "mode": mode,
+            "database": url.split("://")[0] if url else "server-configured",
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "auth_requests": args.auth_requests,
+            "deep_wires": args.deep_wires,
+            "workers": args.workers if args.uvicorn else None,
+            "python": platform.python_version(),
+            "started_at": datetime.now(UTC).isoformat(),
+        },
+        "scenarios": scenarios,
+    }
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> dict:
+    """Relative change per scenario; regressions exceed ``threshold`` (e.g. 0.1 = 10%)."""
+    report = {}
+    for name, before in baseline["scenarios"].items():
+        after = candidate["scenarios"].get(name)
+        if after is None:
+            continue
+        changes = {
+            metric: round(after[metric] / before[metric] - 1, 3) if before[metric] else None
+            for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+        }
+        regressed = (changes["p95_ms"] or 0) > threshold or (
+            changes["throughput_rps"] or 0
+        ) < -threshold
+        report[name] = {
+            "baseline": {key: before[key] for key in changes},
+            "candidate": {key: after[key] for key in changes},
+            "change": changes,
+            "regression": regressed or after["errors"] > before["errors"],
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the load suite")
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    run_parser.add_argument(
+        "--auth-requests",
+        type=int,
+        default=50,
+        help="Requests for register/login (Argon2-bound, so kept lower); also the user count",
+    )
+    run_parser.add_argument("--deep-wires", type=int, default=2000)
+    run_parser.add_argument("--warmup", type=int, default=20)
+    run_parser.add_argument("--timeout", type=float, default=30.0)
+    run_parser.add_argument("--database-url", help="Use an existing, migrated database")
+    run_parser.add_argument("--base-url", help="Benchmark a server that is already running")
+    run_parser.add_argument("--uvicorn", action="store_true", help="Serve from local uvicorn")
+    run_parser.add_argument("--port", type=int, default=8765)
+    run_parser.add_argument("--workers", type=int, default=1)
+    run_parser.add_argument("--output", type=Path, help="Also write the JSON report here")
+
+    compare_parser = commands.add_parser("compare", help="Compare two saved runs")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("candidate", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        report = compare(
+            json.loads(args.baseline.read_text()),
+            json.loads(args.candidate.read_text()),
+            args.threshold,
+        )
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if any(entry["regression"] for entry in report.values()) else 0)
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Job dispatch latency: embedded asyncio runner versus Celery.
+
+Usage (from backend/, with Redis running for the Celery side):
+    python -m benchmarks.job_latency_benchmark
+    python -m benchmarks.job_latency_benchmark --jobs 500 --broker redis://localhost:6379/1
+    python -m benchmarks.job_latency_benchmark --broker memory://   # no Redis: in-process transport
+
+Runs a no-op job --jobs times one after another on each backend and reports,
+as JSON, the p50/p99 of two latencies: enqueue -> job start (what a follow-up
+action waits before it begins) and enqueue -> result seen by the caller. It
+then enqueues --jobs at once and reports the throughput until the last one
+finishes.
+
+The Celery worker runs in this process (celery.contrib.testing, threads pool
+with --concurrency threads), so only the broker hop, serialization and the
+worker's consumer loop are measured, not process start-up. A memory:// broker
+leaves out the network as well and is a lower bound for Celery.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.services.background_tasks import celery_app
+from app.services.job_runner import JobRunner
+
+# Result (and memory:// broker) polling interval, so polling doesn't dominate
+POLL_SECONDS = 0.001
+
+
+def summarize(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1] * 1000, 3),
+    }
+
+
+async def bench_embedded(jobs: int, concurrency: int) -> dict:
+    started_at: dict[int, float] = {}
+    finished: dict[int, asyncio.Event] = {}
+
+    async def noop(db, index: int):
+        started_at[index] = time.perf_counter()
+        finished[index].set()
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    runner = JobRunner(
+        async_sessionmaker(engine),
+        concurrency=concurrency,
+        queue_size=jobs,
+        max_retries=0,
+        backoff=1,
+        backoff_max=1,
+        jobs={"noop": noop},
+    )
+    await runner.start()
+
+    start, done = [], []
+    for index in range(jobs):
+        finished[index] = asyncio.Event()
+        sent = time.perf_counter()
+        runner.submit("noop", index=index)
+        await finished[index].wait()
+        start.append(started_at[index] - sent)
+        done.append(time.perf_counter() - sent)
+
+    burst_started = time.perf_counter()
+    for index in range(jobs, 2 * jobs):
+        finished[index] = asyncio.Event()
+        runner.submit("noop", index=index)
+    await runner.stop(timeout=60)
+    burst = time.perf_counter() - burst_started
+    await engine.dispose()
+
+    return {
+        "start": summarize(start),
+        "result": summarize(done),
+        "burst_jobs_per_second": round(jobs / burst),
+    }
+
+
+def bench_celery(jobs: int, concurrency: int, broker: str) -> dict:
+    from celery.contrib.testing.worker import start_worker
+
+    backend = "cache+memory://" if broker.startswith("memory") else broker
+    # The memory transport polls (once a second by default); Redis blocks on BRPOP
+    celery_app.conf.update(
+        broker_url=broker,
+        result_backend=backend,
+        broker_transport_options={"polling_interval": POLL_SECONDS},
+    )
+
+    @celery_app.task(name="benchmark_noop")
+    def noop(sent: float) -> float:
+        return time.time() - sent
+
+    start, done = [], []
+    with start_worker(
+        celery_app, pool="threads", concurrency=concurrency, perform_ping_check=False
+    ):
+        for _ in range(jobs):
+            sent = time.time()
+            start.append(noop.delay(sent).get(timeout=10, interval=POLL_SECONDS))
+            done.append(time.time() - sent)
+
+        burst_started = time.perf_counter()
+        results = [noop.delay(time.time()) for _ in range(jobs)]
+        for result in results:
+            result.get(timeout=60, interval=POLL_SECONDS)
+        burst = time.perf_counter() - burst_started
+
+    return {
+        "start": summarize(start),
+        "result": summarize(done),
+        "burst_jobs_per_second": round(jobs / burst),
+    }
+
+
+def main(args: argparse.Namespace):
+    report = {
+        "jobs": args.jobs,
+        "concurrency": args.concurrency,
+        "broker": args.broker,
+        "embedded": asyncio.run(bench_embedded(args.jobs, args.concurrency)),
+        "celery": bench_celery(args.jobs, args.concurrency, args.broker),
+    }
+    report["start_p50_speedup"] = round(
+        report["celery"]["start"]["p50_ms"] / report["embedded"]["start"]["p50_ms"], 1
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    from app.config import settings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--broker", default=settings.REDIS_URL)
+    main(parser.parse_args())
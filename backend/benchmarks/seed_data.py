@@ -0,0 +1,335 @@
+"""Deterministic high-volume synthetic users and wires.
+
+Usage (from backend/):
+    python -m benchmarks.seed_data --database-url postgresql+asyncpg://... --wires 10000000
+    python -m benchmarks.seed_data --database-url sqlite+aiosqlite:///seed.db --create-schema
+
+Generates a skewed dataset: --whales users share --whale-share of all wires and
+the remaining users form a long tail whose volumes fall off as rank ** -skew.
+Recent wires are mostly pending/processing, older ones mostly completed, and
+currencies and amounts follow fixed weights and a log-normal distribution.
+
+The same --seed and --end always produce the same rows, whatever the chunk
+size or backend: every column draws from its own random stream. Wires are
+loaded with COPY on Postgres and chunked executemany elsewhere, then
+wire_summaries is rebuilt. Seeded users all share the password --password.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+from passlib.context import CryptContext
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from app.config import settings
+from app.database import Base
+from app.models import User, WireStatus
+from app.models.wire import SQLITE_FTS_DDL
+from app.services.summary_service import reconcile_wire_summaries
+
+WIRE_COLUMNS = (
+    "sender_name",
+    "recipient_name",
+    "amount_minor",
+    "currency",
+    "status",
+    "reference_number",
+    "created_by",
+    "created_at",
+    "updated_at",
+)
+CURRENCIES = {
+    "USD": 0.55,
+    "EUR": 0.2,
+    "GBP": 0.1,
+    "JPY": 0.05,
+    "CHF": 0.04,
+    "CAD": 0.03,
+    "AUD": 0.03,
+}
+# Wires younger than SETTLE_AFTER are mostly still in flight; older ones have settled
+SETTLE_AFTER = timedelta(days=2)
+RECENT_STATUSES = {
+    WireStatus.PENDING: 0.45,
+    WireStatus.PROCESSING: 0.3,
+    WireStatus.COMPLETED: 0.22,
+    WireStatus.FAILED: 0.03,
+}
+SETTLED_STATUSES = {
+    WireStatus.PENDING: 0.002,
+    WireStatus.PROCESSING: 0.003,
+    WireStatus.COMPLETED: 0.93,
+    WireStatus.FAILED: 0.065,
+}
+FIRST_NAMES = (
+    "Ada", "Ben", "Chloe", "Dmitri", "Elena", "Farah", "George", "Hana", "Ivan", "Julia",
+    "Kenji", "Leila", "Marco", "Nia", "Oscar", "Priya", "Quinn", "Rosa", "Sven", "Tariq",
+)  # fmt: skip
+LAST_NAMES = (
+    "Adams", "Becker", "Costa", "Dubois", "Evans", "Fischer", "Garcia", "Haas", "Ito", "Jensen",
+    "Kowalski", "Lopez", "Moreau", "Nakamura", "Olsen", "Petrov", "Rossi", "Silva", "Tanaka",
+    "Weber",
+)  # fmt: skip
+STREAMS = ("owner", "age", "currency", "status", "amount", "sender", "recipient", "settle")
+
+
+def user_weights(users: int, whales: int, whale_share: float, skew: float) -> np.ndarray:
+    """Probability of each user (whales first) owning any given wire."""
+    whales = min(whales, users)
+    tail = users - whales
+    if tail == 0:
+        return np.full(users, 1 / users)
+    tail_weights = np.arange(1, tail + 1, dtype=np.float64) ** -skew
+    tail_weights *= (1 - whale_share if whales else 1) / tail_weights.sum()
+    return np.concatenate([np.full(whales, whale_share / whales if whales else 0), tail_weights])
+
+
+def generate_wires(
+    args: argparse.Namespace, user_ids: list[int], end: datetime
+) -> Iterator[list[tuple]]:
+    """Yield chunks of wire rows, in WIRE_COLUMNS order."""
+    streams = dict(
+        zip(
+            STREAMS,
+            (
+                np.random.default_rng(s)
+                for s in np.random.SeedSequence(args.seed).spawn(len(STREAMS))
+            ),
+            strict=True,
+        )
+    )
+    owners = np.asarray(user_ids)
+    weights = user_weights(len(user_ids), args.whales, args.whale_share, args.skew)
+    currencies = list(CURRENCIES)
+    statuses = list(WireStatus)
+    recent_p = [RECENT_STATUSES[status] for status in statuses]
+    settled_p = [SETTLED_STATUSES[status] for status in statuses]
+    names = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+    window = args.days * 86400
+
+    # Uniform doubles are drawn one per row in order, so a stream yields the same
+    # values however the rows are chunked; every column is derived from them
+    owner_cdf = np.cumsum(weights)
+    currency_cdf = np.cumsum(list(CURRENCIES.values()))
+    recent_cdf = np.cumsum(recent_p)
+    settled_cdf = np.cumsum(settled_p)
+
+    def pick(stream: str, cdf: np.ndarray, size: int) -> np.ndarray:
+        draws = streams[stream].random(size) * cdf[-1]
+        return np.minimum(np.searchsorted(cdf, draws, side="right"), len(cdf) - 1)
+
+    for start in range(0, args.wires, args.chunk_size):
+        size = min(args.chunk_size, args.wires - start)
+        owner = owners[pick("owner", owner_cdf, size)]
+        age = streams["age"].random(size) * window
+        currency = pick("currency", currency_cdf, size)
+        settled = age > SETTLE_AFTER.total_seconds()
+        status_draws = streams["status"].random(size)
+        status = np.minimum(
+            np.where(
+                settled,
+                np.searchsorted(settled_cdf, status_draws * settled_cdf[-1], side="right"),
+                np.searchsorted(recent_cdf, status_draws * recent_cdf[-1], side="right"),
+            ),
+            len(statuses) - 1,
+        )
+        # Minor units of whatever currency was drawn (yen for JPY, cents for USD)
+        amount_minor = np.clip(
+            streams["amount"].lognormal(mean=11, sigma=1.6, size=size).astype(np.int64),
+            100,
+            10**13 - 1,
+        )
+        sender = (streams["sender"].random(size) * len(names)).astype(np.int64)
+        recipient = (streams["recipient"].random(size) * len(names)).astype(np.int64)
+        settle_seconds = 60 + (streams["settle"].random(size) * 86340).astype(np.int64)
+
+        rows = []
+        for i in range(size):
+            created_at = end - timedelta(seconds=float(age[i]))
+            wire_status = statuses[status[i]]
+            updated_at = (
+                None
+                if wire_status is WireStatus.PENDING
+                else created_at + timedelta(seconds=int(settle_seconds[i]))
+            )
+            rows.append(
+                (
+                    names[sender[i]],
+                    names[recipient[i]],
+                    int(amount_minor[i]),
+                    currencies[currency[i]],
+                    wire_status,
+                    f"SEED-{args.seed}-{start + i:010d}",
+                    int(owner[i]),
+                    created_at,
+                    updated_at,
+                )
+            )
+        yield rows
+
+
+async def insert_users(conn: AsyncConnection, args: argparse.Namespace) -> list[int]:
+    """Insert the seeded users and return their ids, whales first."""
+    hasher = CryptContext(schemes=["argon2"]).handler("argon2").using(salt=b"seed-data-salt00")
+    hashed_password = hasher.hash(args.password)
+    user_ids = []
+    for start in range(0, args.users, args.chunk_size):
+        result = await conn.execute(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            [
+                {
+                    "email": f"seed{args.seed}-{n}@example.com",
+                    "hashed_password": hashed_password,
+                    "is_active": True,
+                }
+                for n in range(start, min(start + args.chunk_size, args.users))
+            ],
+        )
+        user_ids.extend(result.scalars())
+    return user_ids
+
+
+async def copy_wires(conn: AsyncConnection, rows: list[tuple]):
+    """Bulk-load one chunk through asyncpg's binary COPY."""
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "wires",
+        records=[(*row[:4], row[4].name, *row[5:]) for row in rows],
+        columns=WIRE_COLUMNS,
+    )
+
+
+async def insert_wires(conn: AsyncConnection, rows: list[tuple]):
+    """Load one chunk with a single driver-level executemany.
+
+    Values are pre-converted to what SQLAlchemy would store on SQLite, which
+    skips its per-row bind processing.
+    """
+
+    def stored(value: datetime | None) -> str | None:
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f") if value else None
+
+    await conn.exec_driver_sql(
+        f"INSERT INTO wires ({', '.join(WIRE_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in WIRE_COLUMNS)})",
+        [
+            (
+                *row[:2],
+                float(row[2]),
+                row[3],
+                row[4].name,
+                *row[5:7],
+                stored(row[7]),
+                stored(row[8]),
+            )
+            for row in rows
+        ],
+    )
+
+
+async def _suspend_sqlite_fts(engine) -> bool:
+    """Drop the per-row FTS insert trigger; the index is rebuilt once after loading."""
+    async with engine.begin() as conn:
+        exists = await conn.scalar(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'wires_fts_ai'")
+        )
+        if exists:
+            await conn.execute(text("DROP TRIGGER wires_fts_ai"))
+    return bool(exists)
+
+
+async def _restore_sqlite_fts(engine):
+    async with engine.begin() as conn:
+        await conn.execute(text(SQLITE_FTS_DDL[1]))
+        await conn.execute(text("INSERT INTO wires_fts(wires_fts) VALUES ('rebuild')"))
+
+
+async def main(args: argparse.Namespace):
+    engine = create_async_engine(args.database_url)
+    postgres = engine.dialect.name == "postgresql"
+    if not postgres:
+        # A crash mid-load only loses seed data, so skip the fsync on every commit
+        event.listen(
+            engine.sync_engine,
+            "connect",
+            lambda dbapi_connection, _: dbapi_connection.execute("PRAGMA synchronous = OFF"),
+        )
+    end = datetime.combine(args.end, datetime.min.time(), tzinfo=UTC)
+
+    if args.create_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        user_ids = await insert_users(conn, args)
+
+    load = copy_wires if postgres else insert_wires
+    fts_suspended = not postgres and await _suspend_sqlite_fts(engine)
+    loaded = 0
+    for rows in generate_wires(args, user_ids, end):
+        async with engine.begin() as conn:
+            await load(conn, rows)
+        loaded += len(rows)
+        print(f"{loaded}/{args.wires} wires", file=sys.stderr, flush=True)
+    if fts_suspended:
+        await _restore_sqlite_fts(engine)
+    load_seconds = time.perf_counter() - started
+
+    # The rollup starts out empty, so every group is "drift"; skip the per-row warning
+    logging.getLogger("app.services.summary_service").setLevel(logging.ERROR)
+    async with AsyncSession(engine) as session:
+        await reconcile_wire_summaries(session)
+        await session.commit()
+    if postgres:
+        async with engine.connect() as conn:
+            await conn.execute(text("ANALYZE users"))
+            await conn.execute(text("ANALYZE wires"))
+    await engine.dispose()
+
+    print(
+        json.dumps(
+            {
+                "seed": args.seed,
+                "end": args.end.isoformat(),
+                "users": len(user_ids),
+                "wires": loaded,
+                "load_seconds": round(load_seconds, 1),
+                "wires_per_second": round(loaded / load_seconds),
+                "total_seconds": round(time.perf_counter() - started, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--wires", type=int, default=1_000_000)
+    parser.add_argument("--whales", type=int, default=3)
+    parser.add_argument("--whale-share", type=float, default=0.6)
+    parser.add_argument("--skew", type=float, default=1.1, help="Long-tail Zipf exponent")
+    parser.add_argument("--days", type=int, default=365, help="History spanned by created_at")
+    parser.add_argument(
+        "--end",
+        type=lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+        default=datetime.now(UTC).date(),
+        help="Newest created_at (YYYY-MM-DD); part of the determinism key",
+    )
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--password", default="seed-password")
+    parser.add_argument(
+        "--create-schema", action="store_true", help="create_all first (use alembic on Postgres)"
+    )
+    asyncio.run(main(parser.parse_args()))
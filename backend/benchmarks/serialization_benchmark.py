@@ -0,0 +1,106 @@
+"""Payload size and serialization cost: JSON versus MessagePack.
+
+Usage (from backend/):
+    python -m benchmarks.serialization_benchmark
+    python -m benchmarks.serialization_benchmark --wires 20 100 1000 --repeat 200
+
+Builds wire list pages of each --wires size and encodes them the way the API
+does: JSON through the response model's ``dump_json`` (FastAPI's default fast
+path), and MessagePack by decoding that JSON and packing it (see NegotiatedRoute).
+Reports, as JSON, per page size and format:
+
+- encoded size, and size after gzip (level 6) and brotli (quality 4), the
+  settings CompressionMiddleware uses
+- median server-side encode time, and the compression time on top of it
+- median client-side decode time
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import brotli
+import msgpack
+from pydantic import TypeAdapter
+
+from app.schemas import WireListResponse
+
+
+def make_page(size: int) -> WireListResponse:
+    """A page of ``size`` realistic-looking wires."""
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    wires = [
+        {
+            "id": 100_000 + i,
+            "sender_name": f"Sender Company {i % 97}",
+            "recipient_name": f"Recipient Holdings {i % 89}",
+            # JPY has no minor unit, so every fourth (JPY) amount is whole
+            "amount": Decimal(f"{(i * 7919) % 1_000_000 + 1}.{i % 100:02d}").quantize(
+                Decimal(1) if i % 4 == 3 else Decimal("0.01")
+            ),
+            "currency": ("USD", "EUR", "GBP", "JPY")[i % 4],
+            "status": ("pending", "processing", "completed", "failed")[i % 4],
+            "reference_number": f"WIRE-{i:08X}",
+            "created_by": 1,
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(minutes=i // 2) if i % 3 else None,
+            "version": 1 + i % 3,
+        }
+        for i in range(size)
+    ]
+    return WireListResponse(wires=wires, total=size, page=1, page_size=size, cached=False)
+
+
+def median_ms(call, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 4)
+
+
+def measure(page: WireListResponse, repeat: int) -> dict:
+    adapter = TypeAdapter(WireListResponse)
+    encoders = {
+        "json": (lambda: adapter.dump_json(page), json.loads),
+        "msgpack": (lambda: msgpack.packb(json.loads(adapter.dump_json(page))), msgpack.unpackb),
+    }
+    report = {}
+    for name, (encode, decode) in encoders.items():
+        body = encode()
+        gzipped = gzip.compress(body, compresslevel=6, mtime=0)
+        brotlied = brotli.compress(body, quality=4)
+        report[name] = {
+            "bytes": len(body),
+            "gzip_bytes": len(gzipped),
+            "brotli_bytes": len(brotlied),
+            "encode_ms": median_ms(encode, repeat),
+            "gzip_ms": median_ms(lambda: gzip.compress(body, compresslevel=6, mtime=0), repeat),
+            "brotli_ms": median_ms(lambda: brotli.compress(body, quality=4), repeat),
+            "decode_ms": median_ms(lambda: decode(body), repeat),
+        }
+    json_report, msgpack_report = report["json"], report["msgpack"]
+    report["msgpack_vs_json"] = {
+        "size_ratio": round(msgpack_report["bytes"] / json_report["bytes"], 3),
+        "brotli_size_ratio": round(msgpack_report["brotli_bytes"] / json_report["brotli_bytes"], 3),
+        "encode_ratio": round(msgpack_report["encode_ms"] / json_report["encode_ms"], 3),
+        "decode_ratio": round(msgpack_report["decode_ms"] / json_report["decode_ms"], 3),
+    }
+    return report
+
+
+def main(args: argparse.Namespace):
+    report = {str(size): measure(make_page(size), args.repeat) for size in args.wires}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--wires", type=int, nargs="+", default=[1, 20, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=100)
+    main(parser.parse_args())
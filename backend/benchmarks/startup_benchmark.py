@@ -0,0 +1,129 @@
+"""Cold-start and first-request latency benchmark.
+
+Usage (from backend/):
+    python -m benchmarks.startup_benchmark --runs 5
+    python -m benchmarks.startup_benchmark --env WARMUP_ENABLED=false
+
+Each run starts a fresh uvicorn process against a seeded temporary SQLite
+database and records how long it takes until /health answers. It then times the
+first and subsequent login, list and get requests. Medians across runs are
+printed as JSON; pass --env to compare settings (e.g. with warm-up disabled).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+EMAIL = "startup@example.com"
+PASSWORD = "startup-password-1"
+WARM_SAMPLES = 5
+
+
+async def seed(url: str) -> int:
+    """Create the schema, one user and one wire; return the wire id."""
+    import app.models  # noqa: F401  (registers the tables on Base.metadata)
+    from app.database import Base
+    from app.models import User, Wire, WireStatus
+    from app.utils.security import hash_password
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(email=EMAIL, hashed_password=hash_password(PASSWORD))
+        session.add(user)
+        await session.flush()
+        wire = Wire(
+            sender_name="Startup Sender",
+            recipient_name="Startup Recipient",
+            amount_minor=10000,
+            currency="USD",
+            status=WireStatus.PENDING,
+            reference_number="WIRE-STARTUP",
+            created_by=user.id,
+        )
+        session.add(wire)
+        await session.commit()
+        wire_id = wire.id
+    await engine.dispose()
+    return wire_id
+
+
+async def timed(call) -> tuple[float, httpx.Response]:
+    started = time.perf_counter()
+    response = await call()
+    return (time.perf_counter() - started) * 1000, response
+
+
+async def one_run(port: int, env: dict, wire_id: int) -> dict:
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=30) as client:
+            while True:
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.01)
+            result = {"cold_start_ms": (time.perf_counter() - started) * 1000}
+
+            def login():
+                return client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+
+            elapsed, response = await timed(login)
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            requests = {
+                "login": login,
+                "list": lambda: client.get("/api/wires", headers=headers),
+                "get": lambda: client.get(f"/api/wires/{wire_id}", headers=headers),
+            }
+            result["login_first_ms"] = elapsed
+            for name, call in requests.items():
+                if name != "login":
+                    result[f"{name}_first_ms"], _ = await timed(call)
+                samples = [(await timed(call))[0] for _ in range(WARM_SAMPLES)]
+                result[f"{name}_warm_ms"] = statistics.median(samples)
+            return result
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+async def main(args: argparse.Namespace):
+    workdir = Path(tempfile.mkdtemp(prefix="wire-startup-bench-"))
+    url = f"sqlite+aiosqlite:///{workdir / 'bench.db'}"
+    env = {**os.environ, "DATABASE_URL": url, "DEBUG": "false"}
+    env.update(item.split("=", 1) for item in args.env)
+    wire_id = await seed(url)
+
+    runs = [await one_run(args.port, env, wire_id) for _ in range(args.runs)]
+    report = {
+        "runs": args.runs,
+        "env": args.env,
+        **{key: round(statistics.median(run[key] for run in runs), 1) for key in runs[0]},
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--env", action="append", default=[], help="KEY=VALUE for the server")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,317 @@
+"""WebSocket / Server-Sent Events scale and broadcast fan-out benchmark.
+
+Usage (from backend/):
+    python -m benchmarks.websocket_benchmark --clients 2000 --events 100
+    python -m benchmarks.websocket_benchmark --clients 5000 --slow-clients 5 --slow-delay 0.5
+    python -m benchmarks.websocket_benchmark --transport sse --clients 5000
+
+Starts the app under uvicorn in a subprocess, opens --clients concurrent /ws
+connections (or, with --transport sse, /api/wires/events streams for one user
+of a temporary SQLite database) from this process, then has the server fire
+--events wire updates through ``broadcast_wire_update``. Reports, as JSON:
+
+- fan-out latency (message timestamp to client receipt) for normal clients, and
+  separately for the --slow-clients that sleep --slow-delay after every message
+- server-side duration of each broadcast call
+- server RSS growth per open connection
+- server CPU time per broadcast event
+
+The server is driven over its stdin/stdout with one JSON command per line, so
+client work never shows up in the server's CPU or memory figures. Both sides
+run on time.monotonic(), which is shared between processes on one host.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+
+import websockets
+
+READY = "ready"
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak rather than current RSS; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _raise_fd_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def _distribution(samples: list[float]) -> dict:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else []
+    pick = (lambda q: cuts[q - 1]) if cuts else (lambda q: ordered[0])
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(pick(50), 3),
+        "p95_ms": round(pick(95), 3),
+        "p99_ms": round(pick(99), 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+# --- server side -----------------------------------------------------------
+
+
+async def _prepare_sse_user() -> str:
+    """Point the app at a fresh SQLite database with one user; return its access token."""
+    import tempfile
+    from pathlib import Path
+
+    url = f"sqlite+aiosqlite:///{Path(tempfile.mkdtemp(prefix='wire-sse-bench-')) / 'bench.db'}"
+    # Must be set before app.config is first imported
+    os.environ["DATABASE_URL"] = url
+
+    from benchmarks.http_benchmark import _create_sqlite_schema
+
+    await _create_sqlite_schema(url)
+
+    from app.database import AsyncSessionLocal
+    from app.models import User
+    from app.utils.security import create_access_token
+
+    async with AsyncSessionLocal() as session:
+        user = User(email="sse-bench@example.com", hashed_password="unused")
+        session.add(user)
+        await session.commit()
+        return create_access_token(data={"sub": str(user.id)})
+
+
+async def serve(port: int, transport: str):
+    """Run uvicorn and answer ``stats`` / ``broadcast`` commands read from stdin."""
+    import uvicorn
+
+    token = await _prepare_sse_user() if transport == "sse" else None
+
+    from app.main import app
+    from app.routers.websocket import broadcast_wire_update, manager
+    from app.services.event_service import wire_events
+
+    def connections() -> int:
+        if transport == "sse":
+            return sum(len(subscribers) for subscribers in wire_events.subscribers.values())
+        return len(manager.active_connections)
+
+    _raise_fd_limit()
+    config = uvicorn.Config(
+        app, port=port, log_level="warning", access_log=False, backlog=4096, lifespan="off"
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    def reply(payload: dict):
+        sys.stdout.write(json.dumps(payload) + "\n")
+        sys.stdout.flush()
+
+    reply({"status": READY, "token": token})
+    while line := await reader.readline():
+        command = json.loads(line)
+        if command["op"] == "stats":
+            reply({"rss": _rss_bytes(), "connections": connections()})
+        elif command["op"] == "broadcast":
+            durations = []
+            cpu_started = time.process_time()
+            for event in range(command["events"]):
+                started = time.monotonic()
+                await broadcast_wire_update(event, "COMPLETED", user_id=1)
+                durations.append((time.monotonic() - started) * 1000)
+                await asyncio.sleep(command["interval"])
+            reply(
+                {
+                    "durations_ms": durations,
+                    "cpu_seconds": time.process_time() - cpu_started,
+                    "connections": connections(),
+                }
+            )
+
+    server.should_exit = True
+    await server_task
+
+
+# --- client side -----------------------------------------------------------
+
+
+class Client:
+    """One /ws connection or SSE stream recording how late each broadcast arrives."""
+
+    def __init__(self, slow_delay: float | None):
+        self.slow_delay = slow_delay
+        self.latencies: list[float] = []
+
+    async def run_sse(
+        self,
+        http,
+        url: str,
+        token: str,
+        connected: asyncio.Event,
+        done: asyncio.Event,
+        expected: int,
+    ):
+        headers = {"Authorization": f"Bearer {token}"}
+        async with http.stream("GET", url, headers=headers) as response:
+            connected.set()
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    message = json.loads(line[len("data: ") :])
+                    self.latencies.append((time.monotonic() - message["timestamp"]) * 1000)
+                    if self.slow_delay:
+                        await asyncio.sleep(self.slow_delay)
+                if len(self.latencies) >= expected or done.is_set():
+                    return
+
+    async def run(self, url: str, connected: asyncio.Event, done: asyncio.Event, expected: int):
+        # A slow reader keeps a tiny queue so its backlog reaches the server's socket
+        max_queue = 1 if self.slow_delay else 64
+        async with websockets.connect(url, max_queue=max_queue, ping_interval=None) as ws:
+            connected.set()
+            while len(self.latencies) < expected and not done.is_set():
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=1)
+                except TimeoutError:
+                    continue
+                received = time.monotonic()
+                message = json.loads(raw)
+                if message.get("type") == "wire_update":
+                    self.latencies.append((received - message["timestamp"]) * 1000)
+                if self.slow_delay:
+                    await asyncio.sleep(self.slow_delay)
+
+
+async def _command(process: asyncio.subprocess.Process, payload: dict) -> dict:
+    process.stdin.write((json.dumps(payload) + "\n").encode())
+    await process.stdin.drain()
+    return json.loads(await process.stdout.readline())
+
+
+async def main(args: argparse.Namespace):
+    _raise_fd_limit()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "benchmarks.websocket_benchmark",
+        "--serve",
+        "--port",
+        str(args.port),
+        "--transport",
+        args.transport,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        env={**os.environ, "DEBUG": "false"},
+    )
+    ready = json.loads(await process.stdout.readline())
+    assert ready["status"] == READY, ready
+
+    if args.transport == "sse":
+        import httpx
+
+        url = f"http://127.0.0.1:{args.port}/api/wires/events"
+        http = httpx.AsyncClient(timeout=None, limits=httpx.Limits(max_connections=None))
+    else:
+        url = f"ws://127.0.0.1:{args.port}/ws"
+    baseline = await _command(process, {"op": "stats"})
+
+    clients = [
+        Client(args.slow_delay if i < args.slow_clients else None) for i in range(args.clients)
+    ]
+    done = asyncio.Event()
+    tasks = []
+    connect_started = time.monotonic()
+    # Open connections in waves so the listen backlog never overflows
+    for start in range(0, len(clients), args.connect_batch):
+        events = []
+        for client in clients[start : start + args.connect_batch]:
+            connected = asyncio.Event()
+            events.append(connected)
+            if args.transport == "sse":
+                run = client.run_sse(http, url, ready["token"], connected, done, args.events)
+            else:
+                run = client.run(url, connected, done, args.events)
+            tasks.append(asyncio.create_task(run))
+        await asyncio.wait_for(asyncio.gather(*(event.wait() for event in events)), timeout=60)
+    connect_seconds = time.monotonic() - connect_started
+
+    loaded = await _command(process, {"op": "stats"})
+    broadcast = await _command(
+        process, {"op": "broadcast", "events": args.events, "interval": args.interval}
+    )
+
+    # Give stragglers (the slow clients above all) a bounded time to drain
+    drain_deadline = time.monotonic() + args.drain_timeout
+    while time.monotonic() < drain_deadline and any(
+        len(client.latencies) < args.events for client in clients
+    ):
+        await asyncio.sleep(0.1)
+    done.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if args.transport == "sse":
+        await http.aclose()
+
+    process.stdin.close()
+    await process.wait()
+
+    fast = [latency for client in clients if not client.slow_delay for latency in client.latencies]
+    slow = [latency for client in clients if client.slow_delay for latency in client.latencies]
+    delivered = sum(len(client.latencies) for client in clients)
+    report = {
+        "transport": args.transport,
+        "clients": args.clients,
+        "slow_clients": args.slow_clients,
+        "events": args.events,
+        "connect_seconds": round(connect_seconds, 2),
+        "server_connections": loaded["connections"],
+        "delivered": delivered,
+        "expected": args.clients * args.events,
+        "server_rss_mb": round(loaded["rss"] / 2**20, 1),
+        "rss_per_connection_kb": round(
+            (loaded["rss"] - baseline["rss"]) / max(loaded["connections"], 1) / 1024, 2
+        ),
+        "cpu_ms_per_event": round(broadcast["cpu_seconds"] * 1000 / args.events, 3),
+        "broadcast_call": _distribution(broadcast["durations_ms"]),
+        "fanout_latency": _distribution(fast),
+        "fanout_latency_slow_clients": _distribution(slow),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transport", choices=("ws", "sse"), default="ws")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.05, help="Seconds between events")
+    parser.add_argument("--slow-clients", type=int, default=0)
+    parser.add_argument("--slow-delay", type=float, default=0.2, help="Per-message read delay")
+    parser.add_argument("--connect-batch", type=int, default=200)
+    parser.add_argument("--drain-timeout", type=float, default=30.0)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(serve(args.port, args.transport))
+    else:
+        asyncio.run(main(args))
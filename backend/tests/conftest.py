@@ -4,21 +4,31 @@ import asyncio
 from collections.abc import AsyncGenerator
 
 import pytest
+from fastapi import Request
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.database import Base, get_db
+from app.database import READ_ONLY_METHODS, Base, get_db
 from app.main import app
 from app.models import User, Wire, WireStatus
+from app.utils.query_stats import instrument_query_stats
 from app.utils.security import create_access_token, hash_password
 
 # Use in-memory SQLite for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+instrument_query_stats(engine.sync_engine)
 TestingSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def assert_max_queries(response, limit: int):
+    """Fail if the request behind ``response`` issued more than ``limit`` SQL statements."""
+    count = int(response.headers["X-Query-Count"])
+    request = response.request
+    assert count <= limit, f"{request.method} {request.url.path} ran {count} queries (max {limit})"
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -42,10 +52,12 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
 
 @pytest.fixture(scope="function")
 def override_get_db(db_session: AsyncSession):
-    """Override the get_db dependency."""
+    """Override the get_db dependency, committing writes like the real one."""
 
-    async def _override_get_db():
+    async def _override_get_db(request: Request):
         yield db_session
+        if request.method not in READ_ONLY_METHODS and db_session.in_transaction():
+            await db_session.commit()
 
     return _override_get_db
 
@@ -93,7 +105,7 @@ async def test_wire(db_session: AsyncSession, test_user: User) -> Wire:
     wire = Wire(
         sender_name="John Doe",
         recipient_name="Jane Smith",
-        amount=1000.50,
+        amount_minor=100050,
         currency="USD",
         status=WireStatus.PENDING,
         reference_number="WIRE-TEST123",
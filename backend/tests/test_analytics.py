@@ -0,0 +1,133 @@
+"""Tests for analytics snapshots and volume aggregation."""
+
+import threading
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import User, Wire, WireStatus
+from app.services import analytics_service
+from app.services.analytics_service import (
+    aggregate_volume,
+    aggregate_volume_sql,
+    export_wire_snapshot,
+    load_latest_snapshot,
+)
+
+
+@pytest.fixture
+async def dated_wires(db_session: AsyncSession, test_user: User) -> list[Wire]:
+    """Create wires spread over several days, currencies and statuses."""
+    other = User(email="other@example.com", hashed_password="x", is_active=True)
+    db_session.add(other)
+    await db_session.flush()
+
+    start = datetime(2026, 3, 2, 9, 30, tzinfo=UTC)  # a Monday
+    wires = []
+    for i in range(40):
+        wires.append(
+            Wire(
+                sender_name="Sender",
+                recipient_name="Recipient",
+                amount_minor=1005 * (i + 1),
+                currency=("USD", "EUR", "GBP")[i % 3],
+                status=list(WireStatus)[i % 4],
+                reference_number=f"WIRE-AN{i:04d}",
+                created_by=test_user.id if i % 5 else other.id,
+                created_at=start + timedelta(hours=13 * i),
+            )
+        )
+    db_session.add_all(wires)
+    await db_session.commit()
+    return wires
+
+
+def _normalise(rows: list[dict]) -> list[tuple]:
+    return sorted(
+        (
+            row["bucket_start"],
+            row["currency"],
+            row["status"],
+            row["wire_count"],
+            row["total_amount"],
+        )
+        for row in rows
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bucket", ["day", "week"])
+async def test_snapshot_matches_sql(
+    db_session: AsyncSession, test_user: User, dated_wires: list[Wire], tmp_path, bucket: str
+):
+    """Test vectorized snapshot aggregation agrees with the SQL GROUP BY."""
+    await export_wire_snapshot(db_session, tmp_path)
+    snapshot = load_latest_snapshot(tmp_path)
+
+    assert len(snapshot) == len(dated_wires)
+
+    start = datetime(2026, 3, 3, tzinfo=UTC)
+    end = datetime(2026, 3, 15, tzinfo=UTC)
+    expected = await aggregate_volume_sql(db_session, test_user.id, bucket, start, end)
+    actual = aggregate_volume(snapshot, test_user.id, bucket, start, end)
+
+    assert expected
+    assert _normalise(actual) == _normalise(expected)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_replaces_latest(
+    db_session: AsyncSession, dated_wires: list[Wire], tmp_path
+):
+    """Test a new export becomes the latest snapshot."""
+    first = await export_wire_snapshot(db_session, tmp_path)
+    second = await export_wire_snapshot(db_session, tmp_path)
+
+    assert first != second
+    assert load_latest_snapshot(tmp_path).path == second
+
+
+@pytest.mark.asyncio
+async def test_snapshot_export_runs_off_the_event_loop(
+    db_session: AsyncSession, dated_wires: list[Wire], tmp_path, monkeypatch
+):
+    """Test encoding and writing the snapshot happen in a worker thread."""
+    threads = []
+
+    def save(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return np_save(*args, **kwargs)
+
+    np_save = analytics_service.np.save
+    monkeypatch.setattr(analytics_service.np, "save", save)
+    await export_wire_snapshot(db_session, tmp_path)
+
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_volume_endpoint(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    dated_wires: list[Wire],
+    tmp_path,
+    monkeypatch,
+):
+    """Test the volume report is served from the snapshot."""
+    monkeypatch.setattr(settings, "ANALYTICS_SNAPSHOT_DIR", str(tmp_path))
+
+    response = await client.get("/api/analytics/volume", headers=auth_headers)
+    assert response.status_code == 503
+
+    await export_wire_snapshot(db_session, tmp_path)
+    response = await client.get("/api/analytics/volume?bucket=week", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["bucket"] == "week"
+    assert sum(row["wire_count"] for row in data["buckets"]) == 32
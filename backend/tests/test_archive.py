@@ -0,0 +1,170 @@
+"""Tests for wire archival."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User, Wire, WireArchive, WireStatus
+from app.services import jobs
+from app.services.archive_service import (
+    _add_month,
+    archive_terminal_wires,
+    ensure_wire_partitions,
+    partition_name,
+)
+from app.services.summary_service import reconcile_wire_summaries
+
+
+@pytest.fixture
+async def aged_wires(db_session: AsyncSession, test_user: User) -> list[Wire]:
+    """Create old and recent wires in a mix of statuses."""
+    now = datetime.now(UTC)
+    specs = [
+        (WireStatus.COMPLETED, 200),
+        (WireStatus.FAILED, 150),
+        (WireStatus.COMPLETED, 120),
+        (WireStatus.PENDING, 300),
+        (WireStatus.PROCESSING, 200),
+        (WireStatus.COMPLETED, 5),
+    ]
+    wires = [
+        Wire(
+            sender_name="Sender",
+            recipient_name="Recipient",
+            amount_minor=2500,
+            currency="USD",
+            status=wire_status,
+            reference_number=f"WIRE-OLD{i:04d}",
+            created_by=test_user.id,
+            created_at=now - timedelta(days=age),
+        )
+        for i, (wire_status, age) in enumerate(specs)
+    ]
+    db_session.add_all(wires)
+    await db_session.commit()
+    return wires
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_old_terminal_wires(db_session: AsyncSession, aged_wires: list[Wire]):
+    """Test only old completed/failed wires are archived, in batches."""
+    archived = await archive_terminal_wires(db_session, timedelta(days=90), batch_size=2)
+
+    assert archived == 3
+    remaining = await db_session.execute(select(Wire.reference_number).order_by(Wire.id))
+    assert list(remaining.scalars()) == ["WIRE-OLD0003", "WIRE-OLD0004", "WIRE-OLD0005"]
+    count = await db_session.execute(select(func.count()).select_from(WireArchive))
+    assert count.scalar() == 3
+
+
+@pytest.mark.asyncio
+async def test_archive_respects_max_batches(db_session: AsyncSession, aged_wires: list[Wire]):
+    """Test a run can be capped to a number of batches."""
+    archived = await archive_terminal_wires(
+        db_session, timedelta(days=90), batch_size=1, max_batches=2
+    )
+
+    assert archived == 2
+
+
+@pytest.mark.asyncio
+async def test_archived_wire_is_readable_not_writable(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession, aged_wires: list[Wire]
+):
+    """Test archived wires stay readable by id but are read-only."""
+    wire_id = aged_wires[0].id
+    await archive_terminal_wires(db_session, timedelta(days=90))
+
+    response = await client.get(f"/api/wires/{wire_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["reference_number"] == "WIRE-OLD0000"
+
+    response = await client.put(
+        f"/api/wires/{wire_id}", json={"status": "pending"}, headers=auth_headers
+    )
+    assert response.status_code == 409
+
+    response = await client.delete(f"/api/wires/{wire_id}", headers=auth_headers)
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_archive_keeps_summary_consistent(db_session: AsyncSession, aged_wires: list[Wire]):
+    """Test archived wires still count towards the owner's summary."""
+    await reconcile_wire_summaries(db_session)
+    await db_session.commit()
+
+    await archive_terminal_wires(db_session, timedelta(days=90))
+
+    assert await reconcile_wire_summaries(db_session) == 0
+
+
+def test_partition_name():
+    """Test monthly partition naming."""
+    assert partition_name(datetime(2026, 3, 1).date()) == "wires_y2026m03"
+
+
+class RecordingPostgresSession:
+    """Stands in for a Postgres session: records SQL and answers the two checks."""
+
+    def __init__(self, existing: set[str], stray_rows: bool):
+        self.existing = existing
+        self.stray_rows = stray_rows
+        self.statements: list[str] = []
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    async def scalar(self, statement, params=None):
+        self.statements.append(str(statement))
+        return params["name"] in self.existing if params else self.stray_rows
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+        return SimpleNamespace(rowcount=2)
+
+    async def commit(self):
+        self.statements.append("COMMIT")
+
+
+@pytest.mark.asyncio
+async def test_partition_takes_rows_from_default_partition():
+    """Test a partition whose month has rows in wires_default moves them in."""
+    this_month = datetime.now(UTC).date().replace(day=1)
+    next_month = partition_name(_add_month(this_month))
+    db = RecordingPostgresSession({partition_name(this_month)}, stray_rows=True)
+
+    assert await ensure_wire_partitions(db, months_ahead=1) == [
+        partition_name(this_month),
+        next_month,
+    ]
+
+    steps = [statement.split(" (")[0] for statement in db.statements[2:]]
+    assert steps == [
+        "LOCK TABLE wires IN ACCESS EXCLUSIVE MODE",
+        "SELECT EXISTS",
+        "ALTER TABLE wires DETACH PARTITION wires_default",
+        f"CREATE TABLE IF NOT EXISTS {next_month} PARTITION OF wires FOR VALUES FROM",
+        "WITH moved AS",
+        "ALTER TABLE wires ATTACH PARTITION wires_default DEFAULT",
+        "COMMIT",
+    ]
+    assert f"INSERT INTO {next_month} SELECT * FROM moved" in db.statements[6]
+
+
+@pytest.mark.asyncio
+async def test_archive_job_survives_partition_failure(
+    db_session: AsyncSession, aged_wires: list[Wire], monkeypatch
+):
+    """Test old wires are still archived when creating partitions fails."""
+
+    async def failing_partitions(db, months_ahead):
+        raise RuntimeError("updated partition constraint for default partition would be violated")
+
+    monkeypatch.setattr(jobs, "ensure_wire_partitions", failing_partitions)
+
+    assert await jobs.archive_wires(db_session) == {"archived": 3, "partitions": []}
@@ -0,0 +1,167 @@
+"""Tests for the buffered audit log."""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.database
+from app.config import settings
+from app.main import app as api
+from app.models import AuditLog, User
+from app.services.audit_service import AuditLogWriter, audit_log
+from tests.conftest import TestingSessionLocal, engine
+
+
+@pytest.fixture
+async def audit_enabled(db_session: AsyncSession, monkeypatch):
+    """Run the global audit writer against the test database."""
+    monkeypatch.setattr(settings, "FEATURE_AUDIT_LOG", True)
+    monkeypatch.setattr(audit_log, "session_factory", TestingSessionLocal)
+    await audit_log.start()
+    yield audit_log
+    await audit_log.stop(timeout=1)
+
+
+async def _count(db_session: AsyncSession) -> int:
+    return await db_session.scalar(select(func.count()).select_from(AuditLog))
+
+
+@pytest.mark.asyncio
+async def test_writer_flushes_by_size_and_time(db_session: AsyncSession):
+    """Test a full batch is written at once and a partial one after flush_interval."""
+    writer = AuditLogWriter(
+        TestingSessionLocal, queue_size=10, batch_size=3, flush_interval=0.2, overflow="block"
+    )
+    await writer.start()
+    for _ in range(4):
+        await writer.record("wire.create", 1)
+
+    await asyncio.sleep(0.05)
+    assert await _count(db_session) == 3  # the full batch, without waiting
+    await asyncio.sleep(0.3)
+    assert await _count(db_session) == 4  # the remainder, once flush_interval passed
+
+    await writer.record("wire.delete", 1)
+    await writer.stop(timeout=1)  # shutdown flushes what is still queued
+    assert await _count(db_session) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("overflow", "kept"),
+    [("drop_newest", [0, 1]), ("drop_oldest", [2, 3])],
+)
+async def test_overflow_policies(db_session: AsyncSession, overflow: str, kept: list[int]):
+    """Test a full queue drops the incoming or the oldest event per policy."""
+    writer = AuditLogWriter(
+        TestingSessionLocal, queue_size=2, batch_size=10, flush_interval=0.01, overflow=overflow
+    )
+    # Queue without a running writer so the queue fills up
+    writer.queue = asyncio.Queue(writer.queue_size)
+    for entity_id in range(4):
+        await writer.record("wire.update", 1, "wire", entity_id)
+
+    assert [event["entity_id"] for event in writer.queue._queue] == kept
+
+
+@pytest.mark.asyncio
+async def test_record_nowait_drops_under_block(db_session: AsyncSession):
+    """Test the non-waiting variant drops the incoming event even with the block policy."""
+    writer = AuditLogWriter(
+        TestingSessionLocal, queue_size=2, batch_size=10, flush_interval=0.01, overflow="block"
+    )
+    writer.queue = asyncio.Queue(writer.queue_size)
+    dropped = REGISTRY.get_sample_value("audit_events_total", {"result": "dropped"}) or 0.0
+    for entity_id in range(4):
+        writer.record_nowait("auth.login_failed", None, "user", entity_id)
+
+    assert [event["entity_id"] for event in writer.queue._queue] == [0, 1]
+    assert REGISTRY.get_sample_value("audit_events_total", {"result": "dropped"}) == dropped + 2
+
+
+@pytest.mark.asyncio
+async def test_api_actions_are_audited_and_paginated(
+    client: AsyncClient, test_user: User, auth_headers: dict, audit_enabled: AuditLogWriter
+):
+    """Test wire writes and logins are recorded and readable page by page."""
+    response = await client.post(
+        "/api/wires",
+        json={"sender_name": "A", "recipient_name": "B", "amount": "12.50", "currency": "USD"},
+        headers=auth_headers,
+    )
+    wire_id = response.json()["id"]
+    await client.put(f"/api/wires/{wire_id}", json={"status": "processing"}, headers=auth_headers)
+    await client.delete(f"/api/wires/{wire_id}", headers=auth_headers)
+    await client.post(
+        "/api/auth/login", json={"email": test_user.email, "password": "testpassword123"}
+    )
+    await client.post("/api/auth/login", json={"email": test_user.email, "password": "wrong"})
+    await audit_enabled.flush()
+
+    response = await client.get("/api/audit", params={"limit": 3}, headers=auth_headers)
+    assert response.status_code == 200
+    first = response.json()
+    assert [event["action"] for event in first["events"]] == [
+        "auth.login_failed",
+        "auth.login",
+        "wire.delete",
+    ]
+    assert first["events"][0]["details"]["reason"] == "invalid_credentials"
+
+    response = await client.get(
+        "/api/audit", params={"limit": 3, "before": first["next_cursor"]}, headers=auth_headers
+    )
+    second = response.json()
+    assert [event["action"] for event in second["events"]] == ["wire.update", "wire.create"]
+    assert second["events"][0]["details"] == {"status": "processing"}
+    assert second["events"][1]["details"] == {"amount": "12.50", "currency": "USD"}
+    assert all(event["entity_id"] == wire_id for event in second["events"])
+    assert second["next_cursor"] is None
+
+    response = await client.get(
+        "/api/audit", params={"action": "wire.delete"}, headers=auth_headers
+    )
+    assert [event["entity_id"] for event in response.json()["events"]] == [wire_id]
+
+
+@pytest.mark.asyncio
+async def test_audit_api_disabled_by_default(client: AsyncClient, auth_headers: dict):
+    """Test the audit endpoint is hidden while FEATURE_AUDIT_LOG is off."""
+    response = await client.get("/api/audit", headers=auth_headers)
+
+    assert response.status_code == 404
+
+
+class FailingCommitSession(AsyncSession):
+    async def commit(self):
+        raise OperationalError("COMMIT", None, Exception("disk I/O error"))
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_is_not_audited(
+    db_session: AsyncSession, auth_headers: dict, audit_enabled: AuditLogWriter, monkeypatch
+):
+    """Test a wire write whose COMMIT fails leaves no audit record."""
+    # Only request sessions fail; the audit writer keeps TestingSessionLocal
+    monkeypatch.setattr(
+        app.database,
+        "AsyncSessionLocal",
+        async_sessionmaker(engine, class_=FailingCommitSession, expire_on_commit=False),
+    )
+
+    transport = ASGITransport(app=api, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/wires",
+            json={"sender_name": "A", "recipient_name": "B", "amount": "1.00", "currency": "USD"},
+            headers=auth_headers,
+        )
+    await audit_enabled.flush()
+
+    assert response.status_code == 500
+    assert await _count(db_session) == 0
@@ -2,8 +2,15 @@
 
 import pytest
 from httpx import AsyncClient
+from passlib.hash import argon2
+from redis.asyncio import Redis
 
+from app.config import settings
 from app.models import User
+from app.services.revocation_service import revocations
+from app.services.token_service import RefreshTokenFamilies, Rotation
+from app.utils.bloom import BloomFilter
+from app.utils.redis_client import RedisCache, cache
 
 
 @pytest.mark.asyncio
@@ -98,3 +105,182 @@ async def test_get_current_user_invalid_token(client: AsyncClient):
     )
 
     assert response.status_code == 401
+
+
+async def _login(client: AsyncClient, user: User) -> dict:
+    response = await client.post(
+        "/api/auth/login",
+        json={"email": user.email, "password": "testpassword123"},
+    )
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_tokens(client: AsyncClient, test_user: User):
+    """Test a refresh token buys a new pair whose access token works."""
+    tokens = await _login(client, test_user)
+
+    response = await client.post(
+        "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    response = await client.get(
+        "/api/auth/me", headers={"Authorization": f"Bearer {rotated['access_token']}"}
+    )
+    assert response.json()["id"] == test_user.id
+
+
+@pytest.mark.asyncio
+async def test_refresh_reuse_revokes_family(client: AsyncClient, test_user: User):
+    """Test replaying a rotated-out refresh token locks out the whole session."""
+    stolen = (await _login(client, test_user))["refresh_token"]
+    current = (await client.post("/api/auth/refresh", json={"refresh_token": stolen})).json()[
+        "refresh_token"
+    ]
+
+    response = await client.post("/api/auth/refresh", json={"refresh_token": stolen})
+    assert response.status_code == 401
+    assert "reuse" in response.json()["error"]
+
+    response = await client.post("/api/auth/refresh", json={"refresh_token": current})
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_token_types_are_not_interchangeable(client: AsyncClient, test_user: User):
+    """Test refresh tokens cannot authenticate requests and access tokens cannot refresh."""
+    tokens = await _login(client, test_user)
+
+    response = await client.get(
+        "/api/auth/me", headers={"Authorization": f"Bearer {tokens['refresh_token']}"}
+    )
+    assert response.status_code == 401
+
+    for token in (tokens["access_token"], "garbage"):
+        response = await client.post("/api/auth/refresh", json={"refresh_token": token})
+        assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_tokens(client: AsyncClient, test_user: User):
+    """Test logout revokes the access token used and the refresh token passed."""
+    tokens = await _login(client, test_user)
+    other = await _login(client, test_user)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    response = await client.post(
+        "/api/auth/logout", json={"refresh_token": tokens["refresh_token"]}, headers=headers
+    )
+
+    assert response.status_code == 204
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 401
+    response = await client.post(
+        "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 401
+    # Other sessions are unaffected
+    response = await client.get(
+        "/api/auth/me", headers={"Authorization": f"Bearer {other['access_token']}"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_logout_all_revokes_by_user(client: AsyncClient, test_user: User):
+    """Test logging out everywhere revokes earlier tokens but not later logins."""
+    tokens = await _login(client, test_user)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    assert (await client.post("/api/auth/logout-all", headers=headers)).status_code == 204
+
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 401
+    response = await client.post(
+        "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 401
+    fresh = await _login(client, test_user)
+    response = await client.get(
+        "/api/auth/me", headers={"Authorization": f"Bearer {fresh['access_token']}"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password_hash(
+    client: AsyncClient, test_user: User, db_session
+):
+    """Test a hash made with other Argon2 costs is upgraded on successful login."""
+    cheap = argon2.using(rounds=1, memory_cost=8192, parallelism=1)
+    test_user.hashed_password = cheap.hash("testpassword123")
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/auth/login", json={"email": test_user.email, "password": "wrongpassword"}
+    )
+    assert response.status_code == 401
+    await db_session.refresh(test_user)
+    assert "t=1" in test_user.hashed_password
+
+    await _login(client, test_user)
+    await db_session.refresh(test_user)
+    expected = (
+        f"m={settings.ARGON2_MEMORY_COST},t={settings.ARGON2_TIME_COST},"
+        f"p={settings.ARGON2_PARALLELISM}"
+    )
+    assert expected in test_user.hashed_password
+    assert (await _login(client, test_user))["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_with_redis_down(client: AsyncClient, test_user: User, monkeypatch):
+    """Test login still works without Redis, while refresh and logout fail with 503."""
+    # Earlier tests' revocations would send these tokens to Redis too
+    monkeypatch.setattr(revocations, "bloom", BloomFilter(100, 0.01))
+    # Nothing listens on port 1: every command fails with a connection error
+    unreachable = Redis(host="127.0.0.1", port=1)
+    monkeypatch.setattr(cache, "redis", unreachable)
+    try:
+        tokens = await _login(client, test_user)
+        assert tokens["access_token"]
+
+        response = await client.post(
+            "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert response.status_code == 503
+        response = await client.post(
+            "/api/auth/logout",
+            json={"refresh_token": tokens["refresh_token"]},
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        )
+        assert response.status_code == 503
+    finally:
+        await unreachable.aclose()
+
+    # The family started during the outage was kept in this process's memory
+    monkeypatch.setattr(cache, "redis", None)
+    response = await client.post(
+        "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_memory_families_are_bounded():
+    """Test in-memory families sweep expired entries, then drop the oldest."""
+    families = RefreshTokenFamilies(RedisCache("redis://unused"), max_memory_entries=3)
+
+    await families.start("expired", "jti", ttl=0)
+    for family_id in ("a", "b", "c"):
+        await families.start(family_id, "jti", ttl=30)
+    assert len(families._memory) == 3
+    assert await families.rotate("a", "jti", "jti-2", ttl=30) is Rotation.ROTATED
+
+    # "a" was just rewritten, so "b" is now the oldest
+    await families.start("d", "jti", ttl=30)
+    assert len(families._memory) == 3
+    assert await families.rotate("b", "jti", "jti-2", ttl=30) is Rotation.UNKNOWN
+    assert await families.rotate("a", "jti-2", "jti-3", ttl=30) is Rotation.ROTATED
+    assert await families.rotate("d", "jti", "jti-2", ttl=30) is Rotation.ROTATED
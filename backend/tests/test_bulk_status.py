@@ -0,0 +1,105 @@
+"""Tests for bulk wire status transitions."""
+
+import msgpack
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+from app.models import WireStatus, allowed_sources
+from app.services.summary_service import reconcile_wire_summaries
+
+
+async def _create_wires(client: AsyncClient, auth_headers: dict, count: int) -> list[int]:
+    ids = []
+    for i in range(count):
+        response = await client.post(
+            "/api/wires",
+            json={"sender_name": f"S{i}", "recipient_name": "R", "amount": 100 + i},
+            headers=auth_headers,
+        )
+        ids.append(response.json()["id"])
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_by_ids(client: AsyncClient, auth_headers: dict, db_session):
+    """Test allowed transitions apply, others are rejected, and the rollup stays exact."""
+    ids = await _create_wires(client, auth_headers, 4)
+
+    response = await client.patch(
+        "/api/wires/status",
+        json={"target_status": "failed", "ids": ids[:2]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["applied"] == ids[:2]
+
+    # Retry the failed ones; pending wires cannot move to pending, 999999 does not exist
+    response = await client.patch(
+        "/api/wires/status",
+        json={"target_status": "pending", "ids": [*ids, 999999]},
+        headers=auth_headers,
+    )
+    assert response.json() == {
+        "target_status": "pending",
+        "applied": ids[:2],
+        "rejected": [*ids[2:], 999999],
+    }
+
+    wire = (await client.get(f"/api/wires/{ids[0]}", headers=auth_headers)).json()
+    assert wire["status"] == "pending"
+    assert wire["version"] == 3
+    assert await reconcile_wire_summaries(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_by_filter_in_chunks(
+    client: AsyncClient, auth_headers: dict, monkeypatch
+):
+    """Test a filter is walked in chunks and list ETags are invalidated."""
+    monkeypatch.setattr(settings, "BULK_STATUS_CHUNK_SIZE", 2)
+    ids = await _create_wires(client, auth_headers, 5)
+    etag = (await client.get("/api/wires", headers=auth_headers)).headers["ETag"]
+
+    response = await client.patch(
+        "/api/wires/status",
+        json={"target_status": "processing", "filter": {"status": "pending"}},
+        headers=auth_headers,
+    )
+
+    assert response.json()["applied"] == ids
+    assert response.json()["rejected"] == []
+    response = await client.get(
+        "/api/wires?status=processing", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_msgpack_and_validation(client: AsyncClient, auth_headers: dict):
+    """Test the batch body may be MessagePack and must select wires exactly one way."""
+    ids = await _create_wires(client, auth_headers, 1)
+
+    response = await client.patch(
+        "/api/wires/status",
+        content=msgpack.packb({"target_status": "completed", "ids": ids}),
+        headers={**auth_headers, "Content-Type": "application/msgpack"},
+    )
+    assert response.status_code == 200
+    assert response.json()["rejected"] == ids
+
+    for body in (
+        {"target_status": "failed"},
+        {"target_status": "failed", "ids": ids, "filter": {}},
+        {"target_status": "archived", "ids": ids},
+    ):
+        response = await client.patch("/api/wires/status", json=body, headers=auth_headers)
+        assert response.status_code == 422
+
+
+def test_allowed_sources():
+    """Test the state machine: completed is final, failed wires can be retried."""
+    assert allowed_sources(WireStatus.PENDING) == (WireStatus.FAILED,)
+    assert allowed_sources(WireStatus.COMPLETED) == (WireStatus.PROCESSING,)
+    assert set(allowed_sources(WireStatus.FAILED)) == {WireStatus.PENDING, WireStatus.PROCESSING}
@@ -0,0 +1,91 @@
+"""Tests for database session management."""
+
+import pytest
+from fastapi import Request
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.database
+from app.database import get_db
+from app.main import app as api
+from app.models import User, Wire
+from tests.conftest import TestingSessionLocal, engine
+
+
+async def _run_request(method: str) -> int:
+    """Drive get_db through one request and return the number of commits."""
+    commits = []
+    dependency = get_db(Request({"type": "http", "method": method, "headers": []}))
+    session = await anext(dependency)
+    event.listen(session.sync_session, "after_commit", commits.append)
+
+    await session.execute(select(User))
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(dependency)
+    return len(commits)
+
+
+@pytest.mark.asyncio
+async def test_get_db_read_only_skips_commit(db_session: AsyncSession, monkeypatch):
+    """Test GET requests never commit."""
+    monkeypatch.setattr(app.database, "AsyncSessionLocal", TestingSessionLocal)
+
+    assert await _run_request("GET") == 0
+
+
+@pytest.mark.asyncio
+async def test_get_db_write_commits_once(db_session: AsyncSession, monkeypatch):
+    """Test write requests commit exactly once."""
+    monkeypatch.setattr(app.database, "AsyncSessionLocal", TestingSessionLocal)
+
+    assert await _run_request("POST") == 1
+
+
+@pytest.mark.asyncio
+async def test_get_db_lazy_connection(db_session: AsyncSession, monkeypatch):
+    """Test no connection is checked out until the first query."""
+    monkeypatch.setattr(app.database, "AsyncSessionLocal", TestingSessionLocal)
+    checkouts = []
+
+    def on_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(engine.sync_engine.pool, "checkout", on_checkout)
+
+    try:
+        dependency = get_db(Request({"type": "http", "method": "GET", "headers": []}))
+        session = await anext(dependency)
+        assert checkouts == []
+
+        await session.execute(select(User))
+        assert len(checkouts) == 1
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+    finally:
+        event.remove(engine.sync_engine.pool, "checkout", on_checkout)
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_is_reported(db_session: AsyncSession, auth_headers: dict, monkeypatch):
+    """Test a write whose COMMIT fails answers 500 rather than the 201 already built."""
+    monkeypatch.setattr(app.database, "AsyncSessionLocal", TestingSessionLocal)
+
+    async def failing_commit(self):
+        raise OperationalError("COMMIT", None, Exception("disk I/O error"))
+
+    monkeypatch.setattr(AsyncSession, "commit", failing_commit)
+
+    transport = ASGITransport(app=api, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/wires",
+            json={"sender_name": "A", "recipient_name": "B", "amount": "10.00", "currency": "USD"},
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 500
+    assert await db_session.scalar(select(func.count()).select_from(Wire)) == 0
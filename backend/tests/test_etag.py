@@ -0,0 +1,175 @@
+"""Tests for ETags and conditional requests on wire endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.models import User
+from app.utils.etag import etag_matches, if_match_versions
+from tests.conftest import assert_max_queries
+
+
+@pytest.mark.asyncio
+async def test_get_wire_not_modified(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test a matching If-None-Match returns an empty 304 from a narrow lookup."""
+    response = await client.get(f"/api/wires/{test_wire.id}", headers=auth_headers)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = await client.get(
+        f"/api/wires/{test_wire.id}", headers={**auth_headers, "If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    # auth + the timestamp lookup; the wire row itself is never loaded
+    assert response.headers["X-Query-Count"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_get_wire_etag_changes_on_update(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test an update invalidates the old ETag and the PUT returns the new one."""
+    etag = (await client.get(f"/api/wires/{test_wire.id}", headers=auth_headers)).headers["ETag"]
+
+    updated = await client.put(
+        f"/api/wires/{test_wire.id}", json={"recipient_name": "New Name"}, headers=auth_headers
+    )
+    response = await client.get(
+        f"/api/wires/{test_wire.id}", headers={**auth_headers, "If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["recipient_name"] == "New Name"
+    assert response.headers["ETag"] != etag
+    assert response.headers["ETag"] == updated.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_list_wires_not_modified(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test the list is revalidated from the user's version without querying wires."""
+    response = await client.get("/api/wires", headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    response = await client.get("/api/wires", headers={**auth_headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["X-Query-Count"] == "1"
+
+    # Different query parameters are a different representation
+    response = await client.get(
+        "/api/wires?page_size=5", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_list_etag_changes_on_write(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test creating and deleting wires invalidates list ETags."""
+    etag = (await client.get("/api/wires", headers=auth_headers)).headers["ETag"]
+
+    await client.post(
+        "/api/wires",
+        json={"sender_name": "A", "recipient_name": "B", "amount": 10, "currency": "USD"},
+        headers=auth_headers,
+    )
+    response = await client.get("/api/wires", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
+    etag = response.headers["ETag"]
+
+    await client.delete(f"/api/wires/{test_wire.id}", headers=auth_headers)
+    response = await client.get("/api/wires", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_wire_writes_keep_user_updated_at(
+    client: AsyncClient, auth_headers: dict, test_user: User, db_session
+):
+    """Test bumping the list version leaves the user's own updated_at alone."""
+    user_id = test_user.id
+    before = await db_session.scalar(select(User.updated_at).where(User.id == user_id))
+
+    await client.post(
+        "/api/wires",
+        json={"sender_name": "A", "recipient_name": "B", "amount": 10, "currency": "USD"},
+        headers=auth_headers,
+    )
+
+    db_session.expire_all()
+    user = await db_session.scalar(select(User).where(User.id == user_id))
+    assert user.wires_version > 0
+    assert user.updated_at == before
+
+
+@pytest.mark.asyncio
+async def test_if_match_prevents_lost_updates(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test two writers holding the same ETag: the second gets 409 and the current ETag."""
+    etag = (await client.get(f"/api/wires/{test_wire.id}", headers=auth_headers)).headers["ETag"]
+    assert etag == '"1"'
+
+    first = await client.put(
+        f"/api/wires/{test_wire.id}",
+        json={"recipient_name": "First"},
+        headers={**auth_headers, "If-Match": etag},
+    )
+    second = await client.put(
+        f"/api/wires/{test_wire.id}",
+        json={"recipient_name": "Second"},
+        headers={**auth_headers, "If-Match": etag},
+    )
+
+    assert first.status_code == 200
+    assert first.json()["version"] == 2
+    assert second.status_code == 409
+    assert second.headers["ETag"] == first.headers["ETag"] == '"2"'
+
+    response = await client.delete(
+        f"/api/wires/{test_wire.id}", headers={**auth_headers, "If-Match": etag}
+    )
+    assert response.status_code == 409
+    response = await client.delete(
+        f"/api/wires/{test_wire.id}", headers={**auth_headers, "If-Match": first.headers["ETag"]}
+    )
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_guarded_writes_round_trips(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test updates and deletes are single statements plus bookkeeping."""
+    response = await client.put(
+        f"/api/wires/{test_wire.id}", json={"recipient_name": "Renamed"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    # auth, UPDATE ... RETURNING, list-ETag version bump
+    assert_max_queries(response, 3)
+
+    response = await client.delete(f"/api/wires/{test_wire.id}", headers=auth_headers)
+    assert response.status_code == 204
+    # auth, DELETE ... RETURNING, summary upsert, version bump
+    assert_max_queries(response, 4)
+
+    response = await client.put(
+        f"/api/wires/{test_wire.id}", json={"recipient_name": "Gone"}, headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+def test_if_match_versions():
+    """Test If-Match parsing maps entity tags back to wire versions."""
+    assert if_match_versions('"3"') == [3]
+    assert if_match_versions('"3+msgpack", W/"4"') == [3, 4]
+    assert if_match_versions('"abc"') == []
+    assert if_match_versions("*") is None
+    assert if_match_versions(None) is None
+
+
+def test_etag_matches():
+    """Test If-None-Match parsing: lists, weak validators and the wildcard."""
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
@@ -0,0 +1,120 @@
+"""Tests for the Server-Sent Events stream of wire updates."""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from app.models import User
+from app.routers.websocket import ConnectionManager
+from app.services.event_service import WireEventBroker, sse_stream
+from app.utils.redis_client import RedisCache
+from app.utils.security import create_access_token
+
+
+def _broker(backlog: int = 100) -> WireEventBroker:
+    return WireEventBroker(RedisCache("redis://unused"), backlog=backlog)
+
+
+def _event(wire_id: int, user_id: int = 1) -> dict:
+    return {"type": "wire_update", "wire_id": wire_id, "status": "failed", "user_id": user_id}
+
+
+@pytest.mark.asyncio
+async def test_stream_filters_by_user_and_sends_heartbeats():
+    """Test a stream only carries its user's events, with heartbeats while idle."""
+    broker = _broker()
+    stream = sse_stream(1, None, until=time.time() + 5, heartbeat=0.05, broker=broker)
+    assert (await anext(stream)).startswith("retry: ")
+
+    await broker.publish(_event(10))
+    await broker.publish(_event(20, user_id=2))
+
+    first = await anext(stream)
+    assert first.startswith("id: 1-0\nevent: wire_update\ndata: ")
+    assert '"wire_id": 10' in first
+    assert await anext(stream) == ": heartbeat\n\n"
+    await stream.aclose()
+    assert broker.subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_from_last_event_id():
+    """Test Last-Event-ID replays retained events, or asks for a reset after a gap."""
+    broker = _broker(backlog=3)
+    for wire_id in range(1, 6):
+        await broker.publish(_event(wire_id))
+
+    stream = sse_stream(1, "3-0", until=time.time() + 0.1, heartbeat=1, broker=broker)
+    chunks = [chunk async for chunk in stream]
+    assert [chunk.split("\n")[0] for chunk in chunks[1:]] == ["id: 4-0", "id: 5-0"]
+
+    stream = sse_stream(1, "1-0", until=time.time() + 0.1, heartbeat=1, broker=broker)
+    chunks = [chunk async for chunk in stream]
+    assert chunks[1].startswith("event: reset")
+    assert len(chunks) == 5
+
+
+@pytest.mark.asyncio
+async def test_events_endpoint_streams_status_changes(
+    client: AsyncClient, test_user: User, auth_headers: dict
+):
+    """Test a status change reaches the stream, which ends when the token expires."""
+    created = await client.post(
+        "/api/wires",
+        json={"sender_name": "A", "recipient_name": "B", "amount": 10},
+        headers=auth_headers,
+    )
+    wire_id = created.json()["id"]
+    await client.put(f"/api/wires/{wire_id}", json={"status": "failed"}, headers=auth_headers)
+
+    token = create_access_token(data={"sub": str(test_user.id)}, expires_delta=timedelta(seconds=2))
+    response = await client.get(
+        "/api/wires/events",
+        headers={"Authorization": f"Bearer {token}", "Last-Event-ID": "0-0"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "content-encoding" not in response.headers
+    assert f'"wire_id": {wire_id}, "status": "failed"' in response.text
+
+
+@pytest.mark.asyncio
+async def test_slow_websocket_client_does_not_stall_streams():
+    """Test a WebSocket client that never reads holds up neither SSE nor itself for long."""
+
+    class StuckWebSocket:
+        closed = None
+
+        async def accept(self):
+            pass
+
+        async def send_json(self, message):
+            await asyncio.Event().wait()
+
+        async def close(self, code):
+            self.closed = code
+
+    broker = _broker()
+    manager = ConnectionManager(queue_size=2)
+    broker.add_listener(manager.broadcast)
+    websocket = StuckWebSocket()
+    await manager.connect(websocket)
+    stream = sse_stream(1, None, until=time.time() + 5, heartbeat=5, broker=broker)
+    await anext(stream)
+    await asyncio.sleep(0)  # the sender task starts and blocks on the stuck client
+
+    for wire_id in range(5):
+        async with asyncio.timeout(1):
+            await broker.publish(_event(wire_id))
+    async with asyncio.timeout(1):
+        assert '"wire_id": 0' in await anext(stream)
+
+    # Fell more than queue_size messages behind: dropped and closed
+    await asyncio.sleep(0)
+    assert websocket not in manager.active_connections
+    assert websocket.closed == 1013
+    await stream.aclose()
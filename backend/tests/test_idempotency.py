@@ -0,0 +1,135 @@
+"""Tests for Idempotency-Key handling on wire creation."""
+
+import asyncio
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.database
+from app.main import app as api
+from app.models import Wire
+from app.utils.idempotency import IdempotencyStore
+from app.utils.redis_client import RedisCache
+from tests.conftest import TestingSessionLocal
+
+WIRE = {"sender_name": "Alice", "recipient_name": "Bob", "amount": 500, "currency": "USD"}
+
+
+async def _wire_count(db_session) -> int:
+    return (await db_session.execute(select(func.count(Wire.id)))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_original_response(client: AsyncClient, auth_headers: dict, db_session):
+    """Test a retried create returns the stored response without any queries."""
+    headers = {**auth_headers, "Idempotency-Key": str(uuid.uuid4())}
+
+    first = await client.post("/api/wires", json=WIRE, headers=headers)
+    retry = await client.post("/api/wires", json=WIRE, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.headers["X-Query-Count"] == "0"
+    assert await _wire_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_wait_for_original(
+    client: AsyncClient, auth_headers: dict, db_session
+):
+    """Test simultaneous requests with one key create a single wire."""
+    headers = {**auth_headers, "Idempotency-Key": str(uuid.uuid4())}
+
+    responses = await asyncio.gather(
+        *(client.post("/api/wires", json=WIRE, headers=headers) for _ in range(3))
+    )
+
+    assert [response.status_code for response in responses] == [201, 201, 201]
+    assert len({response.json()["id"] for response in responses}) == 1
+    assert await _wire_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_original_lets_duplicates_run(
+    db_session: AsyncSession, auth_headers: dict, monkeypatch
+):
+    """Test a create whose COMMIT fails is not stored, and its waiting duplicates run."""
+    monkeypatch.setattr(app.database, "AsyncSessionLocal", TestingSessionLocal)
+    commit = AsyncSession.commit
+    failures = [OperationalError("COMMIT", None, Exception("disk I/O error"))]
+
+    async def fail_first_commit(self):
+        if failures:
+            raise failures.pop()
+        await commit(self)
+
+    monkeypatch.setattr(AsyncSession, "commit", fail_first_commit)
+    headers = {**auth_headers, "Idempotency-Key": str(uuid.uuid4())}
+
+    transport = ASGITransport(app=api, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(
+            *(client.post("/api/wires", json=WIRE, headers=headers) for _ in range(3))
+        )
+        retry = await client.post("/api/wires", json=WIRE, headers=headers)
+
+    assert sorted(response.status_code for response in responses) == [201, 201, 500]
+    created = {response.json()["id"] for response in responses if response.status_code == 201}
+    assert len(created) == 1
+    assert retry.status_code == 201
+    assert retry.json()["id"] in created
+    assert await _wire_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_key_reuse_and_validation(client: AsyncClient, auth_headers: dict):
+    """Test a key reused for a different body, or an oversized key, is rejected."""
+    headers = {**auth_headers, "Idempotency-Key": str(uuid.uuid4())}
+    await client.post("/api/wires", json=WIRE, headers=headers)
+
+    response = await client.post("/api/wires", json={**WIRE, "amount": 501}, headers=headers)
+    assert response.status_code == 422
+    assert "different request" in response.json()["error"]
+
+    response = await client.post(
+        "/api/wires", json=WIRE, headers={**auth_headers, "Idempotency-Key": "k" * 256}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_memory_store_reserve_and_release():
+    """Test the in-process fallback reserves once and frees keys on release."""
+    store = IdempotencyStore(RedisCache("redis://unused"))
+
+    assert await store.reserve("user:1", "key", "abc", ttl=30) is None
+    existing = await store.reserve("user:1", "key", "abc", ttl=30)
+    assert existing.state == "in_flight"
+    assert await store.reserve("user:2", "key", "abc", ttl=30) is None
+
+    await store.release("user:1", "key")
+    assert await store.reserve("user:1", "key", "abc", ttl=30) is None
+    assert await store.reserve("user:3", "expired", "abc", ttl=0) is None
+    assert await store.get("user:3", "expired") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_store_is_bounded():
+    """Test the in-process fallback sweeps expired records, then drops the oldest."""
+    store = IdempotencyStore(RedisCache("redis://unused"), max_memory_entries=3)
+
+    await store.reserve("user:1", "expired", "abc", ttl=0)
+    for key in ("a", "b", "c"):
+        await store.reserve("user:1", key, "abc", ttl=30)
+    assert len(store._memory) == 3
+    assert await store.get("user:1", "a") is not None
+
+    await store.reserve("user:1", "d", "abc", ttl=30)
+    assert len(store._memory) == 3
+    assert await store.get("user:1", "a") is None
+    assert await store.get("user:1", "d") is not None
@@ -0,0 +1,93 @@
+"""Tests for the embedded job runner."""
+
+import asyncio
+
+import pytest
+
+from app.services import jobs
+from app.services.background_tasks import send_wire_notification
+from app.services.job_runner import JobPriority, JobRunner
+from tests.conftest import TestingSessionLocal
+
+
+def _runner(registry: dict, concurrency: int = 1, queue_size: int = 10) -> JobRunner:
+    return JobRunner(
+        TestingSessionLocal,
+        concurrency=concurrency,
+        queue_size=queue_size,
+        max_retries=2,
+        backoff=0.01,
+        backoff_max=0.05,
+        jobs=registry,
+    )
+
+
+@pytest.mark.asyncio
+async def test_priorities_and_bounded_queue():
+    """Test higher priorities run first and a full queue rejects new jobs."""
+    ran = []
+    gate = asyncio.Event()
+
+    async def record(db, label: str):
+        await gate.wait()
+        ran.append(label)
+
+    runner = _runner({"record": record}, queue_size=3)
+    await runner.start()
+    runner.submit("record", label="first")
+    await asyncio.sleep(0)  # the single worker is now busy with "first"
+    runner.submit("record", JobPriority.LOW, label="low")
+    runner.submit("record", JobPriority.NORMAL, label="normal")
+    runner.submit("record", JobPriority.HIGH, label="high")
+    with pytest.raises(asyncio.QueueFull):
+        runner.submit("record", label="overflow")
+
+    gate.set()
+    await runner.stop(timeout=1)
+    assert ran == ["first", "high", "normal", "low"]
+
+
+@pytest.mark.asyncio
+async def test_retries_with_backoff_then_gives_up():
+    """Test failing jobs are retried up to max_retries and then dropped."""
+    attempts = {"flaky": 0, "broken": 0}
+
+    async def flaky(db):
+        attempts["flaky"] += 1
+        if attempts["flaky"] < 3:
+            raise ConnectionError("provider unavailable")
+
+    async def broken(db):
+        attempts["broken"] += 1
+        raise ValueError("bad payload")
+
+    runner = _runner({"flaky": flaky, "broken": broken}, concurrency=2)
+    await runner.start()
+    runner.submit("flaky")
+    runner.submit("broken")
+    await runner.stop(timeout=2)
+
+    assert attempts == {"flaky": 3, "broken": 3}
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_running_jobs(monkeypatch):
+    """Test shutdown waits for queued work and the shared job functions don't block."""
+    monkeypatch.setattr(jobs, "NOTIFICATION_SECONDS", 0.05)
+    runner = _runner(jobs.JOBS, concurrency=4)
+    await runner.start()
+    for wire_id in range(8):
+        runner.submit("send_wire_notification", wire_id=wire_id, user_email="a@b.c", status="ok")
+
+    # Eight 50 ms jobs on four workers: ~100 ms if the sleeps overlap
+    started = asyncio.get_running_loop().time()
+    await runner.stop(timeout=5)
+    assert asyncio.get_running_loop().time() - started < 0.5
+    assert runner.queue.empty()
+    with pytest.raises(RuntimeError):
+        runner.submit("send_wire_notification", wire_id=1, user_email="a@b.c", status="ok")
+
+    # The Celery task runs the very same function (on its own loop, as in a worker)
+    task = await asyncio.to_thread(send_wire_notification.apply, args=(5, "a@b.c", "completed"))
+    result = task.get()
+    assert result == {"wire_id": 5, "email": "a@b.c", "status": "completed", "sent": True}
@@ -0,0 +1,112 @@
+"""Tests for Prometheus metrics."""
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.routers.websocket import ConnectionManager
+from app.services.cache_service import CacheService
+from app.utils.metrics import instrument_engine
+from app.utils.redis_client import RedisCache
+
+
+def _sample(name: str, labels: dict) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_records_route_latency(
+    client: AsyncClient, auth_headers: dict, test_wire
+):
+    """Test requests are recorded under their route template."""
+    labels = {"method": "GET", "route": "/api/wires/{wire_id}", "status": "200"}
+    before = _sample("http_request_duration_seconds_count", labels)
+
+    await client.get(f"/api/wires/{test_wire.id}", headers=auth_headers)
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "http_request_duration_seconds_bucket" in response.text
+    assert _sample("http_request_duration_seconds_count", labels) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_db_query_metrics():
+    """Test statements executed through an instrumented engine are timed."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine.sync_engine)
+    before = _sample("db_query_duration_seconds_count", {"operation": "select"})
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    await engine.dispose()
+
+    assert _sample("db_query_duration_seconds_count", {"operation": "select"}) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_db_query_metrics_after_failed_statement():
+    """Test a failed statement leaves no start time behind for the next one to pop."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine.sync_engine)
+
+    async with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            await conn.execute(text("SELECT * FROM missing_table"))
+        assert conn.sync_connection.info["query_start"] == []
+        await conn.execute(text("SELECT 1"))
+        assert conn.sync_connection.info["query_start"] == []
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_cache_metrics():
+    """Test cache hits, misses and errors are counted per key family."""
+
+    class FlakyRedis:
+        def __init__(self):
+            self.store = {"wire:1": '{"id": 1}'}
+
+        async def get(self, key):
+            if key == "wire:3":
+                raise ConnectionError("redis down")
+            return self.store.get(key)
+
+    cache_service = CacheService(RedisCache("redis://fake"))
+    cache_service.cache.redis = FlakyRedis()
+
+    def counts():
+        return [
+            _sample("cache_operations_total", {"family": "wire", "result": result})
+            for result in ("hit", "miss", "error")
+        ]
+
+    before = counts()
+    assert await cache_service.get_wire(1) == {"id": 1}
+    assert await cache_service.get_wire(2) is None
+    assert await cache_service.get_wire(3) is None
+
+    assert [after - prior for after, prior in zip(counts(), before, strict=True)] == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_websocket_connection_gauge():
+    """Test the active connection gauge follows connects and disconnects."""
+
+    class FakeWebSocket:
+        async def accept(self):
+            pass
+
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    before = _sample("websocket_connections_active", {})
+
+    await manager.connect(websocket)
+    assert _sample("websocket_connections_active", {}) == before + 1
+
+    manager.disconnect(websocket)
+    manager.disconnect(websocket)
+    assert _sample("websocket_connections_active", {}) == before
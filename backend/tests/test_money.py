@@ -0,0 +1,82 @@
+"""Tests for amounts stored as integer minor units."""
+
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Wire
+
+
+async def _create(client: AsyncClient, headers: dict, amount: str, currency: str):
+    return await client.post(
+        "/api/wires",
+        json={"sender_name": "A", "recipient_name": "B", "amount": amount, "currency": currency},
+        headers=headers,
+    )
+
+
+@pytest.mark.asyncio
+async def test_amounts_round_trip_exactly(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession
+):
+    """Test each currency keeps exactly its own number of decimal places."""
+    cases = [
+        ("9999999999999.99", "USD", 999999999999999, "9999999999999.99"),
+        ("0.001", "BHD", 1, "0.001"),
+        ("1500", "JPY", 1500, "1500"),
+        ("10.5", "EUR", 1050, "10.50"),
+    ]
+    for amount, currency, minor, returned in cases:
+        response = await _create(client, auth_headers, amount, currency)
+        assert response.status_code == 201
+        assert response.json()["amount"] == returned
+
+        wire = await db_session.get(Wire, response.json()["id"])
+        assert wire.amount_minor == minor
+
+
+@pytest.mark.asyncio
+async def test_amount_places_follow_currency(client: AsyncClient, auth_headers: dict):
+    """Test amounts finer than the currency's minor unit are rejected, not rounded."""
+    assert (await _create(client, auth_headers, "100.5", "JPY")).status_code == 422
+    assert (await _create(client, auth_headers, "1.005", "USD")).status_code == 422
+
+    created = (await _create(client, auth_headers, "10.50", "USD")).json()
+    # Only the currency given: the stored 10.50 does not fit yen
+    response = await client.put(
+        f"/api/wires/{created['id']}", json={"currency": "JPY"}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+    # Only the amount given: checked against the stored currency
+    response = await client.put(
+        f"/api/wires/{created['id']}", json={"amount": "0.125"}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+    response = await client.put(
+        f"/api/wires/{created['id']}", json={"currency": "BHD"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["amount"] == "10.500"
+
+
+@pytest.mark.asyncio
+async def test_amount_filter_and_summary_across_exponents(client: AsyncClient, auth_headers: dict):
+    """Test range filters and totals scale by each currency's exponent."""
+    await _create(client, auth_headers, "150", "JPY")
+    await _create(client, auth_headers, "99.99", "USD")
+    await _create(client, auth_headers, "100.001", "KWD")
+    await _create(client, auth_headers, "0.50", "USD")
+
+    response = await client.get("/api/wires?min_amount=99.995", headers=auth_headers)
+    assert sorted(wire["currency"] for wire in response.json()["wires"]) == ["JPY", "KWD"]
+
+    response = await client.get("/api/wires?max_amount=99.995&currency=USD", headers=auth_headers)
+    assert response.json()["total"] == 2
+
+    response = await client.get("/api/wires/summary", headers=auth_headers)
+    totals = {item["currency"]: Decimal(item["total_amount"]) for item in response.json()["items"]}
+    assert totals == {"JPY": Decimal("150"), "USD": Decimal("100.49"), "KWD": Decimal("100.001")}
@@ -0,0 +1,128 @@
+"""Tests for MessagePack negotiation and response compression."""
+
+import asyncio
+import gzip
+from decimal import Decimal
+
+import brotli
+import msgpack
+import pytest
+from httpx import AsyncClient
+
+from app.middleware.compression import choose_encoding
+from app.utils.negotiation import prefers_msgpack
+
+MSGPACK = "application/msgpack"
+
+
+@pytest.mark.asyncio
+async def test_create_and_get_wire_msgpack(client: AsyncClient, auth_headers: dict):
+    """Test a MessagePack body is validated like JSON and answered in kind."""
+    body = msgpack.packb(
+        {"sender_name": "Alice", "recipient_name": "Bob", "amount": "1250.50", "currency": "EUR"}
+    )
+    headers = {**auth_headers, "Content-Type": MSGPACK, "Accept": MSGPACK}
+
+    response = await client.post("/api/wires", content=body, headers=headers)
+
+    assert response.status_code == 201
+    assert response.headers["Content-Type"] == MSGPACK
+    created = msgpack.unpackb(response.content)
+    assert created["sender_name"] == "Alice"
+
+    response = await client.get(f"/api/wires/{created['id']}", headers=auth_headers)
+    assert response.headers["Content-Type"] == "application/json"
+    fetched = response.json()
+    assert fetched["reference_number"] == created["reference_number"]
+    assert Decimal(fetched["amount"]) == Decimal(created["amount"]) == Decimal("1250.50")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_get_their_own_format(
+    client: AsyncClient, auth_headers: dict, test_wire
+):
+    """Test interleaved JSON and MessagePack requests each get the format they asked for."""
+    accepts = ["application/json", MSGPACK] * 5
+
+    responses = await asyncio.gather(
+        *(
+            client.get(f"/api/wires/{test_wire.id}", headers={**auth_headers, "Accept": accept})
+            for accept in accepts
+        )
+    )
+
+    for accept, response in zip(accepts, responses):
+        assert response.headers["Content-Type"] == accept
+        assert response.headers["ETag"].endswith('+msgpack"') == (accept == MSGPACK)
+        decoded = msgpack.unpackb(response.content) if accept == MSGPACK else response.json()
+        assert decoded["id"] == test_wire.id
+
+
+@pytest.mark.asyncio
+async def test_msgpack_body_errors(client: AsyncClient, auth_headers: dict):
+    """Test invalid MessagePack bodies get the same errors as invalid JSON."""
+    headers = {**auth_headers, "Content-Type": MSGPACK}
+
+    response = await client.post(
+        "/api/wires", content=msgpack.packb({"sender_name": "Alice"}), headers=headers
+    )
+    assert response.status_code == 422
+
+    response = await client.post("/api/wires", content=b"\xc1", headers=headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_wires_msgpack_etag(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test JSON and MessagePack listings carry distinct ETags and Vary on Accept."""
+    as_json = await client.get("/api/wires", headers=auth_headers)
+    as_msgpack = await client.get("/api/wires", headers={**auth_headers, "Accept": MSGPACK})
+
+    assert msgpack.unpackb(as_msgpack.content)["wires"] == as_json.json()["wires"]
+    assert as_json.headers["ETag"] != as_msgpack.headers["ETag"]
+    assert "Accept" in as_msgpack.headers["Vary"]
+
+    response = await client.get(
+        "/api/wires",
+        headers={**auth_headers, "Accept": MSGPACK, "If-None-Match": as_msgpack.headers["ETag"]},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_large_responses_compressed(client: AsyncClient, auth_headers: dict):
+    """Test bodies above the threshold are compressed with the preferred coding."""
+    for i in range(20):
+        await client.post(
+            "/api/wires",
+            json={"sender_name": f"S{i}", "recipient_name": "R", "amount": 10, "currency": "USD"},
+            headers=auth_headers,
+        )
+
+    for encoding, decompress in (("br", brotli.decompress), ("gzip", gzip.decompress)):
+        async with client.stream(
+            "GET", "/api/wires", headers={**auth_headers, "Accept-Encoding": encoding}
+        ) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+        assert response.headers["Content-Encoding"] == encoding
+        assert response.headers["ETag"].startswith("W/")
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert len(decompress(raw)) > len(raw)
+
+    small = await client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small.headers
+
+
+def test_negotiation_helpers():
+    """Test Accept and Accept-Encoding parsing honours q-values."""
+    assert prefers_msgpack("application/msgpack")
+    assert prefers_msgpack("application/json;q=0.5, application/msgpack")
+    assert not prefers_msgpack("application/msgpack;q=0.5, application/json")
+    assert not prefers_msgpack("*/*")
+    assert not prefers_msgpack(None)
+
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("gzip;q=1, br;q=0.5") == "gzip"
+    assert choose_encoding("br;q=0, *") == "gzip"
+    assert choose_encoding("identity") is None
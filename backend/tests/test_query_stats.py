@@ -0,0 +1,126 @@
+"""Tests for per-request query accounting and query budgets."""
+
+import logging
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.config import settings
+from app.utils.query_stats import redact_parameters, track_queries
+from tests.conftest import assert_max_queries, engine
+
+
+@pytest.mark.asyncio
+async def test_query_headers(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test responses report the statements and database time they used."""
+    response = await client.get(f"/api/wires/{test_wire.id}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Query-Count"]) >= 1
+    assert float(response.headers["X-DB-Time"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_wire_endpoint_query_budgets(client: AsyncClient, auth_headers: dict, test_wire):
+    """Test the core wire endpoints stay within their query budgets."""
+    response = await client.post(
+        "/api/wires",
+        json={
+            "sender_name": "Alice",
+            "recipient_name": "Bob",
+            "amount": 250.00,
+            "currency": "USD",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    # auth, reference check, insert, summary upsert, list-ETag version bump
+    assert_max_queries(response, 5)
+
+    response = await client.get("/api/wires?page=1&page_size=20", headers=auth_headers)
+    assert response.status_code == 200
+    assert_max_queries(response, 3)
+
+    response = await client.get(f"/api/wires/{test_wire.id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert_max_queries(response, 2)
+
+    response = await client.put(
+        f"/api/wires/{test_wire.id}", json={"status": "processing"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    # auth, prior status read (SQLite only), UPDATE ... RETURNING, summary, version bump
+    assert_max_queries(response, 5)
+
+
+@pytest.mark.asyncio
+async def test_list_query_count_independent_of_page_size(
+    client: AsyncClient, auth_headers: dict, test_user
+):
+    """Test listing more wires does not issue more statements (no N+1)."""
+    for i in range(12):
+        await client.post(
+            "/api/wires",
+            json={
+                "sender_name": f"Sender {i}",
+                "recipient_name": "Bob",
+                "amount": 10 + i,
+                "currency": "USD",
+            },
+            headers=auth_headers,
+        )
+
+    small = await client.get("/api/wires?page_size=1", headers=auth_headers)
+    large = await client.get("/api/wires?page_size=12", headers=auth_headers)
+
+    assert small.headers["X-Query-Count"] == large.headers["X-Query-Count"]
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_repeats(db_session):
+    """Test identical statements are grouped so N+1 loops stand out."""
+    with track_queries() as stats:
+        for _ in range(3):
+            await db_session.execute(text("SELECT 1"))
+
+    assert stats.count == 3
+    assert stats.repeated(3) == [("SELECT 1", 3)]
+    assert stats.repeated(4) == []
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_is_not_counted(db_session):
+    """Test a failed statement leaves no start time behind for the next one to pop."""
+    async with engine.connect() as conn:
+        with track_queries() as stats:
+            with pytest.raises(OperationalError):
+                await conn.execute(text("SELECT * FROM missing_table"))
+            await conn.execute(text("SELECT 1"))
+
+        assert conn.sync_connection.info["query_stats_start"] == []
+    assert stats.count == 1
+    assert stats.repeated(1) == [("SELECT 1", 1)]
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log_redacts_parameters(db_session, monkeypatch, caplog):
+    """Test slow statements are logged without their parameter values."""
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.utils.query_stats"):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT :secret"), {"secret": "hunter2"})
+
+    assert "Slow query" in caplog.text
+    assert "params=(?)" in caplog.text
+    assert "hunter2" not in caplog.text
+
+
+def test_redact_parameters():
+    """Test parameter redaction keeps shape but drops values."""
+    assert redact_parameters({"a": 1, "b": "x"}) == "{a=?, b=?}"
+    assert redact_parameters(("x", 2)) == "(?, ?)"
+    assert redact_parameters([("x",), ("y",)]) == "<2 parameter sets>"
+    assert redact_parameters(()) == "()"
@@ -0,0 +1,47 @@
+"""Tests for the revocation list and its Bloom filter front."""
+
+import time
+
+import pytest
+
+from app.services.revocation_service import TokenRevocations
+from app.utils.bloom import BloomFilter
+from app.utils.redis_client import RedisCache
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test every added item is found and the false-positive rate stays near target."""
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"jti:{i}")
+
+    assert all(f"jti:{i}" in bloom for i in range(5000))
+    false_positives = sum(f"other:{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.asyncio
+async def test_unrevoked_tokens_skip_the_store():
+    """Test a Bloom filter miss is decided without reading the store."""
+    revocations = TokenRevocations(RedisCache("redis://unused"), capacity=100, error_rate=0.01)
+
+    async def fail(items):
+        raise AssertionError("store read on a filter miss")
+
+    revocations._lookup = fail
+    assert not await revocations.is_revoked({"jti": "a", "sub": "1", "iat": time.time()})
+
+
+@pytest.mark.asyncio
+async def test_revocation_by_jti_and_user():
+    """Test jti revocations match exactly and user revocations use the issue time."""
+    revocations = TokenRevocations(RedisCache("redis://unused"), capacity=100, error_rate=0.01)
+    issued = time.time()
+    await revocations.revoke_token("a", expires_at=time.time() + 60)
+    await revocations.revoke_token("expired", expires_at=time.time() - 1)
+    await revocations.revoke_user(7)
+
+    assert await revocations.is_revoked({"jti": "a", "sub": "1", "iat": issued})
+    assert not await revocations.is_revoked({"jti": "expired", "sub": "1", "iat": issued})
+    assert await revocations.is_revoked({"jti": "b", "sub": "7", "iat": issued})
+    assert not await revocations.is_revoked({"jti": "c", "sub": "7", "iat": time.time()})
@@ -0,0 +1,93 @@
+"""Tests for application start-up and warm-up."""
+
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.main as main
+from app.database import Base
+from app.services import warmup_service
+from app.services.warmup_service import warm_connection_pool, warm_up
+
+
+@pytest.fixture
+async def file_engine(tmp_path):
+    """A file-backed SQLite engine, which (unlike :memory:) has a real connection pool."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'warmup.db'}", pool_size=3)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_connection_pool_fills_pool(file_engine):
+    """Test warm-up leaves the pool holding primed, idle connections."""
+    warmed = await warm_connection_pool(file_engine, connections=10)
+
+    assert warmed == 3
+    assert file_engine.pool.checkedin() == 3
+    assert file_engine.pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_up_survives_database_errors(caplog):
+    """Test an unreachable database is logged and start-up carries on."""
+    engine = create_async_engine("sqlite+aiosqlite:////nonexistent/dir/warmup.db")
+
+    timings = await warm_up(engine, connections=2)
+
+    assert "database_ms" not in timings
+    assert "security_ms" in timings
+    assert "Database warm-up failed" in caplog.text
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_survives_security_errors(file_engine, caplog, monkeypatch):
+    """Test a crypto backend failing to load is logged and start-up carries on."""
+
+    def broken_backend():
+        raise RuntimeError("argon2 backend unavailable")
+
+    monkeypatch.setattr(warmup_service, "prime_security", broken_backend)
+
+    timings = await warm_up(file_engine, connections=1)
+
+    assert "database_ms" in timings
+    assert "security_ms" not in timings
+    assert "Security warm-up failed: argon2 backend unavailable" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_up_before_serving(monkeypatch):
+    """Test the lifespan handler runs warm-up before yielding to the server."""
+    calls = []
+
+    async def fake_warm_up(engine, connections):
+        calls.append(connections)
+        return {}
+
+    monkeypatch.setattr(main, "warm_up", fake_warm_up)
+    monkeypatch.setattr(main.settings, "WARMUP_DB_CONNECTIONS", 4)
+
+    async with main.lifespan(main.app):
+        assert calls == [4]
+
+
+def test_api_import_skips_heavy_dependencies():
+    """Test importing the API does not pull in Celery or numpy."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, app.main; print(sorted({'celery', 'numpy'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
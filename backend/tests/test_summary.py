@@ -0,0 +1,126 @@
+"""Tests for the wire summary rollup."""
+
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User, Wire, WireStatus, WireSummary
+from app.services import summary_service
+from app.services.summary_service import reconcile_wire_summaries, record_wire_created
+
+
+async def _create_wire(client: AsyncClient, headers: dict, amount: str, currency: str = "USD"):
+    response = await client.post(
+        "/api/wires",
+        json={
+            "sender_name": "Alice Johnson",
+            "recipient_name": "Bob Williams",
+            "amount": amount,
+            "currency": currency,
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+async def _summary(client: AsyncClient, headers: dict) -> dict:
+    response = await client.get("/api/wires/summary", headers=headers)
+    assert response.status_code == 200
+    return {
+        (item["status"], item["currency"]): (item["wire_count"], Decimal(item["total_amount"]))
+        for item in response.json()["items"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_summary_tracks_create(client: AsyncClient, auth_headers: dict):
+    """Test creating wires adds to the rollup."""
+    await _create_wire(client, auth_headers, "100.00")
+    await _create_wire(client, auth_headers, "50.25")
+    await _create_wire(client, auth_headers, "10.00", currency="EUR")
+
+    summary = await _summary(client, auth_headers)
+
+    assert summary == {
+        ("pending", "USD"): (2, Decimal("150.25")),
+        ("pending", "EUR"): (1, Decimal("10.00")),
+    }
+
+
+@pytest.mark.asyncio
+async def test_summary_tracks_update_and_delete(client: AsyncClient, auth_headers: dict):
+    """Test updates move wires between buckets and deletes remove them."""
+    first = await _create_wire(client, auth_headers, "100.00")
+    second = await _create_wire(client, auth_headers, "40.00")
+
+    await client.put(
+        f"/api/wires/{first['id']}",
+        json={"status": "completed", "amount": "120.00"},
+        headers=auth_headers,
+    )
+    await client.delete(f"/api/wires/{second['id']}", headers=auth_headers)
+
+    summary = await _summary(client, auth_headers)
+
+    assert summary == {("completed", "USD"): (1, Decimal("120.00"))}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_drift(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession
+):
+    """Test reconciliation rebuilds the rollup from the wires table."""
+    await _create_wire(client, auth_headers, "100.00")
+    await _create_wire(client, auth_headers, "5.00", currency="GBP")
+    expected = await _summary(client, auth_headers)
+
+    assert await reconcile_wire_summaries(db_session) == 0
+
+    await db_session.execute(delete(WireSummary))
+    assert await reconcile_wire_summaries(db_session) == 2
+    await db_session.commit()
+
+    assert await _summary(client, auth_headers) == expected
+
+
+@pytest.mark.asyncio
+async def test_reconcile_keeps_concurrent_deltas(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_user: User,
+    monkeypatch,
+):
+    """Test a wire created between reconciliation's read and write still counts."""
+    await _create_wire(client, auth_headers, "100.00")
+    await db_session.execute(delete(WireSummary))
+    await db_session.commit()
+    read_snapshot = summary_service._read_truth_and_rollup
+
+    async def create_during_reconcile(executor):
+        snapshot = await read_snapshot(executor)
+        wire = Wire(
+            sender_name="Alice Johnson",
+            recipient_name="Bob Williams",
+            amount_minor=2500,
+            currency="USD",
+            status=WireStatus.PENDING,
+            reference_number="WIRE-RACE0001",
+            created_by=test_user.id,
+        )
+        db_session.add(wire)
+        await db_session.flush()
+        await record_wire_created(db_session, wire)
+        return snapshot
+
+    monkeypatch.setattr(summary_service, "_read_truth_and_rollup", create_during_reconcile)
+    assert await reconcile_wire_summaries(db_session) == 1
+    await db_session.commit()
+    monkeypatch.undo()
+
+    assert await reconcile_wire_summaries(db_session) == 0
+    assert await _summary(client, auth_headers) == {("pending", "USD"): (2, Decimal("125.00"))}
@@ -0,0 +1,91 @@
+"""Tests for the stuck-wire sweeper."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User, Wire, WireStatus
+from app.services.summary_service import reconcile_wire_summaries
+from app.services.sweeper_service import sweep_stuck_wires
+
+
+@pytest.fixture
+async def processing_wires(db_session: AsyncSession, test_user: User) -> list[Wire]:
+    """Create PROCESSING wires of various ages, plus an old PENDING one."""
+    now = datetime.now(UTC)
+    # (status, created hours ago, last updated minutes ago)
+    specs = [
+        (WireStatus.PROCESSING, 2, 60),  # stuck, young enough to retry
+        (WireStatus.PROCESSING, 3, 90),  # stuck, young enough to retry
+        (WireStatus.PROCESSING, 48, 120),  # stuck for good
+        (WireStatus.PROCESSING, 1, 5),  # still within its grace period
+        (WireStatus.PENDING, 48, 120),  # not processing at all
+    ]
+    wires = [
+        Wire(
+            sender_name="Sender",
+            recipient_name="Recipient",
+            amount_minor=1000,
+            currency="USD",
+            status=wire_status,
+            reference_number=f"WIRE-STUCK{i:03d}",
+            created_by=test_user.id,
+            created_at=now - timedelta(hours=created),
+            updated_at=now - timedelta(minutes=updated),
+        )
+        for i, (wire_status, created, updated) in enumerate(specs)
+    ]
+    db_session.add_all(wires)
+    await db_session.commit()
+    await reconcile_wire_summaries(db_session)
+    await db_session.commit()
+    return wires
+
+
+@pytest.mark.asyncio
+async def test_sweep_requeues_or_fails_stuck_wires(
+    db_session: AsyncSession, processing_wires: list[Wire]
+):
+    """Test stuck wires are re-queued, or failed once too old, in batches."""
+    queued = []
+    counts = await sweep_stuck_wires(
+        db_session,
+        stuck_after=timedelta(minutes=15),
+        fail_after=timedelta(hours=24),
+        enqueue=queued.append,
+        batch_size=2,
+    )
+
+    assert counts == {"requeued": 2, "failed": 1}
+    assert sorted(queued) == [processing_wires[0].id, processing_wires[1].id]
+    result = await db_session.execute(select(Wire.status).order_by(Wire.id))
+    assert list(result.scalars()) == [
+        WireStatus.PROCESSING,
+        WireStatus.PROCESSING,
+        WireStatus.FAILED,
+        WireStatus.PROCESSING,
+        WireStatus.PENDING,
+    ]
+    assert await reconcile_wire_summaries(db_session) == 0
+
+    # Re-queued wires get a fresh grace period
+    again = await sweep_stuck_wires(
+        db_session, timedelta(minutes=15), timedelta(hours=24), queued.append
+    )
+    assert again == {"requeued": 0, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_sweep_query_uses_partial_index(db_session: AsyncSession):
+    """Test the sweep reads the PROCESSING-only index instead of scanning wires."""
+    result = await db_session.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT id FROM wires "
+            "WHERE status = 'PROCESSING' AND updated_at < '2026-01-01' ORDER BY updated_at"
+        )
+    )
+    plan = " | ".join(row[-1] for row in result)
+
+    assert "ix_wires_processing_updated_at" in plan, plan
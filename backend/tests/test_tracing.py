@@ -0,0 +1,136 @@
+"""Tests for request and job tracing."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from celery.app.task import Context
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+
+from app.database import get_db
+from app.main import app
+from app.middleware.tracing import TracingMiddleware
+from app.services.background_tasks import (
+    _end_publish_span,
+    _record_task_duration,
+    _record_task_start,
+    _trace_publish,
+)
+from app.utils import tracing
+from app.utils.tracing import FileExporter, tracer
+from tests.conftest import engine
+
+CALLER_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+CALLER_SPAN_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    """Sample every trace into a file, with SQL statements instrumented."""
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(tracer, "exporter", FileExporter(str(path), "test"))
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    tracing.instrument_tracing(engine.sync_engine)
+    yield path
+    tracer.stop()
+    for name, listener in [
+        ("before_cursor_execute", tracing._before_cursor_execute),
+        ("after_cursor_execute", tracing._after_cursor_execute),
+        ("handle_error", tracing._handle_error),
+    ]:
+        event.remove(engine.sync_engine, name, listener)
+
+
+@pytest.fixture
+async def traced_client(override_get_db, trace_file):
+    """Test client with the tracing middleware in front of the app."""
+    app.dependency_overrides[get_db] = override_get_db
+    transport = ASGITransport(app=TracingMiddleware(app))
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.dependency_overrides.clear()
+
+
+def exported_spans(path) -> list[dict]:
+    tracer.flush()
+    if not path.exists():
+        return []
+    return [
+        span
+        for line in path.read_text().splitlines()
+        for resource in json.loads(line)["resourceSpans"]
+        for scope in resource["scopeSpans"]
+        for span in scope["spans"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sampled_request_records_spans(
+    traced_client: AsyncClient, trace_file, auth_headers: dict, test_wire
+):
+    """Test a request continues the caller's trace with auth, SQL and response spans."""
+    response = await traced_client.get(
+        "/api/wires",
+        headers={**auth_headers, "traceparent": f"00-{CALLER_TRACE_ID}-{CALLER_SPAN_ID}-01"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Trace-Id"] == CALLER_TRACE_ID
+    spans = exported_spans(trace_file)
+    assert {span["traceId"] for span in spans} == {CALLER_TRACE_ID}
+    by_name = {span["name"]: span for span in spans}
+    root = by_name["GET /api/wires"]
+    assert root["parentSpanId"] == CALLER_SPAN_ID
+    assert root["kind"] == 2
+    user = by_name["auth.get_current_user"]
+    assert user["parentSpanId"] == root["spanId"]
+    queries = [span for span in spans if span["name"] == "db SELECT"]
+    assert user["spanId"] in {span["parentSpanId"] for span in queries}
+    assert any(
+        "count(" in attribute["value"]["stringValue"]
+        for span in queries
+        for attribute in span["attributes"]
+        if attribute["key"] == "db.statement"
+    )
+    assert by_name["http.response"]["parentSpanId"] == root["spanId"]
+
+
+@pytest.mark.asyncio
+async def test_unsampled_requests_record_nothing(
+    traced_client: AsyncClient, trace_file, auth_headers: dict, monkeypatch
+):
+    """Test the caller's not-sampled flag and a zero sample rate both skip tracing."""
+    response = await traced_client.get(
+        "/api/wires",
+        headers={**auth_headers, "traceparent": f"00-{CALLER_TRACE_ID}-{CALLER_SPAN_ID}-00"},
+    )
+    assert "X-Trace-Id" not in response.headers
+
+    monkeypatch.setattr(tracer, "sample_rate", 0.0)
+    response = await traced_client.get("/api/wires", headers=auth_headers)
+    assert "X-Trace-Id" not in response.headers
+
+    assert exported_spans(trace_file) == []
+
+
+def test_celery_tasks_continue_the_publisher_trace(trace_file):
+    """Test the publish span travels in the task headers and parents the task span."""
+    headers = {"id": "task-1"}
+    with tracer.trace("POST /api/wires") as root:
+        _trace_publish(sender="process_wire_async", headers=headers)
+        _end_publish_span(headers=headers)
+        assert tracing.current_span() is root
+
+    # What the worker sees: message headers become attributes of task.request
+    task = SimpleNamespace(name="process_wire_async", request=Context(headers))
+    _record_task_start(task_id="task-1", task=task)
+    _record_task_duration(task_id="task-1", task=task, state="SUCCESS")
+
+    by_name = {span["name"]: span for span in exported_spans(trace_file)}
+    publish = by_name["celery.publish process_wire_async"]
+    executed = by_name["celery.task process_wire_async"]
+    assert publish["parentSpanId"] == root.span_id
+    assert executed["parentSpanId"] == publish["spanId"]
+    assert executed["traceId"] == root.trace_id
+    assert executed["status"] == {"code": 1}
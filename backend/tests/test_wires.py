@@ -2,7 +2,10 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models import Wire
 
 
@@ -169,3 +172,163 @@ async def test_delete_nonexistent_wire(client: AsyncClient, auth_headers: dict):
     )
 
     assert response.status_code == 404
+
+
+@pytest.fixture
+async def filter_wires(client: AsyncClient, auth_headers: dict) -> list[dict]:
+    """Create a spread of wires for filter tests."""
+    payloads = [
+        {"sender_name": "Alice Johnson", "recipient_name": "Bob Williams", "amount": "50.00"},
+        {"sender_name": "Carol King", "recipient_name": "Dave Smithson", "amount": "750.00"},
+        {
+            "sender_name": "Erin Moss",
+            "recipient_name": "Frank Ode",
+            "amount": "5000.00",
+            "currency": "EUR",
+        },
+    ]
+    wires = []
+    for payload in payloads:
+        response = await client.post("/api/wires", json=payload, headers=auth_headers)
+        assert response.status_code == 201
+        wires.append(response.json())
+    return wires
+
+
+@pytest.mark.asyncio
+async def test_list_wires_filter_by_amount_range(
+    client: AsyncClient, auth_headers: dict, filter_wires: list[dict]
+):
+    """Test filtering wires by amount range."""
+    response = await client.get(
+        "/api/wires?min_amount=100&max_amount=1000",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["wires"][0]["recipient_name"] == "Dave Smithson"
+
+
+@pytest.mark.asyncio
+async def test_list_wires_filter_by_currency(
+    client: AsyncClient, auth_headers: dict, filter_wires: list[dict]
+):
+    """Test filtering wires by currency."""
+    response = await client.get("/api/wires?currency=EUR", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["wires"][0]["currency"] == "EUR"
+
+
+@pytest.mark.asyncio
+async def test_list_wires_search_names(
+    client: AsyncClient, auth_headers: dict, filter_wires: list[dict]
+):
+    """Test case-insensitive substring search on sender and recipient names."""
+    response = await client.get("/api/wires?search=SMITH", headers=auth_headers)
+    assert response.json()["total"] == 1
+
+    response = await client.get("/api/wires?search=o", headers=auth_headers)
+    assert response.json()["total"] == 3
+
+    response = await client.get("/api/wires?search=carol", headers=auth_headers)
+    assert response.json()["wires"][0]["sender_name"] == "Carol King"
+
+
+@pytest.mark.asyncio
+async def test_list_wires_search_after_update(
+    client: AsyncClient, auth_headers: dict, test_wire: Wire
+):
+    """Test name search reflects updated names."""
+    await client.put(
+        f"/api/wires/{test_wire.id}",
+        json={"recipient_name": "Zed Quinn"},
+        headers=auth_headers,
+    )
+
+    response = await client.get("/api/wires?search=quinn", headers=auth_headers)
+    assert response.json()["total"] == 1
+
+    response = await client.get("/api/wires?search=smith", headers=auth_headers)
+    assert response.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_wires_filter_by_reference_prefix(
+    client: AsyncClient, auth_headers: dict, test_wire: Wire
+):
+    """Test reference number prefix lookup."""
+    response = await client.get("/api/wires?reference=wire-test", headers=auth_headers)
+    assert response.json()["total"] == 1
+
+    response = await client.get("/api/wires?reference=WIRE-X", headers=auth_headers)
+    assert response.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_wires_filter_by_created_range(
+    client: AsyncClient, auth_headers: dict, test_wire: Wire
+):
+    """Test filtering wires by creation date range."""
+    response = await client.get(
+        "/api/wires?created_from=2000-01-01T00:00:00&created_to=2999-01-01T00:00:00",
+        headers=auth_headers,
+    )
+    assert response.json()["total"] == 1
+
+    response = await client.get(
+        "/api/wires?created_from=2999-01-01T00:00:00",
+        headers=auth_headers,
+    )
+    assert response.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_wires_invalid_filters(client: AsyncClient, auth_headers: dict):
+    """Test invalid filter values are rejected rather than ignored."""
+    response = await client.get("/api/wires?status=bogus", headers=auth_headers)
+    assert response.status_code == 422
+
+    response = await client.get(
+        "/api/wires?min_amount=100&max_amount=10",
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_wires_advanced_filters_disabled(
+    client: AsyncClient, auth_headers: dict, monkeypatch
+):
+    """Test advanced filters are rejected when the feature flag is off."""
+    monkeypatch.setattr(settings, "FEATURE_ADVANCED_FILTERS", False)
+
+    response = await client.get("/api/wires?currency=USD", headers=auth_headers)
+    assert response.status_code == 400
+
+    response = await client.get("/api/wires?status=pending", headers=auth_headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "where",
+    [
+        "created_by = 1 AND amount_minor BETWEEN 100 AND 1000",
+        "created_by = 1 AND currency = 'EUR'",
+        "created_by = 1 AND status = 'PENDING'",
+        "created_by = 1 AND created_at >= '2024-01-01'",
+        "reference_number GLOB 'WIRE-A*'",
+        "id IN (SELECT rowid FROM wires_fts WHERE wires_fts MATCH '\"smith\"')",
+    ],
+)
+async def test_filters_use_indexes(db_session: AsyncSession, where: str):
+    """Test each filter is planned as an index lookup rather than a table scan."""
+    result = await db_session.execute(text(f"EXPLAIN QUERY PLAN SELECT * FROM wires WHERE {where}"))
+    plan = " | ".join(row[-1] for row in result)
+
+    assert "SCAN wires" not in plan.replace("SCAN wires_fts", ""), plan